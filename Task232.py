@@ -10,6 +10,8 @@ import numpy as np
 from xlsx2html import xlsx2html
 from jinja2 import Environment, FileSystemLoader
 import pdfkit
+from statistic import StatisticAccumulator
+from vacancy import parse_published_at
 
 
 class Report:
@@ -124,7 +126,8 @@ class Report:
         out2.seek(0)
         code2 = out2.read()
 
-        pdf_template = template.render({'name_vacancy': name_vac, 'table1': code1, 'table2': code2})
+        pdf_template = template.render({'name_vacancy': name_vac, 'table1': code1, 'table2': code2,
+                                        'graph': os.path.abspath('graph.png')})
 
         config = pdfkit.configuration(wkhtmltopdf=r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe')
         pdfkit.from_string(pdf_template, 'report.pdf', configuration=config, options={"enable-local-file-access": ""})
@@ -209,7 +212,13 @@ class Vacancy:
         salary (Salary): Информация о зарплате
         area_name (str): Название города
         published_at (str): Дата публикации вакансии
+        published_ts (int): Время публикации в секундах от начала эпохи
+        year (int): Год публикации
+        month (int): Месяц публикации
+        day (int): День публикации
     """
+    __slots__ = ('name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name', 'salary',
+                 'area_name', 'published_at', 'published_ts', 'year', 'month', 'day')
 
     def __init__(self, dict_vac: Dict[str, str]):
         """
@@ -228,6 +237,7 @@ class Vacancy:
         self.salary = Salary(dict_vac['salary_from'], dict_vac['salary_to'], salary_gross, dict_vac['salary_currency'])
         self.area_name = dict_vac['area_name']
         self.published_at = dict_vac['published_at']
+        self.published_ts, self.year, self.month, self.day = parse_published_at(self.published_at)
 
 
 class Salary:
@@ -235,26 +245,31 @@ class Salary:
     Класс для представления зарплаты.
 
     Attributes:
-        salary_from (str): Нижняя граница зарплаты
-        salary_to (str): Верхняя граница зарплаты
+        salary_from (float): Нижняя граница зарплаты
+        salary_to (float): Верхняя граница зарплаты
         salary_gross (str): Наличие налогов
         salary_currency (str): Валюта оклада
+        salary_rub (float): Средняя зарплата в рублях (None, если курс валюты неизвестен)
 
     """
+    __slots__ = ('salary_from', 'salary_to', 'salary_gross', 'salary_currency', 'salary_rub')
 
     def __init__(self, salary_from, salary_to, salary_gross, salary_currency):
         """
-        Инициализирует объект Salary
+        Инициализирует объект Salary. Границы зарплаты переводятся в числа один раз, при создании объекта.
+
         Args:
-            salary_from (str): Нижняя граница зарплаты
-            salary_to (str): Верхняя граница зарплаты
+            salary_from (str or float): Нижняя граница зарплаты
+            salary_to (str or float): Верхняя граница зарплаты
             salary_gross (str): Наличие налогов
             salary_currency (str): Валюта оклада
         """
-        self.salary_from = salary_from
-        self.salary_to = salary_to
+        self.salary_from = float(salary_from)
+        self.salary_to = float(salary_to)
         self.salary_gross = salary_gross
         self.salary_currency = salary_currency
+        self.salary_rub = None if salary_currency not in currency_to_rub else \
+            self.to_RUB(self.salary_from + self.salary_to) / 2
 
     def to_RUB(self, salary: float) -> float:
         """
@@ -665,29 +680,16 @@ if __name__ == '__main__':
         exit_from_file('Нет данных')
     if type_output == 'Статистика':
         vacancy_name = input('Введите название профессии: ')
-        for vac in data.vacancies_objects:
-            vac.published_at = get_year(vac.published_at)
-        dict_cities = {}
-        for vac in data.vacancies_objects:
-            if vac.area_name not in dict_cities.keys():
-                dict_cities[vac.area_name] = 0
-            dict_cities[vac.area_name] += 1
-        needed_vacancies_objects = list(
-            filter(lambda vac: int(len(data.vacancies_objects) * 0.01) <= dict_cities[vac.area_name],
-                   data.vacancies_objects))
         rp = Report()
-        list_statistic = [print_statistic(get_salary_level(data.vacancies_objects, 'published_at').items(), 0,
-                    'Динамика уровня зарплат по годам: '),
-                        print_statistic(get_salary_level(data.vacancies_objects, 'published_at', vacancy_name).items(), 0,
-                    'Динамика уровня зарплат по годам для выбранной профессии: '),
-                        print_statistic(get_count_vacancies(data.vacancies_objects, "published_at", data).items(), 0,
-                    'Динамика количества вакансий по годам: '),
-                        print_statistic(get_count_vacancies(data.vacancies_objects, 'published_at', data, vacancy_name).items(), 0,
-                    'Динамика количества вакансий по годам для выбранной профессии: '),
-                        print_statistic(get_salary_level(needed_vacancies_objects, 'area_name').items(), 1,
-                    'Уровень зарплат по городам (в порядке убывания): ', True, 10),
-                        print_statistic(get_count_vacancies(needed_vacancies_objects, 'area_name', data).items(), 1,
-                    'Доля вакансий по городам (в порядке убывания): ', True, 10)]
+        list_statistic = StatisticAccumulator(vacancy_name).update_all(data.vacancies_objects).get_statistics()
+        messages = ['Динамика уровня зарплат по годам: ',
+                    'Динамика уровня зарплат по годам для выбранной профессии: ',
+                    'Динамика количества вакансий по годам: ',
+                    'Динамика количества вакансий по годам для выбранной профессии: ',
+                    'Уровень зарплат по городам (в порядке убывания): ',
+                    'Доля вакансий по городам (в порядке убывания): ']
+        for message, statistic in zip(messages, list_statistic):
+            print(message + str(statistic))
         rp.generate_excel(vacancy_name, list_statistic)
         rp.generate_image(vacancy_name, list_statistic)
         rp.generate_pdf(vacancy_name)
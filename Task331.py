@@ -1,30 +1,20 @@
+import sys
 import pandas as pd
+from cbr_rates import cbr_url, RateClient, RateStore, get_months, update_rates
+from currency_converter import converted_currencies
 
 file = 'vacancies_dif_currencies.csv'
-df = pd.read_csv(file)
-currencies = df['salary_currency'].unique()
-needed_currencies = []
-for cur in currencies:
-    if list(df['salary_currency']).count(cur) > 5000:
-        needed_currencies.append(cur)
-del needed_currencies[0]
-df.sort_values(by='published_at', inplace=True)
-first_date = list(df['published_at'])[0]
-second_date = list(df['published_at'])[-1]
+base_url = sys.argv[sys.argv.index('--base-url') + 1] if '--base-url' in sys.argv else cbr_url
+df = pd.read_csv(file, usecols=['salary_currency', 'published_at'])
+counts = df['salary_currency'].value_counts()
+needed_currencies = [cur for cur in df['salary_currency'].dropna().unique() if counts[cur] > 5000 and cur != 'RUR']
+first_date = df['published_at'].min()
+second_date = df['published_at'].max()
 print(needed_currencies, first_date, second_date)
-data_currencies = pd.DataFrame(columns=['date', 'BYR', 'USD', 'EUR', 'KZT', 'UAH'])
-for year in range(2003, 2023):
-    for month in range(1, 13):
-        date = f'01/0{month}/{year}' if month < 10 else f'01/{month}/{year}'
-        new_row = {'date': date}
-        res = f'http://www.cbr.ru/scripts/XML_daily.asp?date_req={date}'
-        values_cur = pd.read_xml(res, encoding='cp1251')
-        for cur in needed_currencies:
-            if len(values_cur[values_cur['CharCode'] == cur]['Value'].values) != 0:
-                value = '.'.join(str(values_cur[values_cur['CharCode'] == cur]['Value'].values[0]).split(','))
-                new_row[cur] = float(value) / int(values_cur[values_cur['CharCode'] == cur]['Nominal'].values[0])
-        data_currencies = pd.concat([data_currencies, pd.DataFrame.from_records([new_row])], axis=0, ignore_index=True)
-        if date == '01/07/2022':
-            break
+months = get_months(first_date, second_date)
+store = RateStore()
+update_rates(store, RateClient(base_url), months)
+data_currencies = store.load_rates(months, needed_currencies, converted_currencies)
+store.close()
 data_currencies.to_csv('data_currencies.csv', index=False)
-print(data_currencies)
+print(data_currencies)
\ No newline at end of file
@@ -1,36 +1,11 @@
+import sys
 import pandas as pd
-import sqlite3
+from storage import connect
+from sql_analytics import get_statistics
 
-conn = sqlite3.connect('project_vacancy.db')
+conn = connect('project_vacancy.db')
 vacancy = input('Введите название вакансии: ')
-df1 = pd.read_sql("""select strftime('%Y',published_at) as date, round(avg(salary)) as avg_salary 
-                        from vacancies 
-                        group by strftime('%Y',published_at)""", conn)
-df2 = pd.read_sql("""select strftime('%Y',published_at) as date, count(salary) as count 
-                        from vacancies 
-                        group by strftime('%Y',published_at)""", conn)
-df3 = pd.read_sql(f"""select strftime('%Y',published_at) as date, round(avg(salary)) as avg_salary 
-                        from vacancies
-                        where name like '%{vacancy}%' 
-                        group by strftime('%Y',published_at)""", conn)
-df4 = pd.read_sql(f"""select strftime('%Y',published_at) as date, count(salary) as count 
-                        from vacancies
-                        where name like '%{vacancy}%' 
-                        group by strftime('%Y',published_at)""", conn)
-df5 = pd.read_sql("""select area_name, avg from
-                        (select area_name, round(avg(salary)) as avg, count(salary) as count
-                        from vacancies
-                        group by area_name
-                        order by avg desc)
-                    where count > (select count(*) from vacancies) * 0.01
-                    limit 10""", conn)
-df6 = pd.read_sql("""select area_name,
-                        round(cast(count as real) / (select count(*) from vacancies), 4) as percent from
-                        (select area_name, count(salary) as count
-                        from vacancies
-                        group by area_name
-                        order by count desc)
-                        limit 10""", conn)
+df1, df2, df3, df4, df5, df6 = get_statistics(conn, vacancy, use_rollup='--rollup' in sys.argv)
 pd.set_option('expand_frame_repr', False)
 print('Динамика уровня зарплат по годам \n', df1)
 print('Динамика количества вакансий по годам \n', df2)
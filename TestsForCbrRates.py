@@ -0,0 +1,50 @@
+import os, tempfile, threading, unittest
+from cbr_fixture_server import FixtureServer
+from cbr_rates import RateClient, RateStore, get_months, update_rates
+
+
+class RateIngestionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.server = FixtureServer(('127.0.0.1', 0), fail_every=3)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = RateClient(f'http://127.0.0.1:{self.server.server_address[1]}/scripts/XML_daily.asp',
+                                 backoff=0)
+        self.store = RateStore(os.path.join(self.directory.name, 'rates.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def test_update_rates(self):
+        months = get_months('2003-01', '2004-06')
+        self.assertEqual(update_rates(self.store, self.client, months, max_workers=4), 18)
+        df = self.store.load_rates(months, ['USD', 'KZT'])
+        self.assertEqual(list(df.columns), ['date', 'USD', 'KZT'])
+        self.assertEqual(df['date'].tolist()[:2], ['01/01/2003', '01/02/2003'])
+        self.assertAlmostEqual(df['USD'][0], 31.78)
+        self.assertAlmostEqual(df['KZT'][0], 0.204)
+
+    def test_load_rates_columns(self):
+        months = get_months('2003-01', '2003-03')
+        update_rates(self.store, self.client, months)
+        df = self.store.load_rates(months, ['USD'], ['BYR', 'USD', 'EUR'])
+        self.assertEqual(list(df.columns), ['date', 'BYR', 'USD', 'EUR'])
+        self.assertAlmostEqual(df['USD'][0], 31.78)
+        self.assertTrue(df['BYR'].isna().all() and df['EUR'].isna().all())
+        df = self.store.load_rates(months, [], ['USD'])
+        self.assertEqual(list(df.columns), ['date', 'USD'])
+        self.assertEqual(len(df), 3)
+        self.assertTrue(df['USD'].isna().all())
+
+    def test_only_missing_months(self):
+        update_rates(self.store, self.client, get_months('2003-01', '2003-06'))
+        count = self.server.request_count
+        self.assertEqual(update_rates(self.store, self.client, get_months('2003-01', '2003-12')), 6)
+        self.assertLess(self.server.request_count - count, 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
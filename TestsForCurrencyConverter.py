@@ -0,0 +1,30 @@
+import math, unittest
+import pandas as pd
+from currency_converter import get_rate_table, convert_salaries
+
+
+class ConvertSalariesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rate_table = get_rate_table(pd.DataFrame({'date': ['01/01/2022', '01/02/2022'], 'BYR': [30.0, None],
+                                                       'USD': [75.0, 80.0], 'EUR': [85.0, 90.0],
+                                                       'KZT': [0.17, 0.18], 'UAH': [2.7, 2.8]}))
+
+    def test_convert_salaries(self):
+        df = pd.DataFrame({'salary_from': [100.0, None, 100.0, 100.0, 100.0, 100.0],
+                           'salary_to': [300.0, 300.0, None, 300.0, 300.0, 300.0],
+                           'salary_currency': ['USD', 'RUR', 'EUR', 'BYR', 'GEL', None],
+                           'published_at': ['2022-02-05T18:19:30+0300', '2021-07-06T02:05:26+0300',
+                                            '2022-01-06T02:05:26+0300', '2022-02-06T02:05:26+0300',
+                                            '2022-01-06T02:05:26+0300', '2022-01-06T02:05:26+0300']})
+        salary = convert_salaries(df, self.rate_table).tolist()
+        self.assertEqual(salary[:3], [16000.0, 300.0, 8500.0])
+        self.assertTrue(all(math.isnan(value) for value in salary[3:]))
+
+    def test_month_without_rates(self):
+        df = pd.DataFrame({'salary_from': [100.0], 'salary_to': [300.0], 'salary_currency': ['USD'],
+                           'published_at': ['2023-01-05T18:19:30+0300']})
+        self.assertTrue(math.isnan(convert_salaries(df, self.rate_table)[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
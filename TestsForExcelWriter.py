@@ -0,0 +1,62 @@
+import os, tempfile, unittest
+from openpyxl import load_workbook
+from excel_writer import create_workbook, write_table, stream_table
+from main import Vacancy, get_option
+from vacancy import InputConnect
+
+
+def make_vacancy(name, salary_from, area_name):
+    return Vacancy({'name': name, 'description': 'Описание\x01', 'key_skills': 'Python\nSQL',
+                    'experience_id': 'noExperience', 'premium': 'False', 'employer_name': 'Компания',
+                    'salary_from': salary_from, 'salary_to': '150000', 'salary_gross': 'True', 'salary_currency': 'RUR',
+                    'area_name': area_name, 'published_at': '2022-07-05T18:19:30+0300'})
+
+
+class ExcelWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'test.xlsx')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_tables(self):
+        wb = create_workbook()
+        write_table(wb, 'Сводка', [['Город', '  ', 'Доля'], ['Москва', '  ', 0.5]], percent_column=2)
+        self.assertEqual(stream_table(wb, 'Строки', ([i, f'строка {i}'] for i in range(3000))), 2999)
+        wb.save(self.file_name)
+        wb = load_workbook(self.file_name)
+        self.assertEqual(wb['Сводка']['C2'].number_format, '0.00%')
+        self.assertTrue(wb['Сводка']['A1'].font.bold)
+        self.assertIsNone(wb['Сводка']['B2'].border.left.style)
+        self.assertEqual(wb['Сводка'].column_dimensions['A'].width, 7)
+        self.assertEqual(wb['Строки'].max_row, 3000)
+        self.assertEqual(wb['Строки']['B3000'].value, 'строка 2999')
+
+    def test_export_vacancies(self):
+        vacancies = [make_vacancy('Программист', '100000', 'Москва'), make_vacancy('Аналитик', '50000', 'Казань'),
+                     make_vacancy('Программист Java', '120000', 'Москва')]
+        outer = InputConnect('Название региона: Москва', 'Оклад', 'Да', [], 'Название, Название региона')
+        outer.check_parameters()
+        self.assertEqual(outer.export_excel(iter(vacancies), self.file_name), 2)
+        rows = [[cell.value for cell in row] for row in load_workbook(self.file_name)['Вакансии'].iter_rows()]
+        self.assertEqual(rows, [['№', 'Название', 'Название региона'], [1, 'Программист Java', 'Москва'],
+                                [2, 'Программист', 'Москва']])
+        outer = InputConnect('', '', '', [], '')
+        outer.check_parameters()
+        outer.export_excel(vacancies, self.file_name)
+        sheet = load_workbook(self.file_name)['Вакансии']
+        self.assertEqual([sheet['C2'].value, sheet['D2'].value, sheet.max_row], ['Описание', 'Python\nSQL', 4])
+
+
+class ExportOptionTestCase(unittest.TestCase):
+    def test_get_option(self):
+        self.assertEqual(get_option('--export', ['main.py', '--export', 'out.xlsx']), 'out.xlsx')
+        self.assertIsNone(get_option('--export', ['main.py']))
+        for argv in [['main.py', '--export'], ['main.py', '--export', '--workers', '2']]:
+            with self.assertRaises(SystemExit):
+                get_option('--export', argv)
+
+
+if __name__ == '__main__':
+    unittest.main()
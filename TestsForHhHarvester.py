@@ -0,0 +1,64 @@
+import csv, os, tempfile, threading, unittest
+from unittest import mock
+from hh_harvester import Harvester, split_window
+from hh_mock_server import MockServer
+
+
+class HarvesterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, 'vacancies.csv')
+        self.server = MockServer(('127.0.0.1', 0), per_hour=1000, fail_every=7)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}/vacancies'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def get_harvester(self):
+        return Harvester(self.output, base_url=self.base_url, params={'specialization': 1}, rate=0, batch_size=1000,
+                         backoff=0)
+
+    def read_output(self):
+        with open(self.output, encoding='utf-8') as file:
+            return list(csv.reader(file))
+
+    def test_split_large_window(self):
+        count = self.get_harvester().run('2022-12-07T00:00:00', '2022-12-07T05:59:59')
+        rows = self.read_output()
+        self.assertEqual(count, 6000)
+        self.assertEqual(rows[0], ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at'])
+        self.assertEqual(len({row[5] for row in rows[1:]}), 6000)
+
+    def test_resume(self):
+        window = ('2022-12-07T00:00:00', '2022-12-07T01:59:59')
+        first, second = split_window(window)
+        harvester = self.get_harvester()
+        harvester.run(*first)
+        self.assertFalse(os.path.exists(harvester.checkpoint))
+        harvester.save_checkpoint(window, [second])
+        self.assertEqual(self.get_harvester().run(*window), 1000)
+        self.assertEqual(len(self.read_output()), 2001)
+        self.assertFalse(os.path.exists(harvester.checkpoint))
+
+    def test_rerun_truncates_output(self):
+        window = ('2022-12-07T00:00:00', '2022-12-07T01:59:59')
+        self.assertEqual(self.get_harvester().run(*window), 2000)
+        self.assertEqual(self.get_harvester().run(*window), 2000)
+        self.assertEqual(len(self.read_output()), 2001)
+
+    def test_capped_second(self):
+        def get_page(window, page):
+            return {'found': 2500, 'items': [{'name': 'Аналитик', 'salary': None, 'area': {'name': 'Москва'},
+                                              'published_at': f'{window[0]}+0300'}] * 100}
+
+        harvester = self.get_harvester()
+        with mock.patch.object(harvester, 'get_page', get_page), self.assertWarnsRegex(UserWarning, '500'):
+            count = harvester.run('2022-12-07T00:00:00', '2022-12-07T00:00:00')
+        self.assertEqual(count, 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import contextlib, io, unittest
+from main import Vacancy
+from vacancy import InputConnect, SortIndex, FilterPlan
+
+
+def make_vacancy(name, salary_from, area_name):
+    return Vacancy({'name': name, 'description': 'Описание', 'key_skills': 'Python\nSQL',
+                    'experience_id': 'noExperience', 'premium': 'False', 'employer_name': 'Компания',
+                    'salary_from': salary_from, 'salary_to': '150000', 'salary_gross': 'True', 'salary_currency': 'RUR',
+                    'area_name': area_name, 'published_at': '2022-07-05T18:19:30+0300'})
+
+
+class CountingVacancies:
+    def __init__(self, vacancies):
+        self.vacancies = vacancies
+        self.count = 0
+
+    def __iter__(self):
+        for vacancy in self.vacancies:
+            self.count += 1
+            yield vacancy
+
+
+class PrintVacanciesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [make_vacancy(f'Программист {i}', str(1000 * i), 'Москва') for i in range(1, 51)]
+
+    def print_vacancies(self, outer, list_vacancies, page_size=0):
+        outer.check_parameters()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            outer.print_vacancies(list_vacancies, page_size)
+        return output.getvalue()
+
+    def test_interval_stops_reading(self):
+        vacancies = CountingVacancies(self.vacancies)
+        output = self.print_vacancies(InputConnect('', '', '', [3, 5], 'Название, Оклад'), vacancies)
+        self.assertEqual(vacancies.count, 4)
+        self.assertIn('Программист 3 ', output)
+        self.assertNotIn('Программист 5 ', output)
+        self.assertNotIn('Компания', output)
+
+    def test_pages(self):
+        output = self.print_vacancies(InputConnect('', '', '', [], 'Название'), iter(self.vacancies), page_size=20)
+        self.assertEqual(output.count('| №  |'), 3)
+        self.assertIn('Программист 50 ', output)
+
+    def test_sort_limit(self):
+        vacancies = [make_vacancy(f'Программист {i}', str(1000 * (i % 7)), 'Москва') for i in range(1, 51)]
+        outer = InputConnect('', '', '', [], '')
+        for param in ['Оклад', 'Название', 'Навыки']:
+            for is_reverse in [False, True]:
+                expected = outer.data_sort(list(vacancies), param, is_reverse)[:12]
+                self.assertEqual(outer.data_sort(iter(vacancies), param, is_reverse, 12), expected)
+
+    def test_sorted_interval(self):
+        vacancies = CountingVacancies(self.vacancies)
+        output = self.print_vacancies(InputConnect('', 'Оклад', 'Да', [1, 3], 'Название'), vacancies)
+        self.assertEqual(vacancies.count, 50)
+        self.assertLess(output.index('Программист 50 '), output.index('Программист 49 '))
+        self.assertNotIn('Программист 48 ', output)
+
+    def test_empty_interval(self):
+        for sort_param in ['', 'Оклад']:
+            output = self.print_vacancies(InputConnect('', sort_param, 'Нет', [1, 1], 'Название'), self.vacancies)
+            self.assertNotIn('Ничего не найдено', output)
+            self.assertIn('| № | Название |', output)
+            self.assertNotIn('Программист', output)
+
+    def test_negative_interval(self):
+        for sort_param in ['', 'Оклад']:
+            output = self.print_vacancies(InputConnect('', sort_param, 'Нет', [1, 0], 'Название'), self.vacancies)
+            self.assertIn('Программист 49 ', output)
+            self.assertNotIn('Программист 50 ', output)
+
+    def test_nothing_found(self):
+        output = self.print_vacancies(InputConnect('Название региона: Тверь', '', '', [], ''), self.vacancies)
+        self.assertEqual(output, 'Ничего не найдено\n')
+
+
+class SortIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [make_vacancy(f'Программист {i % 9}', str(1000 * (i % 7)), ['Москва', 'Тверь'][i % 2])
+                          for i in range(1, 61)]
+
+    def test_order(self):
+        index = SortIndex(self.vacancies)
+        outer = InputConnect('', '', '', [], '')
+        for param in ['Оклад', 'Название', 'Навыки', 'Название региона', 'Дата публикации вакансии', 'Опыт работы']:
+            for is_reverse in [False, True]:
+                expected = outer.data_sort(list(self.vacancies), param, is_reverse)
+                self.assertEqual(list(index.iter_sorted(param, is_reverse)), expected)
+
+    def test_order_cache(self):
+        index = SortIndex(self.vacancies)
+        order = index.get_order('Оклад', True)
+        self.assertIs(index.get_order('Оклад', True), order)
+        self.assertEqual(list(index.keys), ['Оклад'])
+
+    def test_get_vacancies(self):
+        index = SortIndex(self.vacancies)
+        outer = InputConnect('Название региона: Тверь', 'Оклад', 'Да', [], '')
+        outer.check_parameters()
+        expected = InputConnect('Название региона: Тверь', 'Оклад', 'Да', [], '')
+        expected.check_parameters()
+        self.assertEqual(list(outer.get_vacancies(index)), list(expected.get_vacancies(self.vacancies)))
+
+
+class FilterPlanTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = []
+        for i in range(1, 61):
+            vacancy = make_vacancy(f'Программист {i % 5}', str(1000 * (i % 7)), ['Москва', 'Тверь', 'Пермь'][i % 3])
+            vacancy.key_skills = [['Python', 'SQL'], ['Git'], ['SQL', 'Git', 'Linux']][i % 4 % 3]
+            vacancy.experience_id = ['noExperience', 'between1And3'][i % 2]
+            self.vacancies.append(vacancy)
+
+    def get_vacancies(self, filter_param, list_vacancies, sort_param=''):
+        outer = InputConnect(filter_param, sort_param, 'Да', [], '')
+        outer.check_parameters()
+        return list(outer.get_vacancies(list_vacancies))
+
+    def test_conjunction(self):
+        filter_param = 'Название региона: Москва; Навыки: SQL; Опыт работы: Нет опыта; Оклад: 3000'
+        expected = [vacancy for vacancy in self.vacancies if vacancy.area_name == 'Москва' and
+                    'SQL' in vacancy.key_skills and vacancy.experience_id == 'noExperience' and
+                    vacancy.salary.salary_from <= 3000]
+        self.assertNotEqual(expected, [])
+        self.assertEqual(self.get_vacancies(filter_param, self.vacancies), expected)
+        self.assertEqual(self.get_vacancies(filter_param, SortIndex(self.vacancies)), expected)
+
+    def test_single_filter(self):
+        for i, vacancy in enumerate(self.vacancies):
+            vacancy.premium = ['False', 'True', 'TRUE'][i % 3]
+            vacancy.salary.salary_currency = ['RUR', 'USD'][i % 4 // 3]
+            vacancy.day = 5 + i % 2
+        cases = [('Название: Программист 3', lambda vacancy: vacancy.name == 'Программист 3'),
+                 ('Навыки: Git, Linux', lambda vacancy: 'Git' in vacancy.key_skills and 'Linux' in vacancy.key_skills),
+                 ('Опыт работы: От 1 года до 3 лет', lambda vacancy: vacancy.experience_id == 'between1And3'),
+                 ('Идентификатор валюты оклада: Доллары', lambda vacancy: vacancy.salary.salary_currency == 'USD'),
+                 ('Дата публикации вакансии: 05.07.2022', lambda vacancy: vacancy.day == 5),
+                 ('Премиум-вакансия: Да', lambda vacancy: vacancy.premium in ['True', 'TRUE']),
+                 ('Премиум-вакансия: Нет', lambda vacancy: vacancy.premium == 'False'),
+                 ('Название региона: Пермь', lambda vacancy: vacancy.area_name == 'Пермь'),
+                 ('Оклад: 4000', lambda vacancy: vacancy.salary.salary_from <= 4000)]
+        for filter_param, predicate in cases:
+            expected = [vacancy for vacancy in self.vacancies if predicate(vacancy)]
+            self.assertTrue(0 < len(expected) < len(self.vacancies), filter_param)
+            self.assertEqual(self.get_vacancies(filter_param, self.vacancies), expected, filter_param)
+            self.assertEqual(self.get_vacancies(filter_param, SortIndex(self.vacancies)), expected, filter_param)
+
+    def test_sorted(self):
+        index = SortIndex(self.vacancies)
+        expected = self.get_vacancies('Название региона: Тверь; Навыки: Git', self.vacancies, 'Оклад')
+        self.assertEqual(self.get_vacancies('Название региона: Тверь; Навыки: Git', index, 'Оклад'), expected)
+
+    def test_order(self):
+        plan = FilterPlan([['Навыки', 'Git'], ['Название', 'Программист 1'], ['Оклад', '200000']])
+        order = plan.get_order(SortIndex(self.vacancies).get_table())
+        self.assertEqual([predicate.parameter for predicate in order], ['Название', 'Оклад', 'Навыки'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+from name_index import NameIndex, matches, match_modes
+
+
+class NameIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.names = ['Программист Python', 'Аналитик', 'Python-разработчик', 'Программист', 'QA']
+        self.codes = np.array([0, 1, 2, 3, 0, 4, 3, 1])
+        self.index = NameIndex(self.names, self.codes)
+
+    def test_match_agrees_with_matches(self):
+        for query in ['', 'Программист', 'Python', 'python', 'Про', 'A', 'ист Py', 'разработчик python', 'Дизайнер']:
+            for mode in match_modes:
+                expected = [code for code, name in enumerate(self.names) if matches(query, name, mode)]
+                self.assertEqual(self.index.match(query, mode).tolist(), expected, (query, mode))
+
+    def test_rows(self):
+        self.assertEqual(self.index.rows('Программист').tolist(), [0, 3, 4, 6])
+        self.assertEqual(self.index.rows('Программист', 'exact').tolist(), [3, 6])
+        self.assertEqual(self.index.rows('Дизайнер').tolist(), [])
+        self.assertEqual(self.index.mask('python', 'token').nonzero()[0].tolist(), [0, 2, 4])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.index.match('Python', 'regex')
+
+
+if __name__ == '__main__':
+    unittest.main()
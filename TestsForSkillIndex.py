@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+from skill_index import SkillIndex
+
+
+class SkillIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.key_skills = [['Python', 'SQL'], ['Git'], ['SQL', 'Git', 'Linux', 'SQL'], 'Нет данных', [], ['SQL']]
+        self.index = SkillIndex(self.key_skills)
+
+    def test_rows_agree_with_scan(self):
+        for query in [['SQL'], ['SQL', 'Git'], ['Git', 'SQL', 'Linux'], ['Docker'], ['SQL', 'Docker'], []]:
+            expected = [row for row, skills in enumerate(self.key_skills)
+                        if all(item in ([skills] if isinstance(skills, str) else skills) for item in query)]
+            self.assertEqual(self.index.rows(query).tolist(), expected, query)
+
+    def test_get_skills(self):
+        self.assertEqual(self.index.get_skills(2), ['SQL', 'Git', 'Linux'])
+        self.assertEqual(self.index.get_skills(4), [])
+
+    def test_top(self):
+        self.assertEqual(self.index.get_top(self.index.count(), 2), {'SQL': 3, 'Git': 2})
+        self.assertEqual(self.index.get_top(self.index.count(np.array([0, 1]))), {'Python': 1, 'SQL': 1, 'Git': 1})
+        tops = self.index.get_top_by_groups(np.array([0, 0, 1, 1, 1, 1]), 2, 1)
+        self.assertEqual(tops, [{'Python': 1}, {'SQL': 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+import csv, math, os, tempfile, unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+from types import SimpleNamespace
+from main import DataSet, Vacancy
+from openpyxl import load_workbook
+from statistic import Report, StatisticAccumulator, get_salary_level, get_count_vacancies, get_html_table, \
+    get_top_skills
+from csv_splitter import split_csv
+from dataset_cache import read_csv
+from parallel_statistic import aggregate_file, get_statistics_by_years, get_statistics_by_cities
+from vacancy_table import VacancyTable
+from batch_report import get_batch_statistics
+import charts
+from matplotlib.image import imread
+
+
+def make_vacancy(name, salary_from, salary_to, currency, area_name, published_at):
+    return Vacancy({'name': name, 'salary_from': salary_from, 'salary_to': salary_to, 'salary_gross': 'True',
+                    'salary_currency': currency, 'area_name': area_name, 'published_at': published_at})
+
+
+class StatisticAccumulatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [make_vacancy('Программист Python', '100000', '200000', 'RUR', 'Москва',
+                                       '2021-07-06T02:05:26+0300'),
+                          make_vacancy('Аналитик', '1000', '3000', 'EUR', 'Москва', '2021-05-06T02:05:26+0300'),
+                          make_vacancy('Программист Java', '50000', '70000', 'RUR', 'Казань',
+                                       '2022-01-06T02:05:26+0300')]
+
+    def test_statistics_by_years(self):
+        statistic = StatisticAccumulator('Программист').update_all(self.vacancies).get_statistics()
+        self.assertEqual(statistic[0], {2021: 134900, 2022: 60000})
+        self.assertEqual(statistic[1], {2021: 150000, 2022: 60000})
+        self.assertEqual(statistic[2], {2021: 2, 2022: 1})
+        self.assertEqual(statistic[3], {2021: 1, 2022: 1})
+
+    def test_profession_by_years_semantics(self):
+        by_substring = StatisticAccumulator('Программист').update_all(self.vacancies).get_statistics()
+        self.assertEqual(by_substring[3], {2021: 1, 2022: 1})
+        in_rub = StatisticAccumulator('Аналитик').update_all(self.vacancies).get_statistics()
+        self.assertEqual(in_rub[1], {2021: 119800, 2022: 0})
+
+    def test_statistics_by_cities(self):
+        statistic = StatisticAccumulator('Программист').update_all(self.vacancies).get_statistics()
+        self.assertEqual(statistic[4], {'Москва': 134900, 'Казань': 60000})
+        self.assertEqual(statistic[5], {'Москва': 0.6667, 'Казань': 0.3333})
+
+    def test_merge(self):
+        whole = StatisticAccumulator('Аналитик').update_all(self.vacancies)
+        part = StatisticAccumulator('Аналитик').update_all(self.vacancies[:1])
+        part.merge(StatisticAccumulator('Аналитик').update_all(self.vacancies[1:]))
+        self.assertEqual(part.get_statistics(), whole.get_statistics())
+
+    def test_merge_different_vacancy(self):
+        with self.assertRaises(ValueError):
+            StatisticAccumulator('Аналитик').merge(StatisticAccumulator('Программист'))
+
+
+class NumpyBackendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [make_vacancy('Программист Python', '100000', '200000', 'RUR', 'Москва',
+                                       '2021-07-06T02:05:26+0300'),
+                          make_vacancy('Аналитик', '1000', '3000', 'EUR', 'Казань', '2021-05-06T02:05:26+0300'),
+                          make_vacancy('Программист Java', '50000', '70000', 'RUR', 'Москва',
+                                       '2022-01-06T02:05:26+0300')]
+        self.table = VacancyTable.from_vacancies(self.vacancies)
+
+    def test_salary_level(self):
+        for name in ['', 'Программист', 'Дизайнер']:
+            self.assertEqual(get_salary_level(self.table, 'area_name', name, backend='numpy'),
+                             get_salary_level(self.vacancies, 'area_name', name))
+
+    def test_count_vacancies(self):
+        data = SimpleNamespace(vacancies_objects=self.vacancies)
+        for name in ['', 'Программист', 'Дизайнер']:
+            self.assertEqual(get_count_vacancies(self.table, 'area_name', data, name, backend='numpy'),
+                             get_count_vacancies(self.vacancies, 'area_name', data, name))
+
+    def test_concat(self):
+        table = VacancyTable.concat([VacancyTable.from_vacancies(self.vacancies[:2]),
+                                     VacancyTable.from_vacancies(self.vacancies[2:])])
+        self.assertEqual(table.area_name.categories, self.table.area_name.categories)
+        self.assertEqual(table.area_name.codes.tolist(), self.table.area_name.codes.tolist())
+        self.assertEqual(table.salary_rub.tolist(), self.table.salary_rub.tolist())
+        self.assertEqual(table.published_at, self.table.published_at)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_salary_level(self.vacancies, 'area_name', backend='pandas')
+
+
+class BatchStatisticTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [make_vacancy('Программист Python', '100000', '200000', 'RUR', 'Москва',
+                                       '2021-07-06T02:05:26+0300'),
+                          make_vacancy('Аналитик', '1000', '3000', 'EUR', 'Казань', '2021-05-06T02:05:26+0300'),
+                          make_vacancy('Программист Java', '50000', '70000', 'RUR', 'Москва',
+                                       '2022-01-06T02:05:26+0300'),
+                          make_vacancy('Программист', '40000', '40000', 'RUR', 'Казань', '2022-03-06T02:05:26+0300')]
+        self.table = VacancyTable.from_vacancies(self.vacancies)
+
+    def test_same_as_accumulator(self):
+        professions = ['Программист', 'Аналитик', 'Java', 'Дизайнер', '']
+        statistics = get_batch_statistics(self.table, professions)
+        for profession in professions:
+            self.assertEqual(statistics[(profession, None)],
+                             StatisticAccumulator(profession).update_all(self.vacancies).get_statistics())
+
+    def test_areas(self):
+        statistics = get_batch_statistics(self.table, ['Программист'], ['Казань', 'Тверь'], mode='exact')
+        self.assertEqual(statistics[('Программист', None)][3], {2021: 0, 2022: 1})
+        self.assertEqual(statistics[('Программист', 'Казань')][1], {2021: 0, 2022: 40000})
+        self.assertEqual(statistics[('Программист', 'Тверь')][3], {2021: 0, 2022: 0})
+
+    def test_top_skills(self):
+        for vacancy, skills in zip(self.vacancies, [['Python', 'SQL'], ['SQL', 'Excel'], ['Java', 'SQL'], ['Git']]):
+            vacancy.key_skills = skills
+        self.assertEqual(get_top_skills(self.vacancies, limit=1), {2021: {'SQL': 2}, 2022: {'SQL': 1}})
+        self.assertEqual(get_top_skills(VacancyTable.from_vacancies(self.vacancies), 'Программист', 2, 'token'),
+                         {2021: {'Python': 1, 'SQL': 1}, 2022: {'Java': 1, 'SQL': 1}})
+
+
+class ReportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.statistic = [{2021: 134900, 2022: 60000}, {2021: 150000, 2022: 60000}, {2021: 2, 2022: 1},
+                          {2021: 1, 2022: 1}, {'Москва': 134900, 'Казань': 60000}, {'Москва': 0.6667, 'Казань': 0.3333}]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_generate(self):
+        report = Report(self.directory.name, excel_file='a.xlsx', image_file='a.png')
+        report.generate('Программист', self.statistic, with_pdf=False)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, 'a.png')))
+        sheets = load_workbook(os.path.join(self.directory.name, 'a.xlsx'))
+        self.assertEqual([[cell.value for cell in row] for row in sheets['Статистика по годам'].iter_rows()],
+                         Report.get_year_rows('Программист', self.statistic))
+        self.assertEqual([[cell.value for cell in row] for row in sheets['Статистика по городам'].iter_rows()],
+                         Report.get_city_rows(self.statistic))
+
+    def test_chart_cache(self):
+        charts.panel_cache.clear()
+        file_name = os.path.join(self.directory.name, 'graph.png')
+        charts.generate_chart(file_name, 'Программист', self.statistic)
+        self.assertEqual(imread(file_name).shape, (480, 640, 4))
+        other = [{2021: 1, 2022: 2}, {2021: 1, 2022: 2}] + self.statistic[2:]
+        charts.generate_chart(file_name, 'Аналитик', other)
+        self.assertEqual(len(charts.panel_cache), 6)
+        charts.generate_chart(file_name, 'Аналитик', other)
+        self.assertEqual(len(charts.panel_cache), 6)
+
+    def test_html_table(self):
+        code = get_html_table(Report.get_city_rows(self.statistic), percent_column=4)
+        self.assertEqual(code.count('<tr>'), 3)
+        self.assertIn('<td style="border: 1px solid black">66.67%</td>', code)
+        self.assertIn('<td>  </td>', code)
+
+
+class ParallelStatisticTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'vacancies.csv')
+        with open(self.file_name, 'w', encoding='utf_8_sig', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['name', 'description', 'salary_from', 'salary_to', 'area_name', 'published_at'])
+            writer.writerow(['Аналитик', 'строка 1\n"строка 2"', '1000', '3000', 'Москва', '2021-05-06T02:05:26+0300'])
+            writer.writerow(['Программист', 'описание', '', '5000', 'Казань', '2022-01-06T02:05:26+0300'])
+            writer.writerow(['Аналитик', 'a,\nb', '2000', '', 'Москва', '2021-07-06T02:05:26+0300'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_split_csv(self):
+        header, ranges = split_csv(self.file_name, 10)
+        self.assertEqual(header, 'name,description,salary_from,salary_to,area_name,published_at\r\n'.encode('utf-8'))
+        with open(self.file_name, 'rb') as file:
+            content = file.read()
+        self.assertEqual(len(ranges), 3)
+        self.assertTrue(all(content[start:end].startswith(('Аналитик', 'Программист')[i % 2].encode('utf-8'))
+                            for i, (start, end) in enumerate(ranges)))
+
+    def test_statistics(self):
+        aggregate = aggregate_file(self.file_name, 'Аналитик', max_workers=2)
+        statistic = get_statistics_by_years(aggregate)
+        self.assertEqual(statistic[0], {2021: 2000, 2022: 5000})
+        self.assertEqual(statistic[1][2021], 2000)
+        self.assertTrue(math.isnan(statistic[1][2022]))
+        self.assertEqual(statistic[2:], [{2021: 2, 2022: 1}, {2021: 2, 2022: 0}])
+        self.assertEqual(get_statistics_by_cities(aggregate), [{'Казань': 5000, 'Москва': 2000},
+                                                               {'Москва': 0.6667, 'Казань': 0.3333}])
+
+    def test_cached_statistics(self):
+        directory = os.path.join(self.directory.name, 'cache')
+        expected = aggregate_file(self.file_name, 'Аналитик', max_workers=2)
+        self.assertEqual(aggregate_file(self.file_name, 'Аналитик', use_cache=True, directory=directory), expected)
+        self.assertFalse(os.path.exists(directory))
+        read_csv(self.file_name, directory=directory)
+        with mock.patch('parallel_statistic.ProcessPoolExecutor') as executor:
+            self.assertEqual(aggregate_file(self.file_name, 'Аналитик', use_cache=True, directory=directory),
+                             expected)
+        executor.assert_not_called()
+
+    def test_tasks_use_executor(self):
+        import Task322, Task342, Task343
+        calls = [lambda: Task322.get_stat_by_year(self.file_name, 'Аналитик'),
+                 lambda: Task342.get_stat_by_years(self.file_name, 'Аналитик'),
+                 lambda: Task343.get_statistics(self.file_name, 'Аналитик', 'Москва')]
+        for call in calls:
+            with mock.patch('parallel_statistic.min_range_size', 1), \
+                    mock.patch('parallel_statistic.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as executor:
+                call()
+            executor.assert_called_once()
+
+
+class DataSetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'vacancies.csv')
+        self.header = ['name', 'key_skills', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, rows):
+        with open(self.file_name, 'w', encoding='utf_8_sig', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.header)
+            writer.writerows(rows)
+
+    def test_has_vacancies(self):
+        self.write([['Аналитик', '', '1000', '3000', 'RUR', 'Москва', '2021-05-06T02:05:26+0300']])
+        self.assertFalse(DataSet(self.file_name, lazy=True, workers=2).has_vacancies())
+        self.assertFalse(DataSet(self.file_name).has_vacancies())
+        self.write([['Аналитик', 'SQL', '1000', '3000', 'RUR', 'Москва', '2021-05-06T02:05:26+0300']])
+        self.assertTrue(DataSet(self.file_name, lazy=True, workers=2).has_vacancies())
+
+    def test_parallel_ranges(self):
+        self.write([[f'Аналитик {i}', 'SQL\nExcel', '1000', '3000', 'RUR', ['Москва', 'Казань'][i % 2],
+                     '2021-05-06T02:05:26+0300'] for i in range(40)])
+        expected = [(vac.name, vac.key_skills, vac.area_name) for vac in DataSet(self.file_name)]
+        vacancies = list(DataSet(self.file_name, lazy=True, workers=2))
+        self.assertEqual([(vac.name, vac.key_skills, vac.area_name) for vac in vacancies], expected)
+        streamed = list(DataSet(self.file_name, lazy=True))
+        self.assertIs(streamed[0].area_name, streamed[38].area_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import pandas as pd
+from storage import connect, load_currencies, read_currencies, load_vacancies
+from sql_analytics import get_statistics, has_rollup
+
+
+class StorageTestCase(unittest.TestCase):
+    def setUp(self):
+        self.connection = connect(':memory:')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_load_vacancies(self):
+        df = pd.DataFrame({'name': ['Аналитик', 'Программист', 'Аналитик'], 'salary': [1000.0, float('nan'), 3000.0],
+                           'area_name': ['Москва', 'Казань', 'Москва'],
+                           'published_at': ['2021-05-06T02:05:26+0300', '2022-01-06T02:05:26+0300',
+                                            '2021-07-06T02:05:26+0300']})
+        load_vacancies(self.connection, df)
+        load_vacancies(self.connection, df)
+        self.assertEqual(self.connection.execute('select name, salary, area_name, published_at, year, month '
+                                                 'from vacancies order by id').fetchall(),
+                         [('Аналитик', 1000.0, 'Москва', '2021-05-06', 2021, 5),
+                          ('Программист', None, 'Казань', '2022-01-06', 2022, 1),
+                          ('Аналитик', 3000.0, 'Москва', '2021-07-06', 2021, 7)])
+        self.assertEqual(self.connection.execute('select count(*) from names').fetchone(), (2,))
+        indexes = {name for name, in self.connection.execute("select name from sqlite_master where type = 'index'")}
+        self.assertTrue({'vacancies_year', 'vacancies_area', 'vacancies_name'} <= indexes)
+
+    def test_currencies(self):
+        df = pd.DataFrame({'date': ['01/01/2003', '01/02/2003'], 'BYR': [0.01, None], 'USD': [31.78, 31.9],
+                           'EUR': [33.1, 34.0], 'KZT': [0.2, 0.21], 'UAH': [5.9, 6.0]})
+        load_currencies(self.connection, df)
+        self.assertTrue(read_currencies(self.connection).equals(df))
+        self.assertEqual(self.connection.execute('select year, month from currencies where date = ?',
+                                                 ('01/02/2003',)).fetchone(), (2003, 2))
+
+    def test_partial_currencies(self):
+        df = pd.DataFrame({'date': ['01/01/2003', '01/02/2003'], 'USD': [31.78, 31.9], 'KZT': [0.2, 0.21]})
+        load_currencies(self.connection, df)
+        self.assertEqual(self.connection.execute('select BYR, USD, EUR, KZT, UAH from currencies '
+                                                 'order by month').fetchall(),
+                         [(None, 31.78, None, 0.2, None), (None, 31.9, None, 0.21, None)])
+        self.assertEqual(list(read_currencies(self.connection).columns), ['date', 'BYR', 'USD', 'EUR', 'KZT', 'UAH'])
+
+    def test_get_statistics(self):
+        df = pd.DataFrame({'name': ['Аналитик', 'Программист', 'Аналитик 1%', 'Программист Python'],
+                           'salary': [1000.0, 2000.0, 3000.0, float('nan')],
+                           'area_name': ['Москва', 'Казань', 'Москва', 'Казань'],
+                           'published_at': ['2021-05-06T02:05:26+0300', '2022-01-06T02:05:26+0300',
+                                            '2021-07-06T02:05:26+0300', '2022-03-06T02:05:26+0300']})
+        load_vacancies(self.connection, df)
+        statistics = get_statistics(self.connection, 'Программист')
+        self.assertEqual(statistics[0].values.tolist(), [[2021, 2000.0], [2022, 2000.0]])
+        self.assertEqual(statistics[1].values.tolist(), [[2021, 2], [2022, 1]])
+        self.assertEqual(statistics[3].values.tolist(), [[2022, 1]])
+        self.assertEqual(statistics[4].values.tolist(), [['Москва', 2000.0], ['Казань', 2000.0]])
+        self.assertEqual(statistics[5].values.tolist(), [['Москва', 0.5], ['Казань', 0.25]])
+        self.assertEqual(get_statistics(self.connection, '1%')[3].values.tolist(), [[2021, 1]])
+        self.assertEqual(get_statistics(self.connection, '_')[3].values.tolist(), [])
+        self.assertEqual(get_statistics(self.connection, 'python', mode='token')[3].values.tolist(), [[2022, 0]])
+        self.assertEqual(get_statistics(self.connection, 'Программист', mode='exact')[3].values.tolist(), [[2022, 1]])
+        rollup = get_statistics(self.connection, 'Программист', use_rollup=True)
+        self.assertTrue(has_rollup(self.connection))
+        for expected, actual in zip(statistics, rollup):
+            self.assertEqual(expected.values.tolist(), actual.values.tolist())
+        load_vacancies(self.connection, df)
+        self.assertFalse(has_rollup(self.connection))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import argparse, os, re, time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Any, Optional
+import numpy as np
+from main import DataSet
+from name_index import default_mode, match_modes
+from statistic import Report, StatisticAccumulator
+from vacancy_table import VacancyTable
+
+
+def get_batch_statistics(table: VacancyTable, professions: List[str], area_names: Optional[List[str]] = None,
+                         mode: str = default_mode, slice: int = 10) -> Dict[Tuple[str, Optional[str]], List[Any]]:
+    """
+    Считает статистики для многих профессий по одной таблице. Общие статистики (по годам и по городам)
+    считаются один раз, а суммы зарплат и количества вакансий группируются по (название, год) одним проходом
+    по строкам (и по (название, регион, год) для регионов). Статистика профессии складывается из строк
+    этих сумм для подходящих названий (name_index), поэтому строки таблицы для каждой профессии не перебираются.
+
+    Args:
+        table (VacancyTable): Таблица вакансий
+        professions (List[str]): Названия профессий
+        area_names (List[str] or None): Регионы (статистика профессии по годам дополнительно считается
+            только по вакансиям региона, как в Task343)
+        mode (str): Способ сравнения названий (см. name_index.matches)
+        slice (int): Количество городов в статистиках по городам
+
+    Returns:
+        Dict[Tuple[str, Optional[str]], List[Any]]: Статистики в том виде, в котором их принимает Report,
+            для каждой пары (профессия, регион). Регион None - все регионы.
+    """
+    base = StatisticAccumulator().update_table(table).get_statistics(slice)
+    years = np.array(list(base[0].keys()), dtype=np.int64)
+    year_codes = np.searchsorted(years, table.year)
+    index = table.get_name_index()
+    name_codes = index.codes.astype(np.int64)
+    groups = [(None, name_codes * len(years) + year_codes, None)]
+    if area_names:
+        positions = {area: position for position, area in enumerate(table.area_name.categories)}
+        lookup = np.full(len(positions), -1, dtype=np.int64)
+        for slot, area in enumerate(area_names):
+            if area in positions:
+                lookup[positions[area]] = slot
+        slots = lookup[np.asarray(table.area_name.codes)]
+        rows = slots >= 0
+        groups.append((area_names, (name_codes[rows] * len(area_names) + slots[rows]) * len(years) + year_codes[rows],
+                       rows))
+    result = {}
+    for areas, codes, rows in groups:
+        salaries = table.salary_rub if rows is None else table.salary_rub[rows]
+        shape = (len(index.names), len(areas or [None]), len(years))
+        totals = np.bincount(codes, weights=salaries, minlength=int(np.prod(shape))).reshape(shape)
+        counts = np.bincount(codes, minlength=int(np.prod(shape))).reshape(shape)
+        for profession in professions:
+            found = index.match(profession, mode)
+            for slot, area in enumerate(areas or [None]):
+                total = totals[found, slot].sum(axis=0).tolist()
+                count = counts[found, slot].sum(axis=0).tolist()
+                result[(profession, area)] = [
+                    base[0],
+                    {year: 0 if number == 0 else int(value // number)
+                     for year, value, number in zip(years.tolist(), total, count)},
+                    base[2],
+                    {year: int(number) for year, number in zip(years.tolist(), count)},
+                    base[4],
+                    base[5]]
+    return result
+
+
+def get_report_directory(output: str, profession: str, area_name: Optional[str] = None) -> str:
+    """
+    Возвращает папку отчёта профессии (символы, недопустимые в именах файлов, заменяются на '_').
+
+    Args:
+        output (str): Общая папка отчётов
+        profession (str): Название профессии
+        area_name (str or None): Регион
+
+    Returns:
+        str: Путь к папке отчёта.
+
+    >>> get_report_directory('reports', 'C/C++ разработчик', 'Москва').replace(os.sep, '/')
+    'reports/C_C++ разработчик - Москва'
+    """
+    name = profession if area_name is None else f'{profession} - {area_name}'
+    return os.path.join(output, re.sub(r'[\\/:*?"<>|]', '_', name).strip() or '_')
+
+
+def render_report(directory: str, name: str, statistic: List[Any], with_pdf: bool = True) -> str:
+    """
+    Формирует файлы отчёта одной профессии (выполняется в процессе-обработчике).
+
+    Args:
+        directory (str): Папка отчёта
+        name (str): Название профессии в отчёте
+        statistic (List[Any]): Статистики профессии
+        with_pdf (bool): Формировать report.pdf
+
+    Returns:
+        str: Папка отчёта.
+    """
+    os.makedirs(directory, exist_ok=True)
+    Report(directory).generate(name, statistic, with_pdf)
+    return directory
+
+
+def render_reports(statistics: Dict[Tuple[str, Optional[str]], List[Any]], output: str,
+                   max_workers: Optional[int] = None, with_pdf: bool = True) -> List[str]:
+    """
+    Формирует отчёты всех профессий в отдельных процессах, каждый - в своей папке.
+
+    Args:
+        statistics (Dict[Tuple[str, Optional[str]], List[Any]]): Статистики (результат get_batch_statistics)
+        output (str): Общая папка отчётов
+        max_workers (int or None): Количество процессов (по умолчанию - количество ядер)
+        with_pdf (bool): Формировать report.pdf
+
+    Returns:
+        List[str]: Папки отчётов.
+    """
+    jobs = [(get_report_directory(output, profession, area), profession if area is None else f'{profession}, {area}',
+             statistic, with_pdf) for (profession, area), statistic in statistics.items()]
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [render_report(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_report, *zip(*jobs)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Отчёты по многим профессиям за один разбор файла')
+    parser.add_argument('file_name', help='файл с вакансиями')
+    parser.add_argument('professions', nargs='*', help='названия профессий')
+    parser.add_argument('--professions-file', help='файл с названиями профессий (по одному в строке)')
+    parser.add_argument('--areas', nargs='*', help='регионы (отчёт по профессии в каждом регионе)')
+    parser.add_argument('--output', default='reports', help='папка отчётов')
+    parser.add_argument('--mode', choices=match_modes, default=default_mode, help='способ сравнения названий')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='количество процессов')
+    parser.add_argument('--no-pdf', action='store_true', help='не формировать report.pdf')
+    args = parser.parse_args()
+    professions = list(args.professions)
+    if args.professions_file:
+        with open(args.professions_file, encoding='utf-8') as file:
+            professions += [line.strip() for line in file if line.strip() != '']
+    start_time = time.perf_counter()
+    table = DataSet(args.file_name, lazy=True, workers=args.workers).to_table(use_cache=True)
+    statistics = get_batch_statistics(table, professions, args.areas, args.mode)
+    directories = render_reports(statistics, args.output, args.workers, not args.no_pdf)
+    print(f'Сформировано отчётов: {len(directories)} за {time.perf_counter() - start_time:.2f} с')
@@ -0,0 +1,93 @@
+import csv, os, random, re, sys, tempfile, time
+from itertools import islice
+from typing import List, Dict
+from main import DataSet
+
+
+def old_clean_string(raw_html: str) -> str:
+    """
+    Прежняя реализация DataSet.clean_string (регулярное выражение для каждого поля).
+
+    Args:
+        raw_html (str): Строка, которую нужно очистить
+
+    Returns:
+        str: Очищенная строка.
+    """
+    result = re.sub("<.*?>", '', raw_html)
+    return result if '\n' in raw_html else " ".join(result.split())
+
+
+def old_csv_filer(list_naming: List[str], reader: List[List[str]]) -> List[Dict[str, str]]:
+    """
+    Прежняя реализация DataSet.csv_filer (очистка всех полей вакансии).
+
+    Args:
+        list_naming (List[str]): Поля вакансии
+        reader (List[List[str]]): Данные из файла
+
+    Returns:
+        List[Dict[str, str]]: Список словарей.
+    """
+    new_vacans_list = list(filter(lambda vac: (len(vac) == len(list_naming) and vac.count('') == 0), reader))
+    return [dict(zip(list_naming, map(old_clean_string, vac))) for vac in new_vacans_list]
+
+
+def generate_file(file_name: str, count_rows: int) -> None:
+    """
+    Формирует синтетический файл с вакансиями в формате выгрузки hh.ru.
+
+    Args:
+        file_name (str): Название файла
+        count_rows (int): Количество вакансий
+    """
+    random.seed(0)
+    names = ['Программист Python', 'Аналитик', 'Java разработчик', 'Менеджер по продажам', 'Тестировщик']
+    skills = ['Python', 'SQL', 'Git', 'Linux', 'Docker', 'Java', 'CSS', 'HTML', 'Excel']
+    with open(file_name, 'w', encoding='utf_8_sig', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name',
+                         'salary_from', 'salary_to', 'salary_gross', 'salary_currency', 'area_name', 'published_at'])
+        for i in range(count_rows):
+            description = f'<p><strong>Обязанности:</strong></p> <ul> <li>задача {i}</li> </ul>' if i % 2 else \
+                f'Описание вакансии {i}'
+            writer.writerow([random.choice(names), description, '\n'.join(random.sample(skills, 3)),
+                             'between1And3', 'False', f'Компания {i % 1000}', '50000.0', '80000.0', 'False', 'RUR',
+                             'Москва', '2022-07-05T18:19:30+0300'])
+
+
+def measure(file_name: str, filer) -> float:
+    """
+    Измеряет скорость преобразования строк файла в словари.
+
+    Args:
+        file_name (str): Название файла
+        filer (Callable): Функция, преобразующая строки файла в словари
+
+    Returns:
+        float: Количество строк в секунду.
+    """
+    count_rows = 0
+    start = time.perf_counter()
+    with open(file_name, encoding='utf_8_sig') as file:
+        reader = csv.reader(file)
+        list_naming = next(reader)
+        while True:
+            lines = list(islice(reader, 10000))
+            if len(lines) == 0:
+                break
+            count_rows += len(filer(list_naming, lines))
+    return count_rows / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    count_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'vacancies_benchmark.csv')
+        generate_file(file_name, count_rows)
+        data = DataSet(file_name, lazy=True)
+        before = measure(file_name, old_csv_filer)
+        after = measure(file_name, data.csv_filer)
+    print(f'Строк: {count_rows}')
+    print(f'До: {before:.0f} строк/с')
+    print(f'После: {after:.0f} строк/с (x{after / before:.2f})')
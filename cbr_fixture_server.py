@@ -0,0 +1,124 @@
+import argparse, os, threading, time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from typing import Optional
+
+synthetic_currencies = [('R01090', 'BYR', 1, 'Белорусский рубль', 0.0035),
+                        ('R01235', 'USD', 1, 'Доллар США', 31.78),
+                        ('R01239', 'EUR', 1, 'Евро', 33.11),
+                        ('R01335', 'KZT', 100, 'Казахстанских тенге', 0.204),
+                        ('R01720', 'UAH', 10, 'Украинских гривен', 5.96)]
+
+
+def get_synthetic_response(date: str) -> bytes:
+    """
+    Формирует ответ в формате XML_daily.asp с синтетическими (не настоящими) курсами,
+    которые зависят только от даты. Используется, если записанного ответа за дату нет.
+
+    Args:
+        date (str): Дата в формате 'dd/mm/yyyy'
+
+    Returns:
+        bytes: Ответ в кодировке windows-1251.
+    """
+    day, month, year = map(int, date.split('/'))
+    factor = 1 + ((year - 2003) * 12 + month - 1) * 0.005
+    valutes = ''.join(f'<Valute ID="{valute_id}"><NumCode>{index:03}</NumCode><CharCode>{code}</CharCode>'
+                      f'<Nominal>{nominal}</Nominal><Name>{name}</Name>'
+                      f'<Value>{f"{value * nominal * factor:.4f}".replace(".", ",")}</Value></Valute>'
+                      for index, (valute_id, code, nominal, name, value) in enumerate(synthetic_currencies))
+    return (f'<?xml version="1.0" encoding="windows-1251"?>'
+            f'<ValCurs Date="{day:02}.{month:02}.{year}" name="Foreign Currency Market">{valutes}</ValCurs>'
+            ).encode('cp1251')
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    Локальная замена сервиса курсов ЦБ. Отдаёт ответы, записанные cbr_rates (файлы <YYYYMM>.xml),
+    а для остальных дат - синтетические курсы.
+
+    Attributes:
+        directory (str or None): Папка с записанными ответами
+        delay (float): Задержка перед ответом в секундах (имитация сети)
+        fail_every (int): Каждый fail_every-й запрос завершается ответом 503 (0 - без ошибок)
+        request_count (int): Количество полученных запросов
+    """
+    daemon_threads = True
+
+    def __init__(self, address, directory: Optional[str] = None, delay: float = 0, fail_every: int = 0) -> None:
+        """
+        Инициализирует объект FixtureServer.
+
+        Args:
+            address (Tuple[str, int]): Адрес и порт (порт 0 - любой свободный)
+            directory (str or None): Папка с записанными ответами
+            delay (float): Задержка перед ответом в секундах
+            fail_every (int): Каждый fail_every-й запрос завершается ответом 503
+        """
+        super().__init__(address, FixtureHandler)
+        self.directory = directory
+        self.delay = delay
+        self.fail_every = fail_every
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов XML_daily.asp?date_req=dd/mm/yyyy.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """
+        Отвечает на запрос курсов.
+        """
+        with self.server.lock:
+            self.server.request_count += 1
+            number = self.server.request_count
+        time.sleep(self.server.delay)
+        dates = parse_qs(urlsplit(self.path).query).get('date_req')
+        if self.server.fail_every != 0 and number % self.server.fail_every == 0:
+            self.send_content(503, b'')
+        elif dates is None:
+            self.send_content(400, b'')
+        else:
+            day, month, year = dates[0].split('/')
+            record = None if self.server.directory is None else \
+                os.path.join(self.server.directory, f'{year}{month}.xml')
+            if record is not None and os.path.exists(record):
+                with open(record, 'rb') as file:
+                    self.send_content(200, file.read())
+            else:
+                self.send_content(200, get_synthetic_response(dates[0]))
+
+    def send_content(self, status: int, content: bytes) -> None:
+        """
+        Отправляет ответ, не закрывая соединение.
+
+        Args:
+            status (int): Код ответа
+            content (bytes): Тело ответа
+        """
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/xml; charset=windows-1251')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        """
+        Отключает журнал запросов.
+        """
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Локальный сервер с курсами валют в формате ЦБ')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--directory', help='папка с записанными ответами (cbr_rates.py --record)')
+    parser.add_argument('--delay', type=float, default=0, help='задержка ответа в секундах')
+    parser.add_argument('--fail-every', type=int, default=0, help='каждый N-й запрос отвечает 503')
+    args = parser.parse_args()
+    server = FixtureServer(('127.0.0.1', args.port), args.directory, args.delay, args.fail_every)
+    print(f'http://127.0.0.1:{server.server_address[1]}/scripts/XML_daily.asp')
+    server.serve_forever()
@@ -0,0 +1,265 @@
+import argparse, http.client, os, sqlite3, threading, time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit, quote
+import pandas as pd
+
+cbr_url = 'http://www.cbr.ru/scripts/XML_daily.asp'
+
+
+def get_months(first_date: str, last_date: str) -> List[int]:
+    """
+    Возвращает ключи месяцев (год * 100 + месяц) между двумя датами включительно.
+
+    Args:
+        first_date (str): Первая дата в формате 'YYYY-MM...'
+        last_date (str): Последняя дата в формате 'YYYY-MM...'
+
+    Returns:
+        List[int]: Ключи месяцев.
+
+    >>> get_months('2021-11-05T18:19:30+0300', '2022-02-01')
+    [202111, 202112, 202201, 202202]
+    """
+    first = int(first_date[:4]) * 12 + int(first_date[5:7]) - 1
+    last = int(last_date[:4]) * 12 + int(last_date[5:7]) - 1
+    return [(month // 12) * 100 + month % 12 + 1 for month in range(first, last + 1)]
+
+
+def get_request_date(month: int) -> str:
+    """
+    Возвращает дату запроса курсов (первое число месяца) в формате ЦБ.
+
+    Args:
+        month (int): Ключ месяца
+
+    Returns:
+        str: Дата в формате 'dd/mm/yyyy'.
+
+    >>> get_request_date(200307)
+    '01/07/2003'
+    """
+    return f'01/{month % 100:02}/{month // 100}'
+
+
+def parse_rates(content: bytes) -> Dict[str, float]:
+    """
+    Разбирает ответ ЦБ (XML в кодировке windows-1251) в курсы валют за одну единицу валюты.
+
+    Args:
+        content (bytes): Ответ сервера
+
+    Returns:
+        Dict[str, float]: Курсы валют. Ключи - коды валют.
+    """
+    return {valute.findtext('CharCode'): float(valute.findtext('Value').replace(',', '.')) /
+            int(valute.findtext('Nominal')) for valute in ET.fromstring(content).iter('Valute')}
+
+
+class RateClient:
+    """
+    Клиент сервиса курсов ЦБ. У каждого потока своё постоянное соединение с сервером,
+    поэтому количество соединений ограничено количеством потоков.
+
+    Attributes:
+        base_url (str): Адрес сервиса
+        retries (int): Количество повторов запроса при ошибке
+        timeout (float): Таймаут соединения в секундах
+        backoff (float): Пауза перед первым повтором в секундах (удваивается с каждым повтором)
+    """
+
+    def __init__(self, base_url: str = cbr_url, retries: int = 3, timeout: float = 10, backoff: float = 0.5) -> None:
+        """
+        Инициализирует объект RateClient.
+
+        Args:
+            base_url (str): Адрес сервиса
+            retries (int): Количество повторов запроса при ошибке
+            timeout (float): Таймаут соединения в секундах
+            backoff (float): Пауза перед первым повтором в секундах
+        """
+        self.base_url = base_url
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.local = threading.local()
+
+    def get_connection(self) -> http.client.HTTPConnection:
+        """
+        Возвращает соединение текущего потока (создаёт его при первом обращении).
+
+        Returns:
+            http.client.HTTPConnection: Соединение с сервером.
+        """
+        if getattr(self.local, 'connection', None) is None:
+            url = urlsplit(self.base_url)
+            connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+            self.local.connection = connection_class(url.netloc, timeout=self.timeout)
+        return self.local.connection
+
+    def close_connection(self) -> None:
+        """
+        Закрывает соединение текущего потока.
+        """
+        if getattr(self.local, 'connection', None) is not None:
+            self.local.connection.close()
+            self.local.connection = None
+
+    def fetch(self, month: int) -> bytes:
+        """
+        Запрашивает курсы валют на первое число месяца, повторяя запрос при сетевых ошибках и ответах 5xx.
+
+        Args:
+            month (int): Ключ месяца
+
+        Returns:
+            bytes: Ответ сервера.
+        """
+        path = f'{urlsplit(self.base_url).path}?date_req={quote(get_request_date(month), safe="")}'
+        for attempt in range(self.retries + 1):
+            try:
+                connection = self.get_connection()
+                connection.request('GET', path)
+                response = connection.getresponse()
+                content = response.read()
+            except (OSError, http.client.HTTPException):
+                self.close_connection()
+                if attempt == self.retries:
+                    raise
+            else:
+                if response.status == 200:
+                    return content
+                if response.status < 500 or attempt == self.retries:
+                    raise ConnectionError(f'Сервер курсов вернул {response.status} для {get_request_date(month)}')
+            time.sleep(self.backoff * 2 ** attempt)
+
+
+class RateStore:
+    """
+    Локальное хранилище курсов валют (SQLite). Курсы сохраняются по мере загрузки месяцев,
+    поэтому при повторном запуске загружаются только недостающие месяцы.
+
+    Attributes:
+        file_name (str): Название файла базы данных
+        connection (sqlite3.Connection): Соединение с базой данных
+    """
+
+    def __init__(self, file_name: str = 'currency_rates.db') -> None:
+        """
+        Инициализирует объект RateStore и создаёт таблицы, если их нет.
+
+        Args:
+            file_name (str): Название файла базы данных
+        """
+        self.file_name = file_name
+        self.connection = sqlite3.connect(file_name)
+        self.connection.executescript('''
+            create table if not exists months (month integer primary key);
+            create table if not exists rates (
+                month integer not null,
+                currency text not null,
+                value real not null,
+                primary key (month, currency)) without rowid;''')
+
+    def get_missing_months(self, months: List[int]) -> List[int]:
+        """
+        Возвращает месяцы, курсов за которые ещё нет в хранилище.
+
+        Args:
+            months (List[int]): Ключи месяцев
+
+        Returns:
+            List[int]: Ключи недостающих месяцев.
+        """
+        saved = {month for month, in self.connection.execute('select month from months')}
+        return [month for month in months if month not in saved]
+
+    def save_month(self, month: int, rates: Dict[str, float]) -> None:
+        """
+        Сохраняет курсы всех валют за месяц.
+
+        Args:
+            month (int): Ключ месяца
+            rates (Dict[str, float]): Курсы валют
+        """
+        with self.connection:
+            self.connection.executemany('insert or replace into rates values (?, ?, ?)',
+                                        [(month, currency, value) for currency, value in rates.items()])
+            self.connection.execute('insert or replace into months values (?)', (month,))
+
+    def load_rates(self, months: List[int], currencies: List[str],
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Возвращает курсы валют по месяцам в формате data_currencies.csv.
+
+        Args:
+            months (List[int]): Ключи месяцев
+            currencies (List[str]): Коды валют, курсы которых нужно заполнить
+            columns (List[str] or None): Столбцы валют (курсы валют не из currencies - NaN); None - currencies
+
+        Returns:
+            pd.DataFrame: Столбец date (формат 'dd/mm/yyyy') и столбцы валют.
+        """
+        columns = currencies if columns is None else columns
+        df = pd.DataFrame(columns=['month', 'currency', 'value'])
+        if len(currencies) > 0 and len(months) > 0:
+            df = pd.read_sql(f'''select month, currency, value from rates
+                                 where month between ? and ? and currency in ({', '.join('?' * len(currencies))})''',
+                             self.connection, params=[min(months), max(months)] + list(currencies))
+        df = df.pivot(index='month', columns='currency', values='value').reindex(index=months, columns=columns)
+        df = df.astype(float)
+        df.insert(0, 'date', [get_request_date(month) for month in months])
+        return df.reset_index(drop=True).rename_axis(columns=None)
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        self.connection.close()
+
+
+def update_rates(store: RateStore, client: RateClient, months: List[int], max_workers: int = 8,
+                 record_directory: Optional[str] = None) -> int:
+    """
+    Загружает недостающие месяцы одновременно в нескольких потоках и сохраняет каждый месяц сразу после загрузки.
+
+    Args:
+        store (RateStore): Хранилище курсов
+        client (RateClient): Клиент сервиса курсов
+        months (List[int]): Ключи нужных месяцев
+        max_workers (int): Количество потоков (и соединений с сервером)
+        record_directory (str or None): Папка, в которую сохраняются ответы сервера (для cbr_fixture_server)
+
+    Returns:
+        int: Количество загруженных месяцев.
+    """
+    missing_months = store.get_missing_months(months)
+    if record_directory is not None:
+        os.makedirs(record_directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(client.fetch, month): month for month in missing_months}
+        for future in as_completed(futures):
+            content = future.result()
+            if record_directory is not None:
+                with open(os.path.join(record_directory, f'{futures[future]}.xml'), 'wb') as file:
+                    file.write(content)
+            store.save_month(futures[future], parse_rates(content))
+    return len(missing_months)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Загрузка курсов валют ЦБ в локальное хранилище')
+    parser.add_argument('first_month', help='первый месяц в формате YYYY-MM')
+    parser.add_argument('last_month', help='последний месяц в формате YYYY-MM')
+    parser.add_argument('--base-url', default=cbr_url, help='адрес сервиса курсов (например, cbr_fixture_server)')
+    parser.add_argument('--database', default='currency_rates.db', help='файл хранилища')
+    parser.add_argument('--workers', type=int, default=8, help='количество одновременных запросов')
+    parser.add_argument('--record', metavar='DIRECTORY', help='сохранить ответы сервера в папку')
+    args = parser.parse_args()
+    rate_store = RateStore(args.database)
+    start = time.perf_counter()
+    count = update_rates(rate_store, RateClient(args.base_url), get_months(args.first_month, args.last_month),
+                         args.workers, args.record)
+    print(f'Загружено месяцев: {count} за {time.perf_counter() - start:.2f} с')
+    rate_store.close()
@@ -0,0 +1,140 @@
+import hashlib, threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple
+import numpy as np
+
+panel_size = (3.2, 2.4)
+dpi = 100
+font_size = 8
+cache_size = 64
+width = 0.4
+
+panel_cache = OrderedDict()
+cache_lock = threading.Lock()
+
+
+def get_key(*parts: Any) -> str:
+    """
+    Возвращает хэш данных панели (ключ кэша).
+
+    Args:
+        parts (Any): Вид панели и данные, по которым она строится
+
+    Returns:
+        str: Ключ кэша.
+
+    >>> get_key('share', {'Москва': 0.5}) == get_key('share', {'Москва': 0.5})
+    True
+    """
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def get_panels(name_vac: str, statistic: List[Dict[Any, Any]]) -> List[Tuple[str, tuple]]:
+    """
+    Возвращает вид и данные каждой из четырёх панелей. Панели по городам не зависят от профессии,
+    поэтому при отчётах по многим профессиям они берутся из кэша.
+
+    Args:
+        name_vac (str): Название вакансии
+        statistic (List[Dict[Any, Any]]): Статистика по вакансиям
+
+    Returns:
+        List[Tuple[str, tuple]]: Панели в порядке слева направо, сверху вниз.
+    """
+    return [('salary_by_years', (statistic[0], statistic[1], name_vac)),
+            ('count_by_years', (statistic[2], statistic[3], name_vac)),
+            ('salary_by_cities', (statistic[4],)),
+            ('share_by_cities', (statistic[5],))]
+
+
+def render_panel(kind: str, data: tuple) -> np.ndarray:
+    """
+    Рисует одну панель на отдельной фигуре (объектный API matplotlib и холст Agg, без pyplot,
+    поэтому рисовать можно из нескольких потоков). matplotlib импортируется при первом вызове.
+
+    Args:
+        kind (str): Вид панели
+        data (tuple): Данные панели
+
+    Returns:
+        np.ndarray: Изображение панели (RGBA).
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=panel_size, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    picture = fig.add_subplot()
+    picture.tick_params(labelsize=font_size)
+    if kind in ['salary_by_years', 'count_by_years']:
+        total, needed, name_vac = data
+        years = total.keys()
+        x = np.arange(len(years))
+        if kind == 'salary_by_years':
+            picture.set_title('Уровень зарплат по годам', fontsize=font_size)
+            labels = ['средняя з/п', f'з/п {name_vac}']
+        else:
+            picture.set_title('Количество вакансий по годам', fontsize=font_size)
+            labels = ['Количество вакансий', f'Количество вакансий {name_vac}']
+        picture.bar(x - width / 2, total.values(), width, label=labels[0])
+        picture.bar(x + width / 2, needed.values(), width, label=labels[1])
+        picture.legend(loc='upper left', fontsize=font_size)
+        picture.grid(axis='y')
+        picture.set_xticks(x, years, rotation=90)
+    elif kind == 'salary_by_cities':
+        salary_by_cities, = data
+        cities = list(map(lambda city: city.replace(' ', '\n').replace('-', '-\n'), list(salary_by_cities.keys())))
+        y_pos = np.arange(len(cities))
+        picture.set_title('Уровень зарплат по городам', fontsize=font_size)
+        picture.barh(y_pos, salary_by_cities.values(), align='center')
+        picture.invert_yaxis()  # labels read top-to-bottom
+        picture.grid(axis='x')
+        picture.set_yticks(y_pos, labels=cities, fontsize=6)
+    else:
+        share_by_cities, = data
+        name_labels = ['Другие'] + list(share_by_cities.keys())
+        city_percent = [1 - sum(list(share_by_cities.values()))] + list(share_by_cities.values())
+        picture.set_title('Доля вакансий по городам', fontsize=font_size)
+        picture.pie(city_percent, labels=name_labels, radius=1.25, textprops={'fontsize': 6})
+    fig.tight_layout()
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def get_panel(kind: str, data: tuple) -> np.ndarray:
+    """
+    Возвращает изображение панели из кэша или рисует его (в кэше хранятся последние cache_size панелей).
+
+    Args:
+        kind (str): Вид панели
+        data (tuple): Данные панели
+
+    Returns:
+        np.ndarray: Изображение панели (RGBA).
+    """
+    key = get_key(kind, data)
+    with cache_lock:
+        if key in panel_cache:
+            panel_cache.move_to_end(key)
+            return panel_cache[key]
+    image = render_panel(kind, data)
+    with cache_lock:
+        panel_cache[key] = image
+        if len(panel_cache) > cache_size:
+            panel_cache.popitem(last=False)
+    return image
+
+
+def generate_chart(file_name: str, name_vac: str, statistic: List[Dict[Any, Any]]) -> None:
+    """
+    Формирует файл png с четырьмя графиками (сетка 2 x 2). Перерисовываются только панели,
+    данных которых нет в кэше.
+
+    Args:
+        file_name (str): Файл с графиками
+        name_vac (str): Название вакансии
+        statistic (List[Dict[Any, Any]]): Статистика по вакансиям
+    """
+    from matplotlib.image import imsave
+    panels = [get_panel(kind, data) for kind, data in get_panels(name_vac, statistic)]
+    image = np.concatenate([np.concatenate(panels[:2], axis=1), np.concatenate(panels[2:], axis=1)], axis=0)
+    imsave(file_name, image, format='png')
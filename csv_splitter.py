@@ -0,0 +1,91 @@
+import os
+from typing import List, Tuple, BinaryIO
+
+block_size = 1 << 20
+
+
+def find_record_end(file: BinaryIO, position: int, in_quotes: bool) -> int:
+    """
+    Находит конец записи csv, начиная с позиции в файле. Перевод строки внутри кавычек
+    (многострочные поля description и key_skills) концом записи не считается.
+
+    Args:
+        file (BinaryIO): Файл, открытый в двоичном режиме
+        position (int): Позиция, с которой начинается поиск
+        in_quotes (bool): Находится ли позиция внутри поля в кавычках
+
+    Returns:
+        int: Позиция сразу после перевода строки, завершающего запись (или размер файла).
+    """
+    file.seek(position)
+    while True:
+        block = file.read(block_size)
+        if len(block) == 0:
+            return position
+        start = 0
+        while True:
+            end = block.find(b'\n', start)
+            if end == -1:
+                in_quotes ^= block.count(b'"', start) % 2 == 1
+                break
+            in_quotes ^= block.count(b'"', start, end) % 2 == 1
+            if not in_quotes:
+                return position + end + 1
+            start = end + 1
+        position += len(block)
+
+
+def split_csv(file_name: str, count_ranges: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """
+    Делит csv-файл на диапазоны байтов примерно одинакового размера по границам записей.
+    Файл читается один раз: чтобы понять, находится ли граница внутри поля в кавычках, считаются кавычки до неё.
+
+    Args:
+        file_name (str): Название файла
+        count_ranges (int): Желаемое количество диапазонов
+
+    Returns:
+        Tuple[bytes, List[Tuple[int, int]]]: Строка заголовка (без BOM) и диапазоны записей [начало, конец).
+    """
+    size = os.path.getsize(file_name)
+    with open(file_name, 'rb') as file:
+        data_start = find_record_end(file, 0, False)
+        file.seek(0)
+        header = file.read(data_start)
+        header = header[3:] if header.startswith(b'\xef\xbb\xbf') else header
+        boundaries = [data_start]
+        position, in_quotes = data_start, False
+        step = max((size - data_start) // max(count_ranges, 1), 1)
+        for target in range(data_start + step, size, step):
+            if target <= boundaries[-1]:
+                continue
+            file.seek(position)
+            while position < target:
+                block = file.read(min(block_size, target - position))
+                in_quotes ^= block.count(b'"') % 2 == 1
+                position += len(block)
+            boundary = find_record_end(file, target, in_quotes)
+            if boundary >= size:
+                break
+            position, in_quotes = boundary, False
+            boundaries.append(boundary)
+    if boundaries[-1] < size:
+        boundaries.append(size)
+    return header, list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def read_range(file_name: str, start: int, end: int) -> bytes:
+    """
+    Читает диапазон байтов файла.
+
+    Args:
+        file_name (str): Название файла
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+
+    Returns:
+        bytes: Содержимое диапазона.
+    """
+    with open(file_name, 'rb') as file:
+        file.seek(start)
+        return file.read(end - start)
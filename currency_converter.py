@@ -0,0 +1,79 @@
+from typing import List
+import numpy as np
+import pandas as pd
+
+converted_currencies = ['BYR', 'USD', 'EUR', 'KZT', 'UAH']
+
+
+def get_month_keys(dates: pd.Series) -> np.ndarray:
+    """
+    Вычисляет ключ месяца (год * 100 + месяц) по датам вида 'YYYY-MM...' без цикла по строкам:
+    первые 7 символов даты разбираются как массив кодов символов.
+
+    Args:
+        dates (pd.Series): Даты публикации вакансий
+
+    Returns:
+        np.ndarray: Ключи месяцев.
+
+    >>> get_month_keys(pd.Series(['2022-07-05T18:19:30+0300', '2003-01-01'])).tolist()
+    [202207, 200301]
+    """
+    digits = np.asarray(dates, dtype='U7').view(np.uint32).reshape(-1, 7).astype(np.int64) - ord('0')
+    return digits[:, 0] * 100000 + digits[:, 1] * 10000 + digits[:, 2] * 1000 + digits[:, 3] * 100 + \
+        digits[:, 5] * 10 + digits[:, 6]
+
+
+def get_rate_table(df_currencies: pd.DataFrame, currencies: List[str] = converted_currencies) -> pd.DataFrame:
+    """
+    Формирует таблицу курсов с индексом по ключу месяца (год * 100 + месяц).
+
+    Args:
+        df_currencies (pd.DataFrame): Курсы валют по месяцам (столбец date в формате 'dd/mm/yyyy' и столбцы валют)
+        currencies (List[str]): Валюты, которые переводятся в рубли
+
+    Returns:
+        pd.DataFrame: Курсы валют, индекс - ключ месяца.
+    """
+    dates = df_currencies['date'].astype(str)
+    keys = dates.str[6:10].astype(int) * 100 + dates.str[3:5].astype(int)
+    currencies = [currency for currency in currencies if currency in df_currencies.columns]
+    return pd.DataFrame(df_currencies[currencies].to_numpy(dtype=float), index=pd.Index(keys, name='month'),
+                        columns=currencies).sort_index()
+
+
+def get_salary(df: pd.DataFrame) -> pd.Series:
+    """
+    Вычисляет среднюю зарплату: среднее границ, а если одна из границ не указана - другую границу.
+
+    Args:
+        df (pd.DataFrame): Вакансии со столбцами salary_from и salary_to
+
+    Returns:
+        pd.Series: Зарплата в валюте вакансии.
+    """
+    return ((df['salary_from'] + df['salary_to']) / 2).fillna(df['salary_from']).fillna(df['salary_to'])
+
+
+def convert_salaries(df: pd.DataFrame, rate_table: pd.DataFrame) -> pd.Series:
+    """
+    Переводит средние зарплаты вакансий в рубли по курсу месяца публикации.
+    Курс находится по индексу таблицы курсов для всех строк сразу, без поиска по таблице для каждой строки.
+    Если валюта не указана, неизвестна или курса за месяц нет, зарплата - NaN.
+
+    Args:
+        df (pd.DataFrame): Вакансии со столбцами salary_from, salary_to, salary_currency и published_at
+        rate_table (pd.DataFrame): Таблица курсов (результат get_rate_table)
+
+    Returns:
+        pd.Series: Зарплата в рублях.
+    """
+    rows = rate_table.index.get_indexer(get_month_keys(df['published_at']))
+    currencies = df['salary_currency'].astype('category')
+    columns = rate_table.columns.get_indexer(currencies.cat.categories)
+    columns = np.append(columns, -1)[currencies.cat.codes.to_numpy()]
+    ratio = np.full(len(df), np.nan)
+    found = (rows >= 0) & (columns >= 0)
+    ratio[found] = rate_table.to_numpy()[rows[found], columns[found]]
+    ratio[(currencies == 'RUR').to_numpy()] = 1.0
+    return get_salary(df) * ratio
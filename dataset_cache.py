@@ -0,0 +1,306 @@
+import argparse, hashlib, json, os, shutil
+from typing import List, Dict, Any, Optional
+import numpy as np
+from vacancy_table import VacancyTable, CategoricalColumn, StringColumn
+
+cache_directory = '.dataset_cache'
+cache_version = 2
+
+
+def get_file_hash(file_name: str) -> str:
+    """
+    Вычисляет хэш содержимого файла.
+
+    Args:
+        file_name (str): Название файла
+
+    Returns:
+        str: Хэш содержимого.
+    """
+    file_hash = hashlib.blake2b(digest_size=20)
+    with open(file_name, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def get_snapshot_path(file_name: str, kind: str, directory: str) -> str:
+    """
+    Возвращает путь к снимку файла в кэше.
+
+    Args:
+        file_name (str): Название исходного файла
+        kind (str): Вид снимка (таблица вакансий или DataFrame с параметрами чтения)
+        directory (str): Папка кэша
+
+    Returns:
+        str: Путь к папке снимка.
+    """
+    key = hashlib.sha1(f'{os.path.abspath(file_name)}|{kind}'.encode('utf-8')).hexdigest()[:20]
+    return os.path.join(directory, key)
+
+
+def is_snapshot_valid(meta: Dict[str, Any], file_name: str) -> bool:
+    """
+    Проверяет, что снимок соответствует текущему содержимому файла. Хэш содержимого пересчитывается,
+    только если у файла изменилось время модификации, а размер остался прежним.
+
+    Args:
+        meta (Dict[str, Any]): Описание снимка
+        file_name (str): Название исходного файла
+
+    Returns:
+        bool: True, если снимок можно использовать.
+    """
+    stat = os.stat(file_name)
+    if meta['version'] != cache_version or meta['source'] != os.path.abspath(file_name) or \
+            meta['size'] != stat.st_size:
+        return False
+    return meta['mtime_ns'] == stat.st_mtime_ns or meta['hash'] == get_file_hash(file_name)
+
+
+def save_strings(path: str, values: List[str]) -> None:
+    """
+    Сохраняет строки в один буфер: каждая строка завершается нулевым байтом, рядом хранятся смещения строк.
+
+    Args:
+        path (str): Путь к файлам столбца (без расширения)
+        values (List[str]): Строки
+    """
+    text = '\x00'.join(values) + '\x00' if len(values) != 0 else ''
+    if text.count('\x00') != len(values):
+        raise ValueError('Строки содержат нулевой символ')
+    blob = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+    offsets = np.concatenate([[0], np.flatnonzero(blob == 0) + 1]).astype(np.int64)
+    np.save(f'{path}.blob.npy', blob)
+    np.save(f'{path}.offsets.npy', offsets)
+
+
+def load_strings(path: str, split_lines: bool = False) -> StringColumn:
+    """
+    Загружает строковый столбец, отображая его файлы в память.
+
+    Args:
+        path (str): Путь к файлам столбца (без расширения)
+        split_lines (bool): Значения столбца - списки строк
+
+    Returns:
+        StringColumn: Строковый столбец.
+    """
+    offsets = np.load(f'{path}.offsets.npy', mmap_mode='r')
+    blob = np.load(f'{path}.blob.npy', mmap_mode='r') if offsets[-1] != 0 else np.zeros(0, dtype=np.uint8)
+    return StringColumn(blob, offsets, split_lines)
+
+
+def save_columns(file_name: str, kind: str, columns: Dict[str, Any], directory: str = cache_directory) -> None:
+    """
+    Сохраняет столбцы в кэш. Снимок сначала пишется во временную папку, а затем подменяет старый.
+
+    Args:
+        file_name (str): Название исходного файла
+        kind (str): Вид снимка
+        columns (Dict[str, Any]): Столбцы: массивы NumPy, CategoricalColumn, StringColumn, списки строк
+            (пропуски - None) или списки списков строк
+        directory (str): Папка кэша
+    """
+    snapshot = get_snapshot_path(file_name, kind, directory)
+    temp_snapshot = f'{snapshot}.tmp{os.getpid()}'
+    stat = os.stat(file_name)
+    meta = {'version': cache_version, 'source': os.path.abspath(file_name), 'kind': kind, 'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns, 'hash': get_file_hash(file_name), 'columns': {}}
+    os.makedirs(temp_snapshot)
+    try:
+        for i, (field, column) in enumerate(columns.items()):
+            path = os.path.join(temp_snapshot, str(i))
+            if isinstance(column, CategoricalColumn):
+                np.save(f'{path}.codes.npy', np.asarray(column.codes))
+                save_strings(path, column.categories)
+                meta['columns'][field] = 'categorical'
+            elif isinstance(column, np.ndarray):
+                np.save(f'{path}.npy', column)
+                meta['columns'][field] = 'array'
+            elif isinstance(column, StringColumn):
+                np.save(f'{path}.blob.npy', np.asarray(column.blob))
+                np.save(f'{path}.offsets.npy', np.asarray(column.offsets))
+                meta['columns'][field] = 'lines' if column.split_lines else 'strings'
+            elif len(column) != 0 and isinstance(column[0], list):
+                save_strings(path, ['\n'.join(value) for value in column])
+                meta['columns'][field] = 'lines'
+            elif None in column:
+                save_strings(path, ['' if value is None else value for value in column])
+                np.save(f'{path}.nulls.npy', np.fromiter((value is None for value in column), dtype=bool,
+                                                         count=len(column)))
+                meta['columns'][field] = 'nullable'
+            else:
+                save_strings(path, column)
+                meta['columns'][field] = 'strings'
+        with open(os.path.join(temp_snapshot, 'meta.json'), 'w', encoding='utf-8') as file:
+            json.dump(meta, file, ensure_ascii=False)
+        if os.path.exists(snapshot):
+            shutil.rmtree(snapshot)
+        os.replace(temp_snapshot, snapshot)
+    finally:
+        if os.path.exists(temp_snapshot):
+            shutil.rmtree(temp_snapshot)
+
+
+def load_columns(file_name: str, kind: str, directory: str = cache_directory) -> Optional[Dict[str, Any]]:
+    """
+    Загружает столбцы из кэша. Числовые массивы и строки отображаются в память, а не читаются целиком.
+
+    Args:
+        file_name (str): Название исходного файла
+        kind (str): Вид снимка
+        directory (str): Папка кэша
+
+    Returns:
+        Dict[str, Any] or None: Столбцы или None, если снимка нет или файл изменился.
+    """
+    snapshot = get_snapshot_path(file_name, kind, directory)
+    try:
+        with open(os.path.join(snapshot, 'meta.json'), encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not is_snapshot_valid(meta, file_name):
+        return None
+    if meta['mtime_ns'] != os.stat(file_name).st_mtime_ns:
+        meta['mtime_ns'] = os.stat(file_name).st_mtime_ns
+        with open(os.path.join(snapshot, 'meta.json'), 'w', encoding='utf-8') as file:
+            json.dump(meta, file, ensure_ascii=False)
+    columns = {}
+    for i, (field, column_type) in enumerate(meta['columns'].items()):
+        path = os.path.join(snapshot, str(i))
+        if column_type == 'categorical':
+            columns[field] = CategoricalColumn(np.load(f'{path}.codes.npy', mmap_mode='r'),
+                                               load_strings(path).to_list())
+        elif column_type == 'array':
+            columns[field] = np.load(f'{path}.npy', mmap_mode='r')
+        elif column_type == 'nullable':
+            values = load_strings(path).to_list()
+            for index in np.flatnonzero(np.load(f'{path}.nulls.npy')).tolist():
+                values[index] = np.nan
+            columns[field] = values
+        else:
+            columns[field] = load_strings(path, column_type == 'lines')
+    return columns
+
+
+def load_table(file_name: str, directory: str = cache_directory) -> Optional[VacancyTable]:
+    """
+    Загружает таблицу вакансий из кэша.
+
+    Args:
+        file_name (str): Название файла с вакансиями
+        directory (str): Папка кэша
+
+    Returns:
+        VacancyTable or None: Таблица вакансий или None, если снимка нет или файл изменился.
+    """
+    columns = load_columns(file_name, 'table', directory)
+    return None if columns is None else VacancyTable(columns)
+
+
+def save_table(file_name: str, table: VacancyTable, directory: str = cache_directory) -> None:
+    """
+    Сохраняет таблицу вакансий в кэш.
+
+    Args:
+        file_name (str): Название файла с вакансиями
+        table (VacancyTable): Таблица вакансий
+        directory (str): Папка кэша
+    """
+    save_columns(file_name, 'table', table.get_columns(), directory)
+
+
+def get_dataframe_kind(kwargs: Dict[str, Any]) -> str:
+    """
+    Возвращает вид снимка DataFrame (снимки с разными параметрами чтения хранятся отдельно).
+
+    Args:
+        kwargs (Dict[str, Any]): Параметры pd.read_csv
+
+    Returns:
+        str: Вид снимка.
+    """
+    return 'dataframe' + json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def load_csv(file_name: str, directory: str = cache_directory, **kwargs) -> Any:
+    """
+    Загружает DataFrame из кэша, не читая исходный файл.
+
+    Args:
+        file_name (str): Название файла
+        directory (str): Папка кэша
+        **kwargs: Параметры pd.read_csv, с которыми был сохранён снимок
+
+    Returns:
+        pd.DataFrame or None: Данные из файла или None, если актуального снимка нет.
+    """
+    import pandas as pd
+    columns = load_columns(file_name, get_dataframe_kind(kwargs), directory)
+    if columns is None:
+        return None
+    return pd.DataFrame({field: column if isinstance(column, (np.ndarray, list)) else column.to_list()
+                         for field, column in columns.items()})
+
+
+def read_csv(file_name: str, rebuild: bool = False, directory: str = cache_directory, **kwargs) -> Any:
+    """
+    Аналог pd.read_csv с кэшированием: после первого чтения DataFrame сохраняется в кэш по столбцам.
+
+    Args:
+        file_name (str): Название файла
+        rebuild (bool): Перечитать файл, не используя кэш
+        directory (str): Папка кэша
+        **kwargs: Параметры pd.read_csv
+
+    Returns:
+        pd.DataFrame: Данные из файла.
+    """
+    import pandas as pd
+    kind = get_dataframe_kind(kwargs)
+    df = None if rebuild else load_csv(file_name, directory, **kwargs)
+    if df is not None:
+        return df
+    df = pd.read_csv(file_name, **kwargs)
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or \
+            not all(dtype.kind in 'biufO' for dtype in df.dtypes):
+        return df
+    columns = {}
+    for field, dtype in df.dtypes.items():
+        if dtype.kind == 'O':
+            columns[field] = [None if null else str(value)
+                              for value, null in zip(df[field].tolist(), df[field].isna().tolist())]
+        else:
+            columns[field] = df[field].to_numpy()
+    try:
+        save_columns(file_name, kind, columns, directory)
+    except ValueError:
+        pass
+    return df
+
+
+def clear_cache(directory: str = cache_directory) -> None:
+    """
+    Удаляет все снимки из кэша.
+
+    Args:
+        directory (str): Папка кэша
+    """
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Управление кэшем разобранных файлов с вакансиями')
+    parser.add_argument('--clear', action='store_true', help='удалить все снимки')
+    parser.add_argument('--rebuild', metavar='FILE', nargs='*', default=[], help='пересобрать снимки файлов')
+    args = parser.parse_args()
+    from main import DataSet
+    if args.clear:
+        clear_cache()
+    for file_name in args.rebuild:
+        DataSet(file_name, lazy=True).to_table(use_cache=True, rebuild_cache=True)
+        read_csv(file_name, rebuild=True)
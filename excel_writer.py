@@ -0,0 +1,129 @@
+from itertools import chain, islice
+from typing import List, Any, Iterable, Optional
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font, Border, Side, Alignment, NamedStyle
+from openpyxl.styles.numbers import FORMAT_PERCENTAGE_00
+from openpyxl.utils import get_column_letter
+from openpyxl.workbook import Workbook
+
+max_cell_length = 32767
+width_sample = 1000
+max_width = 60
+
+
+def create_workbook() -> Workbook:
+    """
+    Создаёт книгу в потоковом режиме (строки сразу записываются во временный файл) и регистрирует
+    именованные стили отчёта, чтобы ячейки ссылались на них, а не получали собственные стили.
+
+    Returns:
+        Workbook: Книга без листов.
+    """
+    wb = Workbook(write_only=True)
+    thins = Side(border_style="thin", color="000000")
+    border = Border(left=thins, top=thins, right=thins, bottom=thins)
+    alignment = Alignment(horizontal='center')
+    wb.add_named_style(NamedStyle('report_header', font=Font(bold=True), border=border, alignment=alignment))
+    wb.add_named_style(NamedStyle('report_cell', border=border, alignment=alignment))
+    wb.add_named_style(NamedStyle('report_percent', border=border, alignment=alignment,
+                                  number_format=FORMAT_PERCENTAGE_00))
+    return wb
+
+
+def get_width(value: Any) -> int:
+    """
+    Возвращает ширину значения в символах (для многострочного значения - ширину самой длинной строки).
+
+    Args:
+        value (Any): Значение ячейки
+
+    Returns:
+        int: Ширина значения.
+
+    >>> get_width('Python\\nSQL')
+    6
+    """
+    return max(map(len, str(value).split('\n')))
+
+
+def clean_value(value: Any) -> Any:
+    """
+    Убирает из строки символы, недопустимые в xlsx, и обрезает её до предельной длины ячейки.
+
+    Args:
+        value (Any): Значение ячейки
+
+    Returns:
+        Any: Значение, которое можно записать в ячейку.
+    """
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub('', value)[:max_cell_length]
+    return value
+
+
+def write_table(wb: Workbook, title: str, rows: List[List[Any]], percent_column: Optional[int] = None) -> None:
+    """
+    Записывает небольшую таблицу отчёта: заголовок жирным, у ячеек рамка и выравнивание по центру,
+    пустой столбец-разделитель ('  ') без рамки. Ширина столбцов считается по ходу формирования ячеек.
+
+    Args:
+        wb (Workbook): Книга (create_workbook)
+        title (str): Название листа
+        rows (List[List[Any]]): Строки таблицы (первая - заголовок)
+        percent_column (int or None): Номер столбца, значения которого выводятся в процентах
+    """
+    sheet = wb.create_sheet(title)
+    widths, cells = [], []
+    for i, row in enumerate(rows):
+        cells.append([])
+        for j, value in enumerate(row):
+            if j == len(widths):
+                widths.append(0)
+            widths[j] = max(widths[j], len(str(value)))
+            cell = WriteOnlyCell(sheet, value)
+            if value != '  ':
+                cell.style = 'report_header' if i == 0 else 'report_percent' if j == percent_column else 'report_cell'
+            cells[-1].append(cell)
+    for j, width in enumerate(widths):
+        sheet.column_dimensions[get_column_letter(j + 1)].width = width + 1
+    for row in cells:
+        sheet.append(row)
+
+
+def stream_table(wb: Workbook, title: str, rows: Iterable[List[Any]]) -> int:
+    """
+    Записывает таблицу любого размера, не храня её в памяти: строки сразу уходят во временный файл книги.
+    Ширина столбцов задаётся до записи строк, поэтому считается по первым width_sample строкам
+    (и ограничена max_width). Стиль получает только заголовок, значения записываются без стилей.
+
+    Args:
+        wb (Workbook): Книга (create_workbook)
+        title (str): Название листа
+        rows (Iterable[List[Any]]): Строки таблицы (первая - заголовок), например генератор
+
+    Returns:
+        int: Количество записанных строк без заголовка.
+    """
+    sheet = wb.create_sheet(title)
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return 0
+    sample = list(islice(rows, width_sample))
+    widths = [get_width(value) for value in header]
+    for row in sample:
+        widths = [max(width, get_width(value)) for width, value in zip(widths, row)]
+    for j, width in enumerate(widths):
+        sheet.column_dimensions[get_column_letter(j + 1)].width = min(width, max_width) + 1
+    header_cells = []
+    for value in header:
+        cell = WriteOnlyCell(sheet, value)
+        cell.style = 'report_header'
+        header_cells.append(cell)
+    sheet.append(header_cells)
+    count = 0
+    for row in chain(sample, rows):
+        sheet.append([clean_value(value) for value in row])
+        count += 1
+    return count
@@ -0,0 +1,262 @@
+import argparse, csv, json, math, os, threading, time, warnings
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import List, Dict, Tuple, Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+api_url = 'https://api.hh.ru/vacancies'
+per_page = 100
+max_results = 2000
+date_format = '%Y-%m-%dT%H:%M:%S'
+fields = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+
+
+def normalize_vacancy(item: Dict[str, Any]) -> List[Any]:
+    """
+    Преобразует вакансию из ответа API в строку выходного файла.
+
+    Args:
+        item (Dict[str, Any]): Вакансия из ответа API
+
+    Returns:
+        List[Any]: Значения полей fields.
+
+    >>> normalize_vacancy({'name': 'Аналитик', 'salary': None, 'area': {'name': 'Москва'},
+    ...                    'published_at': '2022-12-07T10:00:00+0300'})
+    ['Аналитик', None, None, None, 'Москва', '2022-12-07T10:00:00+0300']
+    """
+    salary = item.get('salary') or {}
+    return [item['name'], salary.get('from'), salary.get('to'), salary.get('currency'), item['area']['name'],
+            item['published_at']]
+
+
+def split_window(window: Tuple[str, str]) -> List[Tuple[str, str]]:
+    """
+    Делит временное окно пополам (границы окна включаются в выборку, поэтому половины не пересекаются).
+
+    Args:
+        window (Tuple[str, str]): Начало и конец окна
+
+    Returns:
+        List[Tuple[str, str]]: Две половины окна.
+
+    >>> split_window(('2022-12-07T00:00:00', '2022-12-07T00:00:09'))
+    [('2022-12-07T00:00:00', '2022-12-07T00:00:04'), ('2022-12-07T00:00:05', '2022-12-07T00:00:09')]
+    """
+    start, end = datetime.strptime(window[0], date_format), datetime.strptime(window[1], date_format)
+    middle = start + timedelta(seconds=(end - start).total_seconds() // 2)
+    return [(window[0], middle.strftime(date_format)),
+            ((middle + timedelta(seconds=1)).strftime(date_format), window[1])]
+
+
+class RateLimiter:
+    """
+    Ограничивает частоту запросов из всех потоков.
+
+    Attributes:
+        interval (float): Минимальный интервал между запросами в секундах
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Инициализирует объект RateLimiter.
+
+        Args:
+            rate (float): Количество запросов в секунду (0 - без ограничения)
+        """
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Ждёт, пока можно будет отправить следующий запрос.
+        """
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Harvester:
+    """
+    Выгружает вакансии из API hh.ru. Окно времени, в котором больше 2000 вакансий (предел выдачи API),
+    делится пополам, страницы окон запрашиваются одновременно. Строки окна записываются в файл только
+    после загрузки всех его страниц, а после каждой записи сохраняется контрольная точка
+    со списком незавершённых окон, поэтому прерванную выгрузку можно продолжить. После завершения
+    выгрузки контрольная точка удаляется. Если больше 2000 вакансий опубликовано за одну секунду,
+    окно делить нельзя: выгружаются первые 2000, а о потерянных строках выдаётся предупреждение.
+
+    Attributes:
+        output (str): Выходной csv-файл
+        checkpoint (str): Файл контрольной точки
+        base_url (str): Адрес API
+        params (Dict[str, Any]): Дополнительные параметры запроса (например, specialization)
+        max_workers (int): Количество одновременных запросов
+        batch_size (int): Количество строк, после которого строки записываются в файл
+        limiter (RateLimiter): Ограничение частоты запросов
+        session (requests.Session): Сессия с пулом соединений и повтором запросов
+    """
+
+    def __init__(self, output: str, checkpoint: Optional[str] = None, base_url: str = api_url,
+                 params: Optional[Dict[str, Any]] = None, max_workers: int = 8, rate: float = 10,
+                 batch_size: int = 5000, backoff: float = 0.5) -> None:
+        """
+        Инициализирует объект Harvester.
+
+        Args:
+            output (str): Выходной csv-файл
+            checkpoint (str or None): Файл контрольной точки (по умолчанию - <output>.checkpoint.json)
+            base_url (str): Адрес API
+            params (Dict[str, Any] or None): Дополнительные параметры запроса
+            max_workers (int): Количество одновременных запросов
+            rate (float): Количество запросов в секунду (0 - без ограничения)
+            batch_size (int): Количество строк, после которого строки записываются в файл
+            backoff (float): Пауза перед первым повтором запроса в секундах (удваивается с каждым повтором)
+        """
+        self.output = output
+        self.checkpoint = checkpoint or f'{output}.checkpoint.json'
+        self.base_url = base_url
+        self.params = params or {}
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.limiter = RateLimiter(rate)
+        self.session = requests.Session()
+        retry = Retry(total=5, backoff_factor=backoff, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount(base_url, HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry))
+
+    def get_page(self, window: Tuple[str, str], page: int) -> Dict[str, Any]:
+        """
+        Запрашивает страницу выдачи для временного окна.
+
+        Args:
+            window (Tuple[str, str]): Начало и конец окна
+            page (int): Номер страницы
+
+        Returns:
+            Dict[str, Any]: Ответ API.
+        """
+        self.limiter.wait()
+        response = self.session.get(self.base_url, params={**self.params, 'per_page': per_page, 'page': page,
+                                                           'date_from': window[0], 'date_to': window[1]}, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    def load_checkpoint(self, window: Tuple[str, str]) -> List[Tuple[str, str]]:
+        """
+        Загружает незавершённые окна из контрольной точки (или возвращает всё окно, если её нет).
+
+        Args:
+            window (Tuple[str, str]): Начало и конец всей выгрузки
+
+        Returns:
+            List[Tuple[str, str]]: Незавершённые окна.
+        """
+        if not os.path.exists(self.checkpoint):
+            return [window]
+        with open(self.checkpoint, encoding='utf-8') as file:
+            state = json.load(file)
+        if tuple(state['window']) != window or state['params'] != self.params:
+            raise ValueError(f'Контрольная точка {self.checkpoint} относится к другой выгрузке')
+        return [tuple(remaining) for remaining in state['remaining']]
+
+    def save_checkpoint(self, window: Tuple[str, str], remaining: List[Tuple[str, str]]) -> None:
+        """
+        Сохраняет контрольную точку (через временный файл, чтобы файл не оказался записан наполовину).
+
+        Args:
+            window (Tuple[str, str]): Начало и конец всей выгрузки
+            remaining (List[Tuple[str, str]]): Незавершённые окна
+        """
+        with open(f'{self.checkpoint}.tmp', 'w', encoding='utf-8') as file:
+            json.dump({'window': window, 'params': self.params, 'remaining': remaining}, file)
+        os.replace(f'{self.checkpoint}.tmp', self.checkpoint)
+
+    def run(self, date_from: str, date_to: str) -> int:
+        """
+        Выгружает вакансии, опубликованные между двумя датами. Если есть контрольная точка, выгрузка продолжается
+        (строки дописываются в файл), иначе файл перезаписывается.
+
+        Args:
+            date_from (str): Начало выгрузки в формате 'YYYY-MM-DDTHH:MM:SS'
+            date_to (str): Конец выгрузки в формате 'YYYY-MM-DDTHH:MM:SS'
+
+        Returns:
+            int: Количество записанных строк.
+        """
+        window = (date_from, date_to)
+        is_resumed = os.path.exists(self.checkpoint)
+        remaining = self.load_checkpoint(window)
+        is_new_file = not is_resumed or not os.path.exists(self.output) or os.path.getsize(self.output) == 0
+        count_rows = 0
+        pages, buffer, completed = {}, [], []
+        with open(self.output, 'a' if is_resumed else 'w', encoding='utf-8', newline='') as file, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            writer = csv.writer(file)
+            if is_new_file:
+                writer.writerow(fields)
+
+            def flush() -> None:
+                nonlocal count_rows
+                writer.writerows(buffer)
+                file.flush()
+                count_rows += len(buffer)
+                buffer.clear()
+                for done in completed:
+                    remaining.remove(done)
+                completed.clear()
+                self.save_checkpoint(window, remaining)
+
+            futures = {executor.submit(self.get_page, part, 0): (part, 0) for part in remaining}
+            while len(futures) != 0:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    part, page = futures.pop(future)
+                    data = future.result()
+                    if page == 0:
+                        if data['found'] > max_results and part[0] != part[1]:
+                            remaining.remove(part)
+                            for child in split_window(part):
+                                remaining.append(child)
+                                futures[executor.submit(self.get_page, child, 0)] = (child, 0)
+                            continue
+                        if data['found'] > max_results:
+                            warnings.warn(f'За {part[0]} опубликовано вакансий: {data["found"]}, API выдаёт только '
+                                          f'{max_results}, {data["found"] - max_results} не будут выгружены')
+                        count_pages = max(math.ceil(min(data['found'], max_results) / per_page), 1)
+                        pages[part] = [None] * count_pages
+                        for number in range(1, count_pages):
+                            futures[executor.submit(self.get_page, part, number)] = (part, number)
+                    pages[part][page] = [normalize_vacancy(item) for item in data['items']]
+                    if all(rows is not None for rows in pages[part]):
+                        buffer.extend(chain.from_iterable(pages.pop(part)))
+                        completed.append(part)
+                if len(buffer) >= self.batch_size:
+                    flush()
+            flush()
+        if len(remaining) == 0:
+            os.remove(self.checkpoint)
+        return count_rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Выгрузка вакансий из API hh.ru')
+    parser.add_argument('date_from', help='начало выгрузки (YYYY-MM-DDTHH:MM:SS)')
+    parser.add_argument('date_to', help='конец выгрузки (YYYY-MM-DDTHH:MM:SS)')
+    parser.add_argument('output', help='выходной csv-файл')
+    parser.add_argument('--base-url', default=api_url, help='адрес API (например, hh_mock_server)')
+    parser.add_argument('--specialization', default='1')
+    parser.add_argument('--workers', type=int, default=8, help='количество одновременных запросов')
+    parser.add_argument('--rate', type=float, default=10, help='запросов в секунду (0 - без ограничения)')
+    args = parser.parse_args()
+    start_time = time.perf_counter()
+    harvester = Harvester(args.output, base_url=args.base_url, params={'specialization': args.specialization},
+                          max_workers=args.workers, rate=args.rate)
+    count = harvester.run(args.date_from, args.date_to)
+    seconds = time.perf_counter() - start_time
+    print(f'Записано вакансий: {count} за {seconds:.2f} с ({count / seconds:.0f} вакансий/с)')
@@ -0,0 +1,139 @@
+import argparse, json, math, threading, time
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from typing import Dict, Any
+
+mock_names = ['Программист Python', 'Аналитик', 'Java разработчик', 'Менеджер по продажам', 'Тестировщик']
+mock_areas = ['Москва', 'Санкт-Петербург', 'Екатеринбург', 'Казань', 'Новосибирск']
+mock_currencies = ['RUR', 'RUR', 'RUR', 'USD', 'EUR', 'KZT']
+
+
+def get_mock_vacancy(number: int, published_at: datetime) -> Dict[str, Any]:
+    """
+    Формирует синтетическую вакансию в формате API hh.ru (значения зависят только от номера вакансии).
+
+    Args:
+        number (int): Номер вакансии
+        published_at (datetime): Время публикации
+
+    Returns:
+        Dict[str, Any]: Вакансия.
+    """
+    salary = None if number % 4 == 0 else {'from': 30000 + number % 50 * 1000 if number % 3 else None,
+                                           'to': 60000 + number % 70 * 1000, 'gross': number % 2 == 0,
+                                           'currency': mock_currencies[number % len(mock_currencies)]}
+    return {'id': str(number), 'name': mock_names[number % len(mock_names)], 'salary': salary,
+            'area': {'id': str(number % len(mock_areas)), 'name': mock_areas[number % len(mock_areas)]},
+            'published_at': published_at.strftime('%Y-%m-%dT%H:%M:%S+0300')}
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Локальная замена API hh.ru (/vacancies). Вакансии публикуются равномерно, с заданной частотой,
+    выдача, как и в API, ограничена 2000 вакансиями на запрос.
+
+    Attributes:
+        interval (float): Интервал между публикациями вакансий в секундах
+        delay (float): Задержка перед ответом в секундах (имитация сети)
+        fail_every (int): Каждый fail_every-й запрос завершается ответом 503 (0 - без ошибок)
+        request_count (int): Количество полученных запросов
+    """
+    daemon_threads = True
+    epoch = datetime(2000, 1, 1)
+
+    def __init__(self, address, per_hour: int = 1000, delay: float = 0, fail_every: int = 0) -> None:
+        """
+        Инициализирует объект MockServer.
+
+        Args:
+            address (Tuple[str, int]): Адрес и порт (порт 0 - любой свободный)
+            per_hour (int): Количество вакансий, публикуемых за час
+            delay (float): Задержка перед ответом в секундах
+            fail_every (int): Каждый fail_every-й запрос завершается ответом 503
+        """
+        super().__init__(address, MockHandler)
+        self.interval = 3600 / per_hour
+        self.delay = delay
+        self.fail_every = fail_every
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+    def get_vacancies(self, date_from: str, date_to: str, page: int, per_page: int) -> Dict[str, Any]:
+        """
+        Возвращает страницу вакансий, опубликованных между двумя датами включительно.
+
+        Args:
+            date_from (str): Начало окна в формате 'YYYY-MM-DDTHH:MM:SS'
+            date_to (str): Конец окна в формате 'YYYY-MM-DDTHH:MM:SS'
+            page (int): Номер страницы
+            per_page (int): Количество вакансий на странице
+
+        Returns:
+            Dict[str, Any]: Ответ в формате API.
+        """
+        start = (datetime.fromisoformat(date_from) - self.epoch).total_seconds()
+        end = (datetime.fromisoformat(date_to) - self.epoch).total_seconds()
+        first, last = math.ceil(start / self.interval), math.floor(end / self.interval)
+        found = max(last - first + 1, 0)
+        numbers = range(first + page * per_page, min(first + (page + 1) * per_page, last + 1))
+        items = [get_mock_vacancy(number, self.epoch + timedelta(seconds=int(number * self.interval)))
+                 for number in numbers]
+        return {'items': items, 'found': found, 'pages': math.ceil(min(found, 2000) / per_page), 'page': page,
+                'per_page': per_page}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов /vacancies?date_from=...&date_to=...&page=...&per_page=....
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """
+        Отвечает на запрос вакансий.
+        """
+        with self.server.lock:
+            self.server.request_count += 1
+            number = self.server.request_count
+        time.sleep(self.server.delay)
+        query = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        page, per_page = int(query.get('page', 0)), int(query.get('per_page', 20))
+        if self.server.fail_every != 0 and number % self.server.fail_every == 0:
+            self.send_json(503, {'errors': [{'type': 'service_unavailable'}]})
+        elif 'date_from' not in query or 'date_to' not in query or (page + 1) * per_page > 2000:
+            self.send_json(400, {'errors': [{'type': 'bad_argument'}]})
+        else:
+            self.send_json(200, self.server.get_vacancies(query['date_from'], query['date_to'], page, per_page))
+
+    def send_json(self, status: int, content: Dict[str, Any]) -> None:
+        """
+        Отправляет ответ в формате JSON, не закрывая соединение.
+
+        Args:
+            status (int): Код ответа
+            content (Dict[str, Any]): Тело ответа
+        """
+        body = json.dumps(content, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """
+        Отключает журнал запросов.
+        """
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Локальный сервер, имитирующий API вакансий hh.ru')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--per-hour', type=int, default=1000, help='вакансий, публикуемых за час')
+    parser.add_argument('--delay', type=float, default=0, help='задержка ответа в секундах')
+    parser.add_argument('--fail-every', type=int, default=0, help='каждый N-й запрос отвечает 503')
+    args = parser.parse_args()
+    server = MockServer(('127.0.0.1', args.port), args.per_hour, args.delay, args.fail_every)
+    print(f'http://127.0.0.1:{server.server_address[1]}/vacancies')
+    server.serve_forever()
@@ -1,10 +1,16 @@
-import csv, re, os
-from typing import List, Dict, Tuple
+import csv, io, re, os, sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Tuple, Iterator, Optional
 from cProfile import Profile
 from pstats import Stats
-from vacancy import InputConnect
-from statistic import Report, get_statistic, get_salary_level, get_count_vacancies, print_statistic
-from Task322 import get_stat_by_year
+from vacancy import InputConnect, parse_published_at
+from statistic import Report, StatisticAccumulator
+from vacancy_table import VacancyTable
+from dataset_cache import load_table, save_table, clear_cache
+from csv_splitter import split_csv, read_range
 
 prof = Profile()
 prof.disable()
@@ -16,19 +22,73 @@ class DataSet:
 
     Attributes:
         file_name (str): Название файла.
-        vacancies_objects (List[Vacancy]): Сформированный список вакансий.
+        lazy (bool): Потоковый режим чтения файла.
+        chunk_size (int): Количество строк файла, обрабатываемых за один раз.
+        workers (int): Количество процессов, разбирающих файл.
+        vocabularies (Dict[str, Dict[str, str]]): Словари значений повторяющихся полей (interned_fields,
+            а без потокового режима - ещё и названий вакансий и компаний): одинаковые значения всех вакансий
+            ссылаются на один объект строки.
+        vacancies_objects (List[Vacancy] or DataSet): Сформированный список вакансий
+            (в потоковом режиме - сам объект DataSet, по которому можно многократно итерироваться).
 
     """
 
-    def __init__(self, file_name: str) -> None:
+    def __init__(self, file_name: str, lazy: bool = False, chunk_size: int = 10000, workers: int = 1) -> None:
         """
         Инициализирует объект DataSet.
 
         Args:
             file_name (str): Имя файла.
+            lazy (bool): Потоковый режим: вакансии не хранятся в памяти, а читаются из файла при каждом обходе.
+            chunk_size (int): Количество строк файла, обрабатываемых за один раз.
+            workers (int): Количество процессов, разбирающих файл (1 - разбор в текущем процессе).
+                Файл делится на диапазоны байтов по границам записей, вакансии возвращаются в порядке следования в файле.
         """
         self.file_name = file_name
-        self.vacancies_objects = [Vacancy(vac) for vac in self.csv_filer(*self.csv_reader(file_name))]
+        self.lazy = lazy
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self._count = None
+        self.vocabularies = {field: {} for field in interned_fields + ([] if lazy else ['name', 'employer_name'])}
+        self.vacancies_objects = self if lazy else list(self.iter_vacancies())
+
+    def __iter__(self) -> Iterator['Vacancy']:
+        """
+        Возвращает итератор по вакансиям (в потоковом режиме файл читается заново).
+
+        Returns:
+            Iterator[Vacancy]: Итератор по вакансиям.
+        """
+        return self.iter_vacancies() if self.lazy else iter(self.vacancies_objects)
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий. В потоковом режиме считается за один проход по файлу.
+
+        Returns:
+            int: Количество вакансий.
+        """
+        if not self.lazy:
+            return len(self.vacancies_objects)
+        if self._count is None:
+            self._count = sum(len(chunk) for chunk in self.iter_chunks())
+        return self._count
+
+    def has_vacancies(self) -> bool:
+        """
+        Проверяет, есть ли в файле хотя бы одна вакансия без пропущенных полей. В потоковом режиме
+        файл читается только до первой такой записи (процессы для разбора не запускаются).
+
+        Returns:
+            bool: Есть ли вакансии.
+        """
+        if not self.lazy:
+            return len(self.vacancies_objects) != 0
+        with open(self.file_name, encoding='utf_8_sig') as file:
+            reader = csv.reader(file)
+            list_naming = next(reader, None)
+            return list_naming is not None and any(len(vac) == len(list_naming) and vac.count('') == 0
+                                                   for vac in reader)
 
     def clean_string(self, raw_html: str) -> str:
         """
@@ -43,8 +103,7 @@ class DataSet:
         >>> DataSet('vacancies.csv').clean_string('<p>Группа компаний «МИАКОМ»</p>')
         'Группа компаний «МИАКОМ»'
         """
-        result = re.sub("<.*?>", '', raw_html)
-        return result if '\n' in raw_html else " ".join(result.split())
+        return clean_html(raw_html)
 
     def csv_reader(self, file_name: str) -> Tuple[List[str], List[List[str]]]:
         """
@@ -56,13 +115,14 @@ class DataSet:
         Returns:
             Tuple[List[str], List[List[str]]]: Название колонок и соответствующие им данные по каждой вакансии.
         """
-        reader = csv.reader(open(file_name, encoding='utf_8_sig'))
-        data_base = [line for line in reader]
+        with open(file_name, encoding='utf_8_sig') as file:
+            data_base = [line for line in csv.reader(file)]
         return data_base[0], data_base[1:]
 
     def csv_filer(self, list_naming: List[str], reader: List[List[str]]) -> List[Dict[str, str]]:
         """
         Преобразует данные в список словарей, где словарь содержит информацию об одной вакансии.
+        Повторяющиеся значения берутся из словарей значений этого DataSet (см. get_vacancy_dicts).
 
         Args:
             list_naming (List[str]): Поля вакансии
@@ -71,8 +131,96 @@ class DataSet:
         Returns:
             List[Dict[str, str]]: Список словарей.
         """
-        new_vacans_list = list(filter(lambda vac: (len(vac) == len(list_naming) and vac.count('') == 0), reader))
-        return [dict(zip(list_naming, map(self.clean_string, vac))) for vac in new_vacans_list]
+        return get_vacancy_dicts(list_naming, reader, self.vocabularies)
+
+    def iter_chunks(self, chunk_size: int = 0) -> Iterator[List['Vacancy']]:
+        """
+        Читает файл порциями, не загружая его целиком в память.
+
+        Args:
+            chunk_size (int): Количество строк файла в одной порции (0 - значение из атрибута chunk_size).
+
+        Returns:
+            Iterator[List[Vacancy]]: Итератор по спискам вакансий одной порции
+                (при разборе в нескольких процессах порция - один диапазон байтов файла).
+        """
+        if self.workers > 1:
+            count = 0
+            for chunk in self.map_ranges(read_vacancies_range):
+                count += len(chunk)
+                yield chunk
+            self._count = count
+            return
+        chunk_size = self.chunk_size if chunk_size == 0 else chunk_size
+        count = 0
+        with open(self.file_name, encoding='utf_8_sig') as file:
+            reader = csv.reader(file)
+            list_naming = next(reader, None)
+            if list_naming is None:
+                self._count = 0
+                return
+            while True:
+                lines = list(islice(reader, chunk_size))
+                if len(lines) == 0:
+                    break
+                chunk = [Vacancy(vac) for vac in self.csv_filer(list_naming, lines)]
+                count += len(chunk)
+                yield chunk
+        self._count = count
+
+    def map_ranges(self, function) -> Iterator:
+        """
+        Делит файл на диапазоны байтов и разбирает их в отдельных процессах. Одновременно в работе
+        не больше двух диапазонов на процесс, результаты возвращаются в порядке следования диапазонов в файле.
+
+        Args:
+            function (Callable[[str, bytes, int, int], Any]): Функция, разбирающая диапазон
+
+        Returns:
+            Iterator: Итератор по результатам разбора диапазонов.
+        """
+        count_ranges = max(self.workers * 4, os.path.getsize(self.file_name) // parallel_range_size)
+        header, ranges = split_csv(self.file_name, count_ranges)
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        futures = deque()
+        try:
+            for start, end in ranges:
+                futures.append(executor.submit(function, self.file_name, header, start, end))
+                if len(futures) >= self.workers * 2:
+                    yield futures.popleft().result()
+            while len(futures) != 0:
+                yield futures.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def to_table(self, use_cache: bool = False, rebuild_cache: bool = False) -> VacancyTable:
+        """
+        Формирует колоночное представление вакансий (в потоковом режиме - без списка объектов Vacancy).
+
+        Args:
+            use_cache (bool): Загружать таблицу из кэша (dataset_cache), а после разбора файла сохранять её туда
+            rebuild_cache (bool): Разобрать файл заново, даже если в кэше есть актуальный снимок
+
+        Returns:
+            VacancyTable: Таблица вакансий.
+        """
+        table = load_table(self.file_name) if use_cache and not rebuild_cache else None
+        if table is None:
+            table = VacancyTable.concat(list(self.map_ranges(read_table_range))) if self.workers > 1 else \
+                VacancyTable.from_vacancies(self)
+            if use_cache:
+                save_table(self.file_name, table)
+        return table
+
+    def iter_vacancies(self) -> Iterator['Vacancy']:
+        """
+        Потоково возвращает вакансии из файла.
+
+        Returns:
+            Iterator[Vacancy]: Итератор по вакансиям.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk
 
 
 class Vacancy:
@@ -89,7 +237,13 @@ class Vacancy:
         salary (Salary): Информация о зарплате
         area_name (str): Название города
         published_at (str): Дата публикации вакансии
+        published_ts (int): Время публикации в секундах от начала эпохи
+        year (int): Год публикации
+        month (int): Месяц публикации
+        day (int): День публикации
     """
+    __slots__ = ('name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name', 'salary',
+                 'area_name', 'published_at', 'published_ts', 'year', 'month', 'day')
 
     def __init__(self, dict_vac: Dict[str, str]):
         """
@@ -108,6 +262,26 @@ class Vacancy:
         self.salary = Salary(dict_vac['salary_from'], dict_vac['salary_to'], salary_gross, dict_vac['salary_currency'])
         self.area_name = dict_vac['area_name']
         self.published_at = dict_vac['published_at']
+        self.published_ts, self.year, self.month, self.day = parse_published_at(self.published_at)
+
+    def __getstate__(self) -> tuple:
+        """
+        Возвращает значения полей для pickle (вакансии передаются из процессов, разбирающих файл).
+
+        Returns:
+            tuple: Значения полей в порядке __slots__.
+        """
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Восстанавливает поля из значений, полученных через pickle.
+
+        Args:
+            state (tuple): Значения полей в порядке __slots__
+        """
+        for field, value in zip(self.__slots__, state):
+            setattr(self, field, value)
 
 
 class Salary:
@@ -115,26 +289,34 @@ class Salary:
     Класс для представления зарплаты.
 
     Attributes:
-        salary_from (str): Нижняя граница зарплаты
-        salary_to (str): Верхняя граница зарплаты
+        salary_from (float): Нижняя граница зарплаты
+        salary_to (float): Верхняя граница зарплаты
         salary_gross (str): Наличие налогов
         salary_currency (str): Валюта оклада
+        salary_rub (float): Средняя зарплата в рублях (None, если курс валюты неизвестен)
 
     """
+    __slots__ = ('salary_from', 'salary_to', 'salary_gross', 'salary_currency', 'salary_rub')
 
     def __init__(self, salary_from, salary_to, salary_gross, salary_currency):
         """
-        Инициализирует объект Salary
+        Инициализирует объект Salary. Границы зарплаты переводятся в числа один раз, при создании объекта.
+
         Args:
-            salary_from (str): Нижняя граница зарплаты
-            salary_to (str): Верхняя граница зарплаты
+            salary_from (str or float): Нижняя граница зарплаты
+            salary_to (str or float): Верхняя граница зарплаты
             salary_gross (str): Наличие налогов
             salary_currency (str): Валюта оклада
         """
-        self.salary_from = salary_from
-        self.salary_to = salary_to
+        self.salary_from = float(salary_from)
+        self.salary_to = float(salary_to)
         self.salary_gross = salary_gross
         self.salary_currency = salary_currency
+        self.salary_rub = None if salary_currency not in currency_to_rub else \
+            self.to_RUB(self.salary_from + self.salary_to) / 2
+
+    __getstate__ = Vacancy.__getstate__
+    __setstate__ = Vacancy.__setstate__
 
     def to_RUB(self, salary: float) -> float:
         """
@@ -163,6 +345,108 @@ class Salary:
         return float(salary * currency_to_rub[self.salary_currency])
 
 
+def read_vacancies_range(file_name: str, header: bytes, start: int, end: int) -> List[Vacancy]:
+    """
+    Разбирает диапазон байтов файла в список вакансий (выполняется в процессе-обработчике).
+
+    Args:
+        file_name (str): Название файла
+        header (bytes): Строка заголовка файла
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+
+    Returns:
+        List[Vacancy]: Вакансии диапазона.
+    """
+    with io.TextIOWrapper(io.BytesIO(header + read_range(file_name, start, end)), encoding='utf-8') as file:
+        reader = csv.reader(file)
+        list_naming = next(reader)
+        vocabularies = {field: {} for field in interned_fields}
+        return [Vacancy(vac) for vac in get_vacancy_dicts(list_naming, list(reader), vocabularies)]
+
+
+def read_table_range(file_name: str, header: bytes, start: int, end: int) -> VacancyTable:
+    """
+    Разбирает диапазон байтов файла в таблицу вакансий (выполняется в процессе-обработчике).
+    Передать в основной процесс таблицу дешевле, чем список объектов Vacancy.
+
+    Args:
+        file_name (str): Название файла
+        header (bytes): Строка заголовка файла
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+
+    Returns:
+        VacancyTable: Таблица вакансий диапазона.
+    """
+    return VacancyTable.from_vacancies(read_vacancies_range(file_name, header, start, end))
+
+
+parallel_range_size = 1 << 23
+
+interned_fields = ['experience_id', 'premium', 'salary_gross', 'salary_currency', 'area_name']
+
+html_fields = ['name', 'description', 'key_skills', 'employer_name']
+
+html_tag = re.compile('<.*?>')
+extra_spaces = re.compile(r'\s\s|[^\S ]|^\s|\s$')
+
+
+def get_vacancy_dicts(list_naming: List[str], reader: List[List[str]],
+                      vocabularies: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Преобразует строки файла в список словарей, где словарь содержит информацию об одной вакансии.
+    Строки с пропущенными полями отбрасываются. От HTML кода очищаются только текстовые поля (html_fields).
+    Значения полей, для которых есть словарь значений, заменяются на общие строки из него,
+    поэтому каждое значение хранится в памяти один раз, а его хэш при поиске в translation считается один раз.
+
+    Args:
+        list_naming (List[str]): Поля вакансии
+        reader (List[List[str]]): Данные из файла
+        vocabularies (Dict[str, Dict[str, str]]): Словари значений по полям (пополняются)
+
+    Returns:
+        List[Dict[str, str]]: Список словарей.
+    """
+    cleaners = [(i, clean_html if field == 'description' else clean_short_html)
+                for i, field in enumerate(list_naming) if field in html_fields]
+    shared = [(i, vocabularies[field]) for i, field in enumerate(list_naming) if field in vocabularies]
+    new_vacans_list = list(filter(lambda vac: (len(vac) == len(list_naming) and vac.count('') == 0), reader))
+    for vac in new_vacans_list:
+        for i, cleaner in cleaners:
+            vac[i] = cleaner(vac[i])
+        for i, vocabulary in shared:
+            vac[i] = vocabulary.setdefault(vac[i], vac[i])
+    return [dict(zip(list_naming, vac)) for vac in new_vacans_list]
+
+
+def clean_html(raw_html: str) -> str:
+    """
+    Очищает строку от HTML кода и лишних пробелов (в многострочных строках пробелы сохраняются).
+    Строки без тегов и без лишних пробелов возвращаются без изменений.
+
+    Args:
+        raw_html (str): Строка, которую нужно очистить
+
+    Returns:
+        str: Очищенная строка.
+
+    >>> clean_html('<p>Группа   компаний «МИАКОМ»</p>')
+    'Группа компаний «МИАКОМ»'
+    >>> clean_html('Python\\nSQL')
+    'Python\\nSQL'
+    """
+    if '<' in raw_html:
+        result = html_tag.sub('', raw_html)
+    elif '\n' in raw_html or extra_spaces.search(raw_html) is None:
+        return raw_html
+    else:
+        result = raw_html
+    return result if '\n' in raw_html else " ".join(result.split())
+
+
+clean_short_html = lru_cache(maxsize=65536)(clean_html)
+
 currency_to_rub = {"AZN": 35.68,
                    "BYR": 23.91,
                    "EUR": 59.90,
@@ -248,46 +532,57 @@ def exit_from_file(message: str):
     exit()
 
 
+def get_option(name: str, argv: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Возвращает значение параметра командной строки. Если после параметра нет значения,
+    программа завершается с сообщением.
+
+    Args:
+        name (str): Название параметра (например, '--export')
+        argv (List[str] or None): Аргументы командной строки (по умолчанию - sys.argv)
+
+    Returns:
+        str or None: Значение параметра (None, если параметр не задан).
+    """
+    argv = sys.argv if argv is None else argv
+    if name not in argv:
+        return None
+    index = argv.index(name) + 1
+    if index == len(argv) or argv[index].startswith('--'):
+        exit_from_file(f'Не задано значение параметра {name}')
+    return argv[index]
+
+
 if __name__ == '__main__':
+    if '--clear-cache' in sys.argv:
+        clear_cache()
     type_output = input('Введите данные для печати: ')
     file_name = input('Введите название файла: ')
     if os.stat(file_name).st_size == 0:
         exit_from_file('Пустой файл')
+    workers = get_option('--workers') or '1'
+    if not workers.isdigit() or int(workers) < 1:
+        exit_from_file('Количество процессов задано некорректно')
     prof.enable()
-    data = DataSet(file_name)
+    data = DataSet(file_name, lazy=True, workers=int(workers))
     prof.disable()
-    if len(data.vacancies_objects) == 0:
+    if not data.has_vacancies():
         exit_from_file('Нет данных')
     if type_output == 'Статистика':
         vacancy_name = input('Введите название профессии: ')
         prof.enable()
-        for vac in data.vacancies_objects:
-            vac.published_at = get_year(vac.published_at)
-        dict_cities = {}
-        for vac in data.vacancies_objects:
-            if vac.area_name not in dict_cities.keys():
-                dict_cities[vac.area_name] = 0
-            dict_cities[vac.area_name] += 1
-        needed_vacancies_objects = list(
-            filter(lambda vac: int(len(data.vacancies_objects) * 0.01) <= dict_cities[vac.area_name],
-                   data.vacancies_objects))
         rp = Report()
-        stat_by_years = get_stat_by_year(file_name, vacancy_name)
-        print('Динамика уровня зарплат по годам:', stat_by_years[0])
-        print('Динамика уровня зарплат по годам для выбранной профессии:', stat_by_years[1])
-        print('Динамика количества вакансий по годам:', stat_by_years[2])
-        print('Динамика количества вакансий по годам для выбранной профессии:', stat_by_years[3])
-        list_statistic = [stat_by_years[0],
-                          stat_by_years[1],
-                          stat_by_years[2],
-                          stat_by_years[3],
-                          print_statistic(get_salary_level(needed_vacancies_objects, 'area_name').items(), 1,
-                                          'Уровень зарплат по городам (в порядке убывания): ', True, 10),
-                          print_statistic(get_count_vacancies(needed_vacancies_objects, 'area_name', data).items(), 1,
-                                          'Доля вакансий по городам (в порядке убывания): ', True, 10)]
-        rp.generate_excel(vacancy_name, list_statistic)
-        rp.generate_image(vacancy_name, list_statistic)
-        rp.generate_pdf(vacancy_name)
+        table = data.to_table(use_cache=True, rebuild_cache='--rebuild-cache' in sys.argv)
+        list_statistic = StatisticAccumulator(vacancy_name).update_table(table).get_statistics()
+        messages = ['Динамика уровня зарплат по годам:',
+                    'Динамика уровня зарплат по годам для выбранной профессии:',
+                    'Динамика количества вакансий по годам:',
+                    'Динамика количества вакансий по годам для выбранной профессии:',
+                    'Уровень зарплат по городам (в порядке убывания):',
+                    'Доля вакансий по городам (в порядке убывания):']
+        for message, statistic in zip(messages, list_statistic):
+            print(message, statistic)
+        rp.generate(vacancy_name, list_statistic)
         prof.disable()
     elif type_output == 'Вакансии':
         parameter = input('Введите параметр фильтрации: ')
@@ -298,7 +593,14 @@ if __name__ == '__main__':
         prof.enable()
         outer = InputConnect(parameter, sorting_param, is_reversed_sort, interval, columns)
         outer.check_parameters()
-        outer.print_vacancies(data.vacancies_objects)
+        export_file = get_option('--export')
+        if export_file is not None:
+            outer.export_excel(data, export_file)
+        else:
+            page_size = get_option('--page-size') or '0'
+            if not page_size.isdigit():
+                exit_from_file('Размер страницы задан некорректно')
+            outer.print_vacancies(data, int(page_size))
         prof.disable()
     prof.dump_stats('async')
     with open('async_stats.txt', 'wt') as _output:
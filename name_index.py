@@ -0,0 +1,195 @@
+import re
+from typing import List, Dict, Set, Iterable, Optional
+import numpy as np
+
+match_modes = ['exact', 'substring', 'token']
+default_mode = 'substring'
+token_pattern = re.compile(r'\w+')
+
+
+def check_mode(mode: str) -> None:
+    """
+    Проверяет название способа сравнения названий профессий.
+
+    Args:
+        mode (str): Способ сравнения
+    """
+    if mode not in match_modes:
+        raise ValueError(f'Неизвестный способ сравнения названий: {mode}')
+
+
+def get_tokens(text: str) -> List[str]:
+    """
+    Разбивает название на слова (без учёта регистра).
+
+    Args:
+        text (str): Название
+
+    Returns:
+        List[str]: Слова названия.
+
+    >>> get_tokens('Программист C++ (Senior)')
+    ['программист', 'c', 'senior']
+    """
+    return token_pattern.findall(text.casefold())
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """
+    Возвращает все подстроки длины 3.
+
+    Args:
+        text (str): Название
+
+    Returns:
+        Set[str]: Триграммы названия.
+
+    >>> sorted(get_trigrams('Java'))
+    ['Jav', 'ava']
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def matches(query: str, name: str, mode: str = default_mode) -> bool:
+    """
+    Проверяет, подходит ли название вакансии под запрос (для обработки вакансий по одной).
+
+    Args:
+        query (str): Название профессии из запроса
+        name (str): Название вакансии
+        mode (str): Способ сравнения: 'exact' - совпадение, 'substring' - подстрока,
+            'token' - все слова запроса есть в названии (без учёта регистра)
+
+    Returns:
+        bool: True, если название подходит.
+
+    >>> [matches('python', 'Программист Python', mode) for mode in match_modes]
+    [False, False, True]
+    """
+    if mode == 'exact':
+        return query == name
+    if mode == 'substring':
+        return query in name
+    check_mode(mode)
+    return set(get_tokens(query)) <= set(get_tokens(name))
+
+
+class NameIndex:
+    """
+    Индекс по уникальным названиям вакансий: словарь названий, инвертированный индекс слов и индекс триграмм.
+    Запрос проверяется только для названий-кандидатов из индекса, а строки с подходящими названиями
+    находятся по спискам строк каждого названия, поэтому время ответа не зависит от числа вакансий.
+    Результаты запросов кэшируются, так что отчёты по многим профессиям не пересчитывают совпадения.
+
+    Attributes:
+        names (List[str]): Уникальные названия (индекс названия - его код)
+        codes (np.ndarray or None): Коды названий по строкам
+        positions (Dict[str, int]): Код каждого названия
+        tokens (Dict[str, List[int]]): Коды названий, содержащих слово
+        trigrams (Dict[str, List[int]]): Коды названий, содержащих триграмму
+    """
+
+    def __init__(self, names: Iterable[str], codes: Optional[np.ndarray] = None) -> None:
+        """
+        Инициализирует объект NameIndex.
+
+        Args:
+            names (Iterable[str]): Уникальные названия
+            codes (np.ndarray or None): Коды названий по строкам (нужны для mask и rows)
+        """
+        self.names = list(names)
+        self.codes = codes
+        self.positions = {name: code for code, name in enumerate(self.names)}
+        self.tokens = {}
+        self.trigrams = {}
+        for code, name in enumerate(self.names):
+            for token in set(get_tokens(name)):
+                self.tokens.setdefault(token, []).append(code)
+            for trigram in get_trigrams(name):
+                self.trigrams.setdefault(trigram, []).append(code)
+        self.cache = {}
+        self.order = None
+        self.bounds = None
+
+    def get_candidates(self, postings: Dict[str, List[int]], keys: Set[str]) -> Set[int]:
+        """
+        Пересекает списки кодов по ключам запроса, начиная с самого короткого.
+
+        Args:
+            postings (Dict[str, List[int]]): Инвертированный индекс
+            keys (Set[str]): Слова или триграммы запроса
+
+        Returns:
+            Set[int]: Коды названий, содержащих все ключи.
+        """
+        lists = sorted((postings.get(key, []) for key in keys), key=len)
+        candidates = set(lists[0])
+        for codes in lists[1:]:
+            if len(candidates) == 0:
+                break
+            candidates.intersection_update(codes)
+        return candidates
+
+    def match(self, query: str, mode: str = default_mode) -> np.ndarray:
+        """
+        Находит коды названий, подходящих под запрос.
+
+        Args:
+            query (str): Название профессии из запроса
+            mode (str): Способ сравнения (см. matches)
+
+        Returns:
+            np.ndarray: Отсортированные коды подходящих названий.
+        """
+        key = (query, mode)
+        if key in self.cache:
+            return self.cache[key]
+        check_mode(mode)
+        if mode == 'exact':
+            found = [self.positions[query]] if query in self.positions else []
+        elif mode == 'token':
+            tokens = set(get_tokens(query))
+            found = self.get_candidates(self.tokens, tokens) if len(tokens) != 0 else range(len(self.names))
+        elif len(query) < 3:
+            found = [code for code, name in enumerate(self.names) if query in name]
+        else:
+            found = [code for code in self.get_candidates(self.trigrams, get_trigrams(query))
+                     if query in self.names[code]]
+        result = np.array(sorted(found), dtype=np.int64)
+        self.cache[key] = result
+        return result
+
+    def mask(self, query: str, mode: str = default_mode) -> np.ndarray:
+        """
+        Возвращает маску строк с подходящими названиями.
+
+        Args:
+            query (str): Название профессии из запроса
+            mode (str): Способ сравнения
+
+        Returns:
+            np.ndarray: Булева маска строк.
+        """
+        lookup = np.zeros(len(self.names), dtype=bool)
+        lookup[self.match(query, mode)] = True
+        return lookup[self.codes]
+
+    def rows(self, query: str, mode: str = default_mode) -> np.ndarray:
+        """
+        Возвращает номера строк с подходящими названиями. Списки строк каждого названия
+        строятся одной сортировкой кодов при первом обращении.
+
+        Args:
+            query (str): Название профессии из запроса
+            mode (str): Способ сравнения
+
+        Returns:
+            np.ndarray: Номера строк по возрастанию.
+        """
+        if self.order is None:
+            self.order = np.argsort(self.codes, kind='stable')
+            self.bounds = np.concatenate([[0], np.cumsum(np.bincount(self.codes, minlength=len(self.names)))])
+        found = self.match(query, mode)
+        if len(found) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate([self.order[self.bounds[code]:self.bounds[code + 1]] for code in found]))
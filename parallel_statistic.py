@@ -0,0 +1,175 @@
+import heapq, io, math, os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional
+import pandas as pd
+from csv_splitter import split_csv, read_range
+from dataset_cache import cache_directory, load_csv
+from name_index import NameIndex, default_mode
+
+min_range_size = 1 << 20
+
+
+def get_partial_statistics(file_name: str, header: bytes, start: int, end: int, vacancy: str,
+                           area_name: Optional[str] = None, mode: str = default_mode) -> Dict[str, Any]:
+    """
+    Считает частичные суммы по одному диапазону байтов файла (выполняется в процессе-обработчике).
+
+    Args:
+        file_name (str): Название файла
+        header (bytes): Строка заголовка файла
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+        vacancy (str): Название вакансии
+        area_name (str or None): Название региона (если задано, статистика по профессии считается только для него)
+        mode (str): Способ сравнения названий (см. name_index.matches)
+
+    Returns:
+        Dict[str, Any]: Количество вакансий и частичные суммы по годам и городам.
+            По году: [сумма зарплат, число зарплат, число вакансий, то же для выбранной профессии].
+            По городу: [сумма зарплат, число зарплат, число вакансий].
+    """
+    return get_frame_statistics(pd.read_csv(io.BytesIO(header + read_range(file_name, start, end))), vacancy,
+                                area_name, mode)
+
+
+def get_frame_statistics(df: pd.DataFrame, vacancy: str, area_name: Optional[str] = None,
+                         mode: str = default_mode) -> Dict[str, Any]:
+    """
+    Считает суммы по годам и городам для вакансий из DataFrame.
+
+    Args:
+        df (pd.DataFrame): Вакансии
+        vacancy (str): Название вакансии
+        area_name (str or None): Название региона (если задано, статистика по профессии считается только для него)
+        mode (str): Способ сравнения названий (см. name_index.matches)
+
+    Returns:
+        Dict[str, Any]: Количество вакансий и суммы по годам и городам (как у get_partial_statistics).
+    """
+    salary = df[['salary_from', 'salary_to']].mean(axis=1)
+    names = df['name'].fillna('').astype('category')
+    is_needed = pd.Series(NameIndex(names.cat.categories, names.cat.codes.to_numpy()).mask(vacancy, mode), df.index)
+    if area_name is not None:
+        is_needed &= df['area_name'] == area_name
+    frame = pd.DataFrame({'year': df['published_at'].str[:4].astype(int), 'city': df['area_name'],
+                          'salary': salary, 'needed_salary': salary.where(is_needed), 'is_needed': is_needed})
+    by_years = frame.groupby('year', sort=False)
+    by_years = pd.concat([by_years['salary'].sum(), by_years['salary'].count(), by_years.size(),
+                          by_years['needed_salary'].sum(), by_years['needed_salary'].count(),
+                          by_years['is_needed'].sum()], axis=1)
+    by_cities = frame.groupby('city', sort=False)['salary']
+    by_cities = pd.concat([by_cities.sum(), by_cities.count(), by_cities.size()], axis=1)
+    return {'count': len(df),
+            'years': dict(zip(by_years.index.tolist(), by_years.to_numpy().tolist())),
+            'cities': dict(zip(by_cities.index.tolist(), by_cities.to_numpy().tolist()))}
+
+
+def merge_partial_statistics(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Объединяет частичные суммы диапазонов. Диапазоны передаются в порядке следования в файле,
+    поэтому годы и города остаются в порядке первого появления.
+
+    Args:
+        partials (List[Dict[str, Any]]): Частичные суммы диапазонов
+
+    Returns:
+        Dict[str, Any]: Суммы по всему файлу.
+    """
+    result = {'count': 0, 'years': {}, 'cities': {}}
+    for part in partials:
+        result['count'] += part['count']
+        for field in ['years', 'cities']:
+            for key, values in part[field].items():
+                if key not in result[field]:
+                    result[field][key] = [0] * len(values)
+                result[field][key] = [total + value for total, value in zip(result[field][key], values)]
+    return result
+
+
+def aggregate_file(file_name: str, vacancy: str, area_name: Optional[str] = None,
+                   max_workers: Optional[int] = None, mode: str = default_mode, use_cache: bool = False,
+                   directory: str = cache_directory) -> Dict[str, Any]:
+    """
+    Делит файл на диапазоны байтов, считает частичные суммы в отдельных процессах и объединяет их.
+    Промежуточные файлы не создаются: каждый процесс сам читает свой диапазон.
+    Если разрешён кэш и в нём уже есть снимок DataFrame файла (python dataset_cache.py --rebuild FILE),
+    суммы считаются по снимку в текущем процессе без разбора файла; иначе файл разбирается по диапазонам.
+
+    Args:
+        file_name (str): Название файла
+        vacancy (str): Название вакансии
+        area_name (str or None): Название региона
+        max_workers (int or None): Количество процессов (по умолчанию - количество ядер)
+        mode (str): Способ сравнения названий
+        use_cache (bool): Использовать снимок файла из кэша (dataset_cache), если он есть
+        directory (str): Папка кэша
+
+    Returns:
+        Dict[str, Any]: Суммы по всему файлу.
+    """
+    df = load_csv(file_name, directory) if use_cache else None
+    if df is not None:
+        return merge_partial_statistics([get_frame_statistics(df, vacancy, area_name, mode)])
+    workers = max_workers or os.cpu_count() or 1
+    count_ranges = max(min(workers * 4, os.path.getsize(file_name) // min_range_size), 1)
+    header, ranges = split_csv(file_name, count_ranges)
+    if len(ranges) <= 1:
+        return merge_partial_statistics([get_partial_statistics(file_name, header, start, end, vacancy, area_name, mode)
+                                         for start, end in ranges])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(partial(get_partial_statistics, file_name, header, vacancy=vacancy,
+                                        area_name=area_name, mode=mode), *zip(*ranges))
+        return merge_partial_statistics(list(partials))
+
+
+def get_mean(total: float, count: int) -> Any:
+    """
+    Возвращает среднее значение, округлённое вниз, или NaN, если значений нет.
+
+    Args:
+        total (float): Сумма значений
+        count (int): Количество значений
+
+    Returns:
+        int or float: Среднее значение.
+    """
+    return int(total / count) if count != 0 else math.nan
+
+
+def get_statistics_by_years(aggregate: Dict[str, Any]) -> List[Dict[int, Any]]:
+    """
+    Возвращает статистики по годам.
+
+    Args:
+        aggregate (Dict[str, Any]): Суммы по всему файлу (результат aggregate_file)
+
+    Returns:
+        List[Dict[int, Any]]: Уровень зарплат, уровень зарплат для профессии,
+            количество вакансий и количество вакансий для профессии по годам.
+    """
+    years = aggregate['years']
+    return [{year: get_mean(values[0], values[1]) for year, values in years.items()},
+            {year: get_mean(values[3], values[4]) for year, values in years.items()},
+            {year: int(values[2]) for year, values in years.items()},
+            {year: int(values[5]) for year, values in years.items()}]
+
+
+def get_statistics_by_cities(aggregate: Dict[str, Any], slice: int = 10) -> List[Dict[str, Any]]:
+    """
+    Возвращает статистики по городам, в которых не меньше 1% вакансий.
+
+    Args:
+        aggregate (Dict[str, Any]): Суммы по всему файлу (результат aggregate_file)
+        slice (int): Количество городов в статистике
+
+    Returns:
+        List[Dict[str, Any]]: Уровень зарплат и доля вакансий по городам (в порядке убывания).
+    """
+    cities = {city: values for city, values in aggregate['cities'].items()
+              if values[2] >= aggregate['count'] * 0.01}
+    count = sum(values[2] for values in cities.values())
+    salary_by_cities = {city: get_mean(values[0], values[1]) for city, values in cities.items()}
+    share_by_cities = {city: round(values[2] / count, 4) for city, values in cities.items()}
+    return [dict(heapq.nlargest(slice, salary_by_cities.items(), key=lambda x: x[1])),
+            dict(heapq.nlargest(slice, share_by_cities.items(), key=lambda x: x[1]))]
@@ -0,0 +1,148 @@
+from typing import List, Dict, Any, Iterable, Optional
+import numpy as np
+
+
+class SkillIndex:
+    """
+    Индекс по ключевым навыкам: каждый навык получает целочисленный номер, навыки вакансии хранятся
+    отсортированным массивом номеров (все вакансии - в одном массиве со смещениями), а для каждого навыка
+    хранится список вакансий (posting list). Поиск вакансий с несколькими навыками - пересечение списков.
+
+    Attributes:
+        skills (List[str]): Навыки (индекс навыка - его номер)
+        ids (Dict[str, int]): Номера навыков
+        offsets (np.ndarray): Смещения навыков каждой вакансии в skill_ids (последний элемент - длина skill_ids)
+        skill_ids (np.ndarray): Номера навыков вакансий
+        entry_rows (np.ndarray): Номер вакансии для каждого элемента skill_ids
+        posting_offsets (np.ndarray): Смещения списка вакансий каждого навыка в posting_rows
+        posting_rows (np.ndarray): Номера вакансий, сгруппированные по навыкам (внутри навыка - по возрастанию)
+    """
+
+    def __init__(self, key_skills: Iterable[Any]) -> None:
+        """
+        Инициализирует объект SkillIndex.
+
+        Args:
+            key_skills (Iterable[List[str]]): Навыки каждой вакансии (строка вместо списка - один навык)
+        """
+        self.ids = {}
+        lengths, skill_ids = [], []
+        for skills in key_skills:
+            row_ids = sorted({self.ids.setdefault(skill, len(self.ids))
+                              for skill in ([skills] if isinstance(skills, str) else skills)})
+            lengths.append(len(row_ids))
+            skill_ids.extend(row_ids)
+        self.skills = list(self.ids)
+        self.offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        self.skill_ids = np.array(skill_ids, dtype=np.int32)
+        self.entry_rows = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+        order = np.argsort(self.skill_ids, kind='stable')
+        self.posting_rows = self.entry_rows[order]
+        self.posting_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(self.skill_ids, minlength=len(self.skills)), dtype=np.int64)])
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в индексе.
+
+        Returns:
+            int: Количество вакансий.
+        """
+        return len(self.offsets) - 1
+
+    def get_skills(self, row: int) -> List[str]:
+        """
+        Возвращает навыки вакансии (в порядке номеров навыков).
+
+        Args:
+            row (int): Номер вакансии
+
+        Returns:
+            List[str]: Навыки вакансии.
+        """
+        return [self.skills[skill_id] for skill_id in self.skill_ids[self.offsets[row]:self.offsets[row + 1]].tolist()]
+
+    def get_postings(self, skill: str) -> np.ndarray:
+        """
+        Возвращает вакансии с навыком.
+
+        Args:
+            skill (str): Навык
+
+        Returns:
+            np.ndarray: Номера вакансий по возрастанию.
+        """
+        if skill not in self.ids:
+            return np.zeros(0, dtype=np.int32)
+        skill_id = self.ids[skill]
+        return self.posting_rows[self.posting_offsets[skill_id]:self.posting_offsets[skill_id + 1]]
+
+    def rows(self, skills: List[str]) -> np.ndarray:
+        """
+        Возвращает вакансии, у которых есть все навыки. Списки пересекаются от самого короткого.
+
+        Args:
+            skills (List[str]): Навыки
+
+        Returns:
+            np.ndarray: Номера вакансий по возрастанию.
+        """
+        postings = sorted((self.get_postings(skill) for skill in skills), key=len)
+        if len(postings) == 0:
+            return np.arange(len(self), dtype=np.int32)
+        rows = postings[0]
+        for posting in postings[1:]:
+            if len(rows) == 0:
+                break
+            rows = np.intersect1d(rows, posting, assume_unique=True)
+        return rows
+
+    def count(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Считает, у скольких вакансий есть каждый навык.
+
+        Args:
+            rows (np.ndarray or None): Учитываемые вакансии - номера или булева маска (None - все)
+
+        Returns:
+            np.ndarray: Количество вакансий по номерам навыков.
+        """
+        skill_ids = self.skill_ids
+        if rows is not None:
+            selected = rows if rows.dtype == bool else np.isin(np.arange(len(self)), rows)
+            skill_ids = skill_ids[selected[self.entry_rows]]
+        return np.bincount(skill_ids, minlength=len(self.skills))
+
+    def get_top(self, counts: np.ndarray, limit: int = 10) -> Dict[str, int]:
+        """
+        Выбирает самые частые навыки (при равенстве - в порядке первого появления).
+
+        Args:
+            counts (np.ndarray): Количество вакансий по номерам навыков (count)
+            limit (int): Количество навыков
+
+        Returns:
+            Dict[str, int]: Навыки и количество вакансий с ними в порядке убывания.
+        """
+        order = np.argsort(-counts, kind='stable')[:limit]
+        return {self.skills[skill_id]: int(counts[skill_id]) for skill_id in order.tolist() if counts[skill_id] > 0}
+
+    def get_top_by_groups(self, groups: np.ndarray, count_groups: int, limit: int = 10,
+                          rows: Optional[np.ndarray] = None) -> List[Dict[str, int]]:
+        """
+        Выбирает самые частые навыки в каждой группе вакансий (например, по годам) за один подсчёт.
+
+        Args:
+            groups (np.ndarray): Номер группы каждой вакансии (от 0 до count_groups - 1)
+            count_groups (int): Количество групп
+            limit (int): Количество навыков в группе
+            rows (np.ndarray or None): Булева маска учитываемых вакансий (None - все)
+
+        Returns:
+            List[Dict[str, int]]: Самые частые навыки каждой группы.
+        """
+        codes = np.asarray(groups, dtype=np.int64)[self.entry_rows] * len(self.skills) + self.skill_ids
+        if rows is not None:
+            codes = codes[rows[self.entry_rows]]
+        counts = np.bincount(codes, minlength=count_groups * len(self.skills)).reshape(count_groups, len(self.skills))
+        return [self.get_top(group_counts, limit) for group_counts in counts]
@@ -0,0 +1,139 @@
+import sqlite3
+from typing import List, Optional
+import pandas as pd
+from name_index import NameIndex, default_mode
+
+rollup_tables = ['vacancy_rollup', 'vacancy_rollup_years', 'vacancy_rollup_areas']
+
+rollup_schema = ['''create table vacancy_rollup (
+                        name_id integer not null,
+                        year integer not null,
+                        area_id integer not null,
+                        salary_sum real,
+                        salary_count integer not null,
+                        row_count integer not null,
+                        primary key (name_id, year, area_id)) without rowid''',
+                 '''insert into vacancy_rollup
+                        select name_id, year, area_id, sum(salary), count(salary), count(*)
+                        from vacancies_data
+                        group by name_id, year, area_id''',
+                 '''create table vacancy_rollup_years as
+                        select year, sum(salary_sum) as salary_sum, sum(salary_count) as salary_count,
+                            sum(row_count) as row_count
+                        from vacancy_rollup
+                        group by year''',
+                 '''create table vacancy_rollup_areas as
+                        select area_id, sum(salary_sum) as salary_sum, sum(salary_count) as salary_count,
+                            sum(row_count) as row_count
+                        from vacancy_rollup
+                        group by area_id''']
+
+
+def get_name_index(connection: sqlite3.Connection) -> NameIndex:
+    """
+    Строит индекс по справочнику названий вакансий (коды в индексе на единицу меньше id в таблице names).
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+
+    Returns:
+        NameIndex: Индекс по названиям.
+    """
+    return NameIndex(name for name, in connection.execute('select name from names order by id'))
+
+
+def has_rollup(connection: sqlite3.Connection) -> bool:
+    """
+    Проверяет, что сводные таблицы построены (storage.load_vacancies удаляет их при перезагрузке вакансий).
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+
+    Returns:
+        bool: True, если все сводные таблицы есть.
+    """
+    tables = {name for name, in connection.execute("select name from sqlite_master where type = 'table'")}
+    return all(table in tables for table in rollup_tables)
+
+
+def build_rollup(connection: sqlite3.Connection) -> None:
+    """
+    Строит сводные таблицы: суммы зарплат и количества вакансий по (профессия, год, регион),
+    а также по годам и по регионам. Таблица вакансий читается один раз.
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+    """
+    with connection:
+        connection.execute('begin')
+        for table in rollup_tables:
+            connection.execute(f'drop table if exists {table}')
+        for statement in rollup_schema:
+            connection.execute(statement)
+
+
+def get_statistics(connection: sqlite3.Connection, vacancy: str, use_rollup: bool = False, mode: str = default_mode,
+                   name_index: Optional[NameIndex] = None) -> List[pd.DataFrame]:
+    """
+    Возвращает статистики для отчёта Task353. Суммы по годам и по регионам считаются двумя проходами
+    по покрывающим индексам (storage.vacancies_indexes) во временные таблицы, из которых берутся все статистики.
+    Название профессии ищется по индексу справочника names (так же, как в отчётах по csv-файлу),
+    а вакансии подходящих профессий читаются по индексу таблицы.
+    Со сводными таблицами (строятся при первом обращении) таблица вакансий не читается совсем.
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+        vacancy (str): Название профессии
+        use_rollup (bool): Использовать сводные таблицы
+        mode (str): Способ сравнения названий (см. name_index.matches)
+        name_index (NameIndex or None): Индекс по названиям (при отчётах по многим профессиям
+            его стоит построить один раз функцией get_name_index)
+
+    Returns:
+        List[pd.DataFrame]: Уровень зарплат и количество вакансий по годам, то же для профессии,
+            уровень зарплат и доля вакансий по городам (первые 10 значений).
+    """
+    name_index = name_index or get_name_index(connection)
+    with connection:
+        connection.execute('drop table if exists temp.matched_names')
+        connection.execute('create temp table matched_names (id integer primary key)')
+        connection.executemany('insert into temp.matched_names values (?)',
+                               ((code + 1,) for code in name_index.match(vacancy, mode).tolist()))
+    if use_rollup:
+        if not has_rollup(connection):
+            build_rollup(connection)
+        years, areas = 'vacancy_rollup_years', 'vacancy_rollup_areas'
+        vacancy_years = '''select year, sum(salary_sum) as salary_sum, sum(salary_count) as salary_count
+                           from vacancy_rollup
+                           where name_id in (select id from temp.matched_names)
+                           group by year'''
+    else:
+        years, areas = 'temp.vacancy_years', 'temp.vacancy_areas'
+        for table, field in [(years, 'year'), (areas, 'area_id')]:
+            connection.execute(f'drop table if exists {table}')
+            connection.execute(f'''create table {table} as
+                                      select {field}, sum(salary) as salary_sum, count(salary) as salary_count,
+                                          count(*) as row_count
+                                      from vacancies_data
+                                      group by {field}''')
+        vacancy_years = '''select year, sum(salary) as salary_sum, count(salary) as salary_count
+                           from vacancies_data
+                           where name_id in (select id from temp.matched_names)
+                           group by year'''
+    total = f'(select sum(row_count) from {areas})'
+    return [pd.read_sql(f'select year as date, round(salary_sum / salary_count) as avg_salary from {years} '
+                        f'order by year', connection),
+            pd.read_sql(f'select year as date, salary_count as count from {years} order by year', connection),
+            pd.read_sql(f'select year as date, round(salary_sum / salary_count) as avg_salary from ({vacancy_years}) '
+                        f'order by year', connection),
+            pd.read_sql(f'select year as date, salary_count as count from ({vacancy_years}) order by year',
+                        connection),
+            pd.read_sql(f'''select area_name, round(salary_sum / salary_count) as avg
+                            from {areas} join areas on areas.id = area_id
+                            where salary_count > {total} * 0.01
+                            order by avg desc
+                            limit 10''', connection),
+            pd.read_sql(f'''select area_name, round(cast(salary_count as real) / {total}, 4) as percent
+                            from {areas} join areas on areas.id = area_id
+                            order by salary_count desc
+                            limit 10''', connection)]
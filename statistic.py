@@ -1,187 +1,458 @@
-import csv, re, os
-from typing import List, Dict, Tuple, Any
-from openpyxl.styles import Font, Border, Side, Alignment
-from openpyxl.styles.numbers import FORMAT_PERCENTAGE_00
-from openpyxl.workbook import Workbook
-import matplotlib
-import matplotlib.pyplot as plt
+import csv, heapq, html, re, os
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Any, Iterable, Optional
 import numpy as np
-from xlsx2html import xlsx2html
 from jinja2 import Environment, FileSystemLoader
 import pdfkit
+from vacancy_table import VacancyTable, CategoricalColumn
+from name_index import default_mode, matches, check_mode
+from excel_writer import create_workbook, write_table, stream_table
+from charts import generate_chart
+
+
+def get_html_table(rows: List[List[Any]], percent_column: Optional[int] = None) -> str:
+    """
+    Формирует HTML-таблицу так же, как она выглядит в Excel-отчёте: первая строка - заголовок,
+    у ячеек рамка и выравнивание по центру, пустой столбец-разделитель без рамки.
+
+    Args:
+        rows (List[List[Any]]): Строки таблицы (первая - заголовок)
+        percent_column (int or None): Номер столбца, значения которого выводятся в процентах
+
+    Returns:
+        str: Код таблицы.
+
+    >>> get_html_table([['Город', 'Доля'], ['Москва', 0.1234]], percent_column=1)[-60:]
+    '<td style="border: 1px solid black">12.34%</td></tr></table>'
+    """
+    code = ['<table style="border-collapse: collapse; text-align: center">']
+    for i, row in enumerate(rows):
+        cells = []
+        for j, value in enumerate(row):
+            tag = 'th' if i == 0 else 'td'
+            style = '' if value == '  ' else ' style="border: 1px solid black"'
+            text = f'{value:.2%}' if i != 0 and j == percent_column else html.escape(str(value))
+            cells.append(f'<{tag}{style}>{text}</{tag}>')
+        code.append(f'<tr>{"".join(cells)}</tr>')
+    code.append('</table>')
+    return ''.join(code)
 
 
 class Report:
     """
-    Класс для формирования отчётов и графиков.
+    Класс для формирования отчётов и графиков. Метод generate формирует Excel-таблицу и графики одновременно
+    в отдельных потоках, а pdf - как только готовы графики (таблицы для pdf строятся прямо по статистикам).
+    Файлы записываются по путям, заданным при создании объекта, поэтому отчёты можно формировать одновременно.
+
+    Attributes:
+        excel_file (str): Путь к Excel-таблице
+        image_file (str): Путь к файлу с графиками
+        pdf_file (str): Путь к pdf-файлу
+        wkhtmltopdf (str): Путь к программе wkhtmltopdf
     """
 
-    def generate_excel(self, name_vac: str, statistic: List[Dict[str, str]]) -> None:
+    def __init__(self, directory: str = '.', excel_file: str = 'report.xlsx', image_file: str = 'graph.png',
+                 pdf_file: str = 'report.pdf',
+                 wkhtmltopdf: str = r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe') -> None:
+        """
+        Инициализирует объект Report.
+
+        Args:
+            directory (str): Папка для файлов отчёта
+            excel_file (str): Excel-таблица (путь относительно папки отчёта или абсолютный)
+            image_file (str): Файл с графиками
+            pdf_file (str): Pdf-файл
+            wkhtmltopdf (str): Путь к программе wkhtmltopdf
+        """
+        self.excel_file = os.path.join(directory, excel_file)
+        self.image_file = os.path.join(directory, image_file)
+        self.pdf_file = os.path.join(directory, pdf_file)
+        self.wkhtmltopdf = wkhtmltopdf
+
+    def generate(self, name_vac: str, statistic: List[Dict[str, str]], with_pdf: bool = True,
+                 vacancy_rows: Optional[Iterable[List[Any]]] = None) -> None:
+        """
+        Формирует все файлы отчёта. Excel-таблица и графики не зависят друг от друга и формируются в потоках,
+        pdf ждёт только графики.
+
+        Args:
+            name_vac (str): Название вакансии
+            statistic (List[Dict[str, str]]): Статистика по вакансиям
+            with_pdf (bool): Формировать pdf-файл
+            vacancy_rows (Iterable[List[Any]] or None): Заголовок и строки списка вакансий для Excel-таблицы
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            excel = executor.submit(self.generate_excel, name_vac, statistic, vacancy_rows)
+            image = executor.submit(self.generate_image, name_vac, statistic)
+            if with_pdf:
+                image.result()
+                self.generate_pdf(name_vac, statistic)
+            excel.result()
+            image.result()
+
+    @staticmethod
+    def get_year_rows(name_vac: str, statistic: List[Dict[str, str]]) -> List[List[Any]]:
+        """
+        Возвращает строки таблицы статистики по годам.
+
+        Args:
+            name_vac (str): Название вакансии
+            statistic (List[Dict[str, str]]): Статистика по вакансиям
+
+        Returns:
+            List[List[Any]]: Заголовок и строки таблицы.
+        """
+        return [['Год', 'Средняя зарплата', f'Средняя зарплата - {name_vac}',
+                 'Количество вакансий', f'Количество вакансий - {name_vac}']] + \
+               [[year, value, statistic[1][year], statistic[2][year], statistic[3][year]]
+                for year, value in statistic[0].items()]
+
+    @staticmethod
+    def get_city_rows(statistic: List[Dict[str, str]]) -> List[List[Any]]:
         """
-        Генерирует Excel-таблицу.
+        Возвращает строки таблицы статистики по городам.
+
+        Args:
+            statistic (List[Dict[str, str]]): Статистика по вакансиям
+
+        Returns:
+            List[List[Any]]: Заголовок и строки таблицы.
+        """
+        return [['Город', 'Уровень зарплат', '  ', 'Город', 'Доля вакансий']] + \
+               [[city1, value1, '  ', city2, value2]
+                for (city1, value1), (city2, value2) in zip(statistic[4].items(), statistic[5].items())]
+
+    def generate_excel(self, name_vac: str, statistic: List[Dict[str, str]],
+                       vacancy_rows: Optional[Iterable[List[Any]]] = None) -> None:
+        """
+        Генерирует Excel-таблицу в потоковом режиме (excel_writer). Если переданы строки вакансий,
+        они записываются на отдельный лист без хранения в памяти.
 
         Args:
             name_vac (str): Название вакансии
             statistic (List[Dict[str, str]]): Статистика по вакансиям
+            vacancy_rows (Iterable[List[Any]] or None): Заголовок и строки списка вакансий
+                (например, InputConnect.iter_rows)
         """
-        thins = Side(border_style="thin", color="000000")
-        wb = Workbook()
-        sheet1 = wb['Sheet']
-        sheet1.title = 'Статистика по годам'
-        wb.create_sheet('Статистика по городам')
-        columns1 = ['Год', 'Средняя зарплата', f'Средняя зарплата - {name_vac}',
-                    'Количество вакансий', f'Количество вакансий - {name_vac}']
-        for i, column in enumerate(columns1):
-            sheet1.cell(row=1, column=(i + 1), value=column).font = Font(bold=True)
-        for year, value in statistic[0].items():
-            sheet1.append([year, value, statistic[1][year], statistic[2][year], statistic[3][year]])
-        for column in sheet1.columns:
-            length = max(len(str(cell.value)) for cell in column)
-            sheet1.column_dimensions[column[0].column_letter].width = length + 1
-            for cell in column:
-                cell.border = Border(left=thins, top=thins, right=thins, bottom=thins)
-                cell.alignment = Alignment(horizontal='center')
-        sheet2 = wb['Статистика по городам']
-        columns2 = ['Город', 'Уровень зарплат', '  ', 'Город', 'Доля вакансий']
-        for i, column in enumerate(columns2):
-            sheet2.cell(row=1, column=(i + 1), value=column).font = Font(bold=True)
-        secondStat = list(statistic[4].items())
-        for i in range(10):
-            secondStat[i] += tuple(statistic[5].items())[i]
-        for city1, value1, city2, value2 in secondStat:
-            sheet2.append([city1, value1, '  ', city2, value2])
-        for i in range(2, 12):
-            sheet2[f'E{i}'].number_format = FORMAT_PERCENTAGE_00
-        for column in sheet2.columns:
-            length = max(len(str(cell.value)) for cell in column)
-            sheet2.column_dimensions[column[0].column_letter].width = length + 1
-            for cell in column:
-                cell.alignment = Alignment(horizontal='center')
-                if cell.value != '  ':
-                    cell.border = Border(left=thins, top=thins, right=thins, bottom=thins)
-        wb.save('report.xlsx')
+        wb = create_workbook()
+        write_table(wb, 'Статистика по годам', self.get_year_rows(name_vac, statistic))
+        write_table(wb, 'Статистика по городам', self.get_city_rows(statistic), percent_column=4)
+        if vacancy_rows is not None:
+            stream_table(wb, 'Вакансии', vacancy_rows)
+        wb.save(self.excel_file)
 
     def generate_image(self, name_vac: str, statistic: List[Dict[str, str]]) -> None:
         """
-        Генерирует файл png с графиками по вакансиям.
+        Генерирует файл png с графиками по вакансиям (charts: панели кэшируются по хэшу их данных,
+        поэтому общие для всех профессий графики по городам рисуются один раз).
 
         Args:
             name_vac (str): Название вакансии
             statistic (List[Dict[str, str]]): Статистика по вакансиям
         """
-        matplotlib.rc('font', size=8)
-        width = 0.4
-        fig, ((picture1, picture2), (picture3, picture4)) = plt.subplots(nrows=2, ncols=2)
-
-        years = statistic[0].keys()
-        x = np.arange(len(years))
-        picture1.set_title('Уровень зарплат по годам')
-        picture1.bar(x - width / 2, statistic[0].values(), width, label='средняя з/п')
-        picture1.bar(x + width / 2, statistic[1].values(), width, label=f'з/п {name_vac}')
-        picture1.legend(loc='upper left')
-        picture1.grid(axis='y')
-        picture1.set_xticks(x, years, rotation=90)
-
-        picture2.set_title('Количество вакансий по годам')
-        picture2.bar(x - width / 2, statistic[2].values(), width, label='Количество вакансий')
-        picture2.bar(x + width / 2, statistic[3].values(), width, label=f'Количество вакансий {name_vac}')
-        picture2.legend(loc='upper left')
-        picture2.grid(axis='y')
-        picture2.set_xticks(x, years, rotation=90)
-
-        cities = list(map(lambda city: city.replace(' ', '\n').replace('-', '-\n'), list(statistic[4].keys())))
-        y_pos = np.arange(len(cities))
-        picture3.set_title('Уровень зарплат по городам')
-        picture3.barh(y_pos, statistic[4].values(), align='center')
-        picture3.invert_yaxis()  # labels read top-to-bottom
-        picture3.grid(axis='x')
-        picture3.set_yticks(y_pos, labels=cities, fontsize=6)
-
-        name_labels = ['Другие'] + list(statistic[5].keys())
-        city_percent = [1 - sum(list(statistic[5].values()))] + list(statistic[5].values())
-        picture4.set_title('Доля вакансий по городам')
-        picture4.pie(city_percent, labels=name_labels, radius=1.25, textprops={'fontsize': 6})
-
-        fig.tight_layout()
-        plt.savefig('graph.png')
-
-    def generate_pdf(self, name_vac: str) -> None:
-        """
-        Генерирует файл pdf, где используются данные из прошлых методов.
+        generate_chart(self.image_file, name_vac, statistic)
+
+    def generate_pdf(self, name_vac: str, statistic: List[Dict[str, str]]) -> None:
+        """
+        Генерирует файл pdf с графиками (файл image_file должен быть уже сформирован) и таблицами статистик.
 
         Args:
             name_vac (str): Название вакансии
+            statistic (List[Dict[str, str]]): Статистика по вакансиям
         """
-        env = Environment(loader=FileSystemLoader('.'))
+        env = Environment(loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__))))
         template = env.get_template("pdf_template.html")
+        pdf_template = template.render({'name_vacancy': name_vac,
+                                        'table1': get_html_table(self.get_year_rows(name_vac, statistic)),
+                                        'table2': get_html_table(self.get_city_rows(statistic), percent_column=4),
+                                        'graph': os.path.abspath(self.image_file)})
+        config = pdfkit.configuration(wkhtmltopdf=self.wkhtmltopdf)
+        pdfkit.from_string(pdf_template, self.pdf_file, configuration=config, options={"enable-local-file-access": ""})
+
+
+class StatisticAccumulator:
+    """
+    Накапливает все статистики отчёта за один проход по вакансиям.
+    Поддерживает объединение с другим накопителем, поэтому подходит для порционной и параллельной обработки.
+
+    Attributes:
+        name_vacancy (str): Название профессии
+        mode (str): Способ сравнения названий (см. name_index.matches)
+        count (int): Количество обработанных вакансий
+        salary_by_years (Dict[int, List[float]]): Сумма и количество зарплат по годам
+        vac_salary_by_years (Dict[int, List[float]]): Сумма и количество зарплат по годам для выбранной профессии
+        salary_by_cities (Dict[str, List[float]]): Сумма и количество зарплат по городам
+    """
 
-        out1 = xlsx2html('report.xlsx', sheet='Статистика по годам')
-        out1.seek(0)
-        code1 = out1.read()
+    def __init__(self, name_vacancy: str = '', mode: str = default_mode) -> None:
+        """
+        Инициализирует объект StatisticAccumulator.
+
+        Args:
+            name_vacancy (str): Название профессии
+            mode (str): Способ сравнения названий
+        """
+        check_mode(mode)
+        self.name_vacancy = name_vacancy
+        self.mode = mode
+        self.count = 0
+        self.salary_by_years = {}
+        self.vac_salary_by_years = {}
+        self.salary_by_cities = {}
+
+    def update(self, vac: Any) -> None:
+        """
+        Учитывает одну вакансию во всех статистиках.
+
+        Args:
+            vac (Vacancy): Вакансия
+        """
+        year = vac.year
+        salary = vac.salary.salary_rub
+        self.count += 1
+        year_stat = self.salary_by_years.setdefault(year, [0, 0])
+        year_stat[0] += salary
+        year_stat[1] += 1
+        vac_year_stat = self.vac_salary_by_years.setdefault(year, [0, 0])
+        if matches(self.name_vacancy, vac.name, self.mode):
+            vac_year_stat[0] += salary
+            vac_year_stat[1] += 1
+        city_stat = self.salary_by_cities.setdefault(vac.area_name, [0, 0])
+        city_stat[0] += salary
+        city_stat[1] += 1
+
+    def update_all(self, list_vacancies: Iterable[Any]) -> 'StatisticAccumulator':
+        """
+        Учитывает все вакансии из списка (или потока).
 
-        out2 = xlsx2html('report.xlsx', sheet='Статистика по городам')
-        out2.seek(0)
-        code2 = out2.read()
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список вакансий
 
-        pdf_template = template.render({'name_vacancy': name_vac, 'table1': code1, 'table2': code2})
+        Returns:
+            StatisticAccumulator: Этот же накопитель.
+        """
+        for vac in list_vacancies:
+            self.update(vac)
+        return self
 
-        config = pdfkit.configuration(wkhtmltopdf=r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe')
-        pdfkit.from_string(pdf_template, 'report.pdf', configuration=config, options={"enable-local-file-access": ""})
+    def update_table(self, table: Any) -> 'StatisticAccumulator':
+        """
+        Учитывает все вакансии из колоночной таблицы, группируя их векторно (np.bincount по кодам).
 
+        Args:
+            table (VacancyTable): Таблица вакансий
 
-def get_salary_level(list_vacancies: List[Any], field: str, name_vacancy: str = '') -> Dict[str, str]:
+        Returns:
+            StatisticAccumulator: Этот же накопитель.
+        """
+        if len(table) == 0:
+            return self
+        years, year_codes = np.unique(table.year, return_inverse=True)
+        is_needed = table.get_name_index().mask(self.name_vacancy, self.mode)
+        city_codes = table.area_name.codes
+        for result, keys, codes, mask in [(self.salary_by_years, years.tolist(), year_codes, None),
+                                          (self.vac_salary_by_years, years.tolist(), year_codes, is_needed),
+                                          (self.salary_by_cities, table.area_name.categories, city_codes, None)]:
+            salaries = table.salary_rub if mask is None else np.where(mask, table.salary_rub, 0)
+            totals = np.bincount(codes, weights=salaries, minlength=len(keys))
+            counts = np.bincount(codes, weights=None if mask is None else mask, minlength=len(keys))
+            for key, total, count in zip(keys, totals.tolist(), counts.tolist()):
+                if count == 0 and mask is None:
+                    continue
+                stat = result.setdefault(key, [0, 0])
+                stat[0] += total
+                stat[1] += int(count)
+        self.count += len(table)
+        return self
+
+    def merge(self, other: 'StatisticAccumulator') -> 'StatisticAccumulator':
+        """
+        Добавляет к накопителю статистики другого накопителя.
+
+        Args:
+            other (StatisticAccumulator): Накопитель, посчитанный по другой части данных
+
+        Returns:
+            StatisticAccumulator: Этот же накопитель.
+        """
+        if (other.name_vacancy, other.mode) != (self.name_vacancy, self.mode):
+            raise ValueError('Нельзя объединить статистики по разным профессиям')
+        self.count += other.count
+        for result, addition in [(self.salary_by_years, other.salary_by_years),
+                                 (self.vac_salary_by_years, other.vac_salary_by_years),
+                                 (self.salary_by_cities, other.salary_by_cities)]:
+            for key, (total, count) in addition.items():
+                stat = result.setdefault(key, [0, 0])
+                stat[0] += total
+                stat[1] += count
+        return self
+
+    def get_statistics(self, slice: int = 10) -> List[Dict[Any, Any]]:
+        """
+        Возвращает статистики в том виде, в котором их принимает Report.
+
+        Args:
+            slice (int): Количество городов в статистиках по городам
+
+        Returns:
+            List[Dict[Any, Any]]: Уровень зарплат и количество вакансий по годам (всего и для профессии),
+            уровень зарплат и доля вакансий по городам, где опубликовано не меньше 1% вакансий.
+        """
+        years = sorted(self.salary_by_years.keys())
+        average = lambda stat: 0 if stat[1] == 0 else int(stat[0] // stat[1])
+        min_count = int(self.count * 0.01)
+        needed_cities = [(city, stat) for city, stat in self.salary_by_cities.items() if stat[1] >= min_count]
+        return [{year: average(self.salary_by_years[year]) for year in years},
+                {year: average(self.vac_salary_by_years[year]) for year in years},
+                {year: self.salary_by_years[year][1] for year in years},
+                {year: self.vac_salary_by_years[year][1] for year in years},
+                get_statistic([(city, average(stat)) for city, stat in needed_cities], 1, True, slice),
+                get_statistic([(city, round(stat[1] / self.count, 4)) for city, stat in needed_cities], 1, True,
+                              slice)]
+
+
+def get_salary_level(list_vacancies: Iterable[Any], field: str, name_vacancy: str = '',
+                     backend: str = 'python', mode: str = default_mode) -> Dict[str, str]:
     """
-    Формирует статистики, связанные с зарплатами
+    Формирует статистики, связанные с зарплатами. Вакансии обходятся один раз,
+    поэтому вместо списка можно передать итератор (например, DataSet в потоковом режиме).
 
     Args:
-        list_vacancies (List[Vacancy]): Список вакансий
+        list_vacancies (Iterable[Vacancy] or VacancyTable): Список вакансий
         field (str): Поле вакансии
         name_vacancy (str): Название вакансии (если его ввели)
+        backend (str): Способ вычисления: 'python' - цикл по вакансиям, 'numpy' - векторно по VacancyTable
+        mode (str): Способ сравнения названий (см. name_index.matches)
 
     Returns:
         Dict[str, str]: Статистика связанная с зарплатой
     """
+    if backend == 'numpy':
+        table = get_table(list_vacancies)
+        keys, codes, counts_all = get_group_codes(getattr(table, field))
+        is_needed = table.get_name_index().mask(name_vacancy, mode)
+        totals = np.bincount(codes, weights=np.where(is_needed, table.salary_rub, 0), minlength=len(keys))
+        counts = np.bincount(codes, weights=is_needed, minlength=len(keys))
+        return {key: 0 if count == 0 else int(total // count)
+                for key, total, count, count_all in zip(keys, totals.tolist(), counts.tolist(), counts_all)
+                if count_all != 0}
+    check_backend(backend)
     result = {}
     for vac in list_vacancies:
-        result[vac.__getattribute__(field)] = [] if vac.__getattribute__(field) not in result.keys() else result[
-            vac.__getattribute__(field)]
-    list_vacancies = list_vacancies if name_vacancy == '' else list(
-        filter(lambda vac: name_vacancy in vac.name, list_vacancies))
-    for vac in list_vacancies:
-        result[vac.__getattribute__(field)].append(
-            vac.salary.to_RUB(float(vac.salary.salary_from) + float(vac.salary.salary_to)) / 2)
-    for key in result.keys():
-        result[key] = 0 if len(result[key]) == 0 else int(sum(result[key]) // len(result[key]))
+        salaries = result.setdefault(getattr(vac, field), [0, 0])
+        if matches(name_vacancy, vac.name, mode):
+            salaries[0] += vac.salary.salary_rub
+            salaries[1] += 1
+    for key, (total, count) in result.items():
+        result[key] = 0 if count == 0 else int(total // count)
     return result
 
 
-def get_count_vacancies(list_vacancies: List[Any], field: str, data: Any, name_vacancy: str = '') -> Dict[str, str]:
+def get_count_vacancies(list_vacancies: Iterable[Any], field: str, data: Any, name_vacancy: str = '',
+                        backend: str = 'python', mode: str = default_mode) -> Dict[str, str]:
     """
-    Формирует статистики, связанные с количеством вакансий
+    Формирует статистики, связанные с количеством вакансий. Вакансии обходятся один раз,
+    поэтому вместо списка можно передать итератор (например, DataSet в потоковом режиме).
 
     Args:
-        list_vacancies (List[Vacancy]): Список вакансий
+        list_vacancies (Iterable[Vacancy] or VacancyTable): Список вакансий
         field (str): Поле вакансии
         data(DataSet): Данные из файла
         name_vacancy (str): Название вакансии (если его ввели)
+        backend (str): Способ вычисления: 'python' - цикл по вакансиям, 'numpy' - векторно по VacancyTable
+        mode (str): Способ сравнения названий (см. name_index.matches)
 
     Returns:
         Dict[str, str]: Статистика, связанная с количеством вакансий
     """
-    result = {}
-    for vac in list_vacancies:
-        result[vac.__getattribute__(field)] = 0 if vac.__getattribute__(field) not in result.keys() else result[
-            vac.__getattribute__(field)]
-    list_vacancies = list_vacancies if name_vacancy == '' else list(
-        filter(lambda vac: name_vacancy in vac.name, list_vacancies))
-    for vac in list_vacancies:
-        result[vac.__getattribute__(field)] += 1
+    if backend == 'numpy':
+        table = get_table(list_vacancies)
+        keys, codes, counts_all = get_group_codes(getattr(table, field))
+        counts = np.bincount(codes, weights=table.get_name_index().mask(name_vacancy, mode), minlength=len(keys))
+        result = {key: int(count) for key, count, count_all in zip(keys, counts.tolist(), counts_all) if count_all != 0}
+    else:
+        check_backend(backend)
+        result = {}
+        for vac in list_vacancies:
+            key = getattr(vac, field)
+            result[key] = result.get(key, 0) + matches(name_vacancy, vac.name, mode)
     if field == 'area_name':
+        count_vacancies = len(data.vacancies_objects)
         for key in result.keys():
-            result[key] = round(result[key] / len(data.vacancies_objects), 4)
+            result[key] = round(result[key] / count_vacancies, 4)
     return result
 
 
+def get_top_skills(list_vacancies: Iterable[Any], name_vacancy: str = '', limit: int = 10,
+                   mode: str = default_mode) -> Dict[int, Dict[str, int]]:
+    """
+    Формирует статистику самых востребованных навыков по годам (для всех вакансий или для профессии).
+    Навыки считаются по индексу навыков таблицы одним np.bincount по парам (год, навык).
+
+    Args:
+        list_vacancies (Iterable[Vacancy] or VacancyTable): Список вакансий
+        name_vacancy (str): Название вакансии (пустая строка - все вакансии)
+        limit (int): Количество навыков за год
+        mode (str): Способ сравнения названий (см. name_index.matches)
+
+    Returns:
+        Dict[int, Dict[str, int]]: Самые частые навыки и количество вакансий с ними по годам.
+    """
+    table = get_table(list_vacancies)
+    years, codes = np.unique(table.year, return_inverse=True)
+    rows = table.get_name_index().mask(name_vacancy, mode) if name_vacancy != '' else None
+    tops = table.get_skill_index().get_top_by_groups(codes.reshape(-1), len(years), limit, rows)
+    return dict(zip(years.tolist(), tops))
+
+
+def check_backend(backend: str) -> None:
+    """
+    Проверяет название способа вычисления статистик.
+
+    Args:
+        backend (str): Способ вычисления
+    """
+    if backend not in ['python', 'numpy']:
+        raise ValueError(f'Неизвестный способ вычисления статистик: {backend}')
+
+
+def get_table(list_vacancies: Iterable[Any]) -> VacancyTable:
+    """
+    Возвращает колоночное представление вакансий (если передана не таблица, она формируется за один проход).
+
+    Args:
+        list_vacancies (Iterable[Vacancy] or VacancyTable): Список вакансий
+
+    Returns:
+        VacancyTable: Таблица вакансий.
+    """
+    return list_vacancies if isinstance(list_vacancies, VacancyTable) else VacancyTable.from_vacancies(list_vacancies)
+
+
+def get_group_codes(column: Any) -> Tuple[List[Any], np.ndarray, List[int]]:
+    """
+    Разбивает столбец таблицы на группы. Группы идут в порядке первого появления значения,
+    как и ключи словарей, которые формирует цикл по вакансиям.
+
+    Args:
+        column (CategoricalColumn or np.ndarray or List[str]): Столбец таблицы
+
+    Returns:
+        Tuple[List[Any], np.ndarray, List[int]]: Значения групп, номер группы для каждой строки
+        и количество строк в каждой группе.
+    """
+    if isinstance(column, CategoricalColumn):
+        return column.categories, column.codes, np.bincount(column.codes, minlength=len(column.categories)).tolist()
+    values = column if isinstance(column, np.ndarray) else np.array(column, dtype=object)
+    keys, first_index, codes = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first_index)
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    codes = rank[codes.reshape(-1)]
+    return keys[order].tolist(), codes, np.bincount(codes, minlength=len(keys)).tolist()
+
+
 def print_statistic(result_list, index, message, is_reversed=False, slice=0):
     """
     Приводит статистику к нужному виду (чтобы года шли по порядку) и печатает её
@@ -195,8 +466,7 @@ def print_statistic(result_list, index, message, is_reversed=False, slice=0):
     Returns:
         Dict[Any, Any]: Преобразованный словарь со статистикой
     """
-    slice = len(result_list) if slice == 0 else slice
-    statistic = dict(sorted(result_list, key=lambda x: x[index], reverse=is_reversed)[:slice])
+    statistic = dict(get_top(result_list, index, is_reversed, slice))
     print(message + str(statistic))
     return statistic
 
@@ -214,5 +484,28 @@ def get_statistic(result_list: Dict[Any, Any], index: int, is_reversed: bool = F
     Returns:
         Dict[Any, Any]: Преобразованный словарь со статистикой
     """
-    slice = len(result_list) if slice == 0 else slice
-    return dict(sorted(result_list, key=lambda x: x[index], reverse=is_reversed)[:slice])
+    return dict(get_top(result_list, index, is_reversed, slice))
+
+
+def get_top(result_list: Iterable[Tuple[Any, Any]], index: int, is_reversed: bool = False,
+            slice: int = 0) -> List[Tuple[Any, Any]]:
+    """
+    Возвращает первые slice элементов в порядке сортировки. Если срез задан, вместо полной сортировки
+    используется куча (heapq) - O(n log k). Порядок равных элементов такой же, как у sorted.
+
+    Args:
+        result_list (Iterable[Tuple[Any, Any]]): Пары (ключ, значение)
+        index (int): Индекс
+        is_reversed (bool): Отвечает за обратную сортировку
+        slice (int): Срез для статистики (0 - все элементы)
+
+    Returns:
+        List[Tuple[Any, Any]]: Отсортированные элементы.
+
+    >>> get_top({'a': 1, 'b': 3, 'c': 3, 'd': 2}.items(), 1, True, 2)
+    [('b', 3), ('c', 3)]
+    """
+    if slice == 0:
+        return sorted(result_list, key=itemgetter(index), reverse=is_reversed)
+    select = heapq.nlargest if is_reversed else heapq.nsmallest
+    return select(slice, result_list, key=itemgetter(index))
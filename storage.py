@@ -0,0 +1,125 @@
+import sqlite3
+from typing import List
+import numpy as np
+import pandas as pd
+from currency_converter import converted_currencies, get_month_keys
+
+pragmas = ['pragma journal_mode = wal',
+           'pragma synchronous = normal',
+           'pragma temp_store = memory',
+           'pragma cache_size = -65536',
+           'pragma mmap_size = 268435456']
+
+vacancies_schema = ['drop table if exists vacancy_rollup',
+                    'drop table if exists vacancy_rollup_years',
+                    'drop table if exists vacancy_rollup_areas',
+                    'drop table if exists vacancies_data',
+                    'drop table if exists names',
+                    'drop table if exists areas',
+                    'create table names (id integer primary key, name text not null unique)',
+                    'create table areas (id integer primary key, area_name text not null unique)',
+                    '''create table vacancies_data (
+                           id integer primary key,
+                           name_id integer not null references names (id),
+                           salary real,
+                           area_id integer not null references areas (id),
+                           published_at text not null,
+                           year integer not null,
+                           month integer not null)''',
+                    '''create view vacancies as
+                           select vacancies_data.id, names.name, salary, areas.area_name, published_at, year, month
+                           from vacancies_data
+                           join names on names.id = vacancies_data.name_id
+                           join areas on areas.id = vacancies_data.area_id''']
+
+vacancies_indexes = ['create index vacancies_year on vacancies_data (year, salary)',
+                     'create index vacancies_area on vacancies_data (area_id, salary)',
+                     'create index vacancies_name on vacancies_data (name_id, year, salary)',
+                     'analyze']
+
+
+def connect(file_name: str = 'project_vacancy.db') -> sqlite3.Connection:
+    """
+    Открывает базу данных с вакансиями и настраивает её для массовой загрузки и аналитических запросов
+    (журнал WAL, кэш страниц 64 МБ, отображение файла в память).
+
+    Args:
+        file_name (str): Название файла базы данных
+
+    Returns:
+        sqlite3.Connection: Соединение с базой данных.
+    """
+    connection = sqlite3.connect(file_name)
+    for pragma in pragmas:
+        connection.execute(pragma)
+    return connection
+
+
+def load_currencies(connection: sqlite3.Connection, df_currencies: pd.DataFrame,
+                    currencies: List[str] = converted_currencies) -> None:
+    """
+    Пересоздаёт таблицу курсов валют и загружает в неё курсы одной транзакцией.
+    Валюты, которых нет в файле курсов, сохраняются как NULL.
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+        df_currencies (pd.DataFrame): Курсы валют (столбец date в формате 'dd/mm/yyyy' и столбцы валют)
+        currencies (List[str]): Валюты
+    """
+    dates = df_currencies['date'].astype(str)
+    columns = ', '.join(f'{currency} real' for currency in currencies)
+    rows = zip(dates.tolist(), dates.str[6:10].astype(int).tolist(), dates.str[3:5].astype(int).tolist(),
+               *[df_currencies[currency].astype(object).where(df_currencies[currency].notna(), None).tolist()
+                 if currency in df_currencies.columns else [None] * len(dates) for currency in currencies])
+    with connection:
+        connection.execute('begin')
+        connection.execute('drop table if exists currencies')
+        connection.execute(f'create table currencies (date text primary key, year integer not null, '
+                           f'month integer not null, {columns})')
+        connection.executemany(f'insert into currencies values ({", ".join("?" * (len(currencies) + 3))})', rows)
+
+
+def read_currencies(connection: sqlite3.Connection, currencies: List[str] = converted_currencies) -> pd.DataFrame:
+    """
+    Возвращает курсы валют в формате data_currencies.csv.
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+        currencies (List[str]): Валюты
+
+    Returns:
+        pd.DataFrame: Столбец date и столбцы валют.
+    """
+    return pd.read_sql(f'select date, {", ".join(currencies)} from currencies order by year, month', connection)
+
+
+def load_vacancies(connection: sqlite3.Connection, df: pd.DataFrame) -> None:
+    """
+    Пересоздаёт таблицы вакансий и загружает вакансии одной транзакцией. Названия вакансий и регионов
+    хранятся в справочниках (names, areas), а в строке вакансии - только их коды. Индексы по году, региону
+    и профессии включают зарплату, чтобы запросы статистики читали только индекс, и создаются после вставки строк.
+    Представление vacancies возвращает вакансии с названиями, как прежняя таблица. Сводные таблицы
+    sql_analytics удаляются (они строятся заново при следующем обращении). NaN в зарплате SQLite сохраняет как NULL.
+
+    Args:
+        connection (sqlite3.Connection): Соединение с базой данных
+        df (pd.DataFrame): Вакансии со столбцами name, salary, area_name и published_at
+    """
+    name_codes, names = pd.factorize(df['name'])
+    area_codes, areas = pd.factorize(df['area_name'])
+    months = get_month_keys(df['published_at'])
+    rows = zip((name_codes + 1).tolist(), df['salary'].tolist(), (area_codes + 1).tolist(),
+               np.asarray(df['published_at'], dtype='U10').tolist(), (months // 100).tolist(), (months % 100).tolist())
+    kind = connection.execute("select type from sqlite_master where name = 'vacancies'").fetchone()
+    with connection:
+        connection.execute('begin')
+        if kind is not None:
+            connection.execute(f'drop {kind[0]} vacancies')
+        for statement in vacancies_schema:
+            connection.execute(statement)
+        connection.executemany('insert into names values (?, ?)', enumerate(names.tolist(), 1))
+        connection.executemany('insert into areas values (?, ?)', enumerate(areas.tolist(), 1))
+        connection.executemany('insert into vacancies_data (name_id, salary, area_id, published_at, year, month) '
+                               'values (?, ?, ?, ?, ?, ?)', rows)
+        for statement in vacancies_indexes:
+            connection.execute(statement)
@@ -1,9 +1,16 @@
-import csv, re, os
+import csv, heapq, re, os
+from calendar import timegm
 from datetime import datetime
-from typing import List, Dict, Tuple, Any
+from functools import lru_cache
+from operator import itemgetter
+from itertools import chain, islice
+from typing import List, Dict, Tuple, Any, Iterable, Iterator, Optional
+import numpy as np
 from prettytable import PrettyTable, ALL
 from cProfile import Profile
 from pstats import Stats
+from excel_writer import create_workbook, stream_table
+from vacancy_table import VacancyTable, CategoricalColumn
 
 prof = Profile()
 prof.disable()
@@ -70,12 +77,428 @@ rang_experience_id = {"noExperience": 0,
                       "moreThan6": 3}
 
 
+def format_salary(salary: Any) -> str:
+    """
+    Форматирует зарплату к нужному формату.
+
+    Args:
+        salary (Salary): Информация о зарплате.
+
+    Returns:
+        str: Отформатированная информация о зарплате.
+    """
+    salary_from = int(salary.salary_from)
+    salary_to = int(salary.salary_to)
+    if salary_from >= 1000:
+        salary_from = f'{salary_from // 1000} {str(salary_from)[-3:]}'
+    if salary_to >= 1000:
+        salary_to = f'{salary_to // 1000} {str(salary_to)[-3:]}'
+    info_gross = 'Без вычета налогов' if translation[salary.salary_gross] == 'Да' else 'С вычетом налогов'
+    return f'{salary_from} - {salary_to} ({translation[salary.salary_currency]}) ({info_gross})'
+
+
+field_formatters = {"Название": lambda vac: vac.name,
+                    "Описание": lambda vac: vac.description,
+                    "Навыки": lambda vac: '\n'.join(vac.key_skills),
+                    "Опыт работы": lambda vac: translation[vac.experience_id],
+                    "Премиум-вакансия": lambda vac: translation[vac.premium],
+                    "Компания": lambda vac: vac.employer_name,
+                    "Оклад": lambda vac: format_salary(vac.salary),
+                    "Название региона": lambda vac: vac.area_name,
+                    "Дата публикации вакансии": lambda vac: f'{vac.day:02}.{vac.month:02}.{vac.year}'}
+
+
+sort_keys = {"Навыки": lambda vac: len(vac.key_skills),
+             "Оклад": lambda vac: vac.salary.salary_rub,
+             "Дата публикации вакансии": lambda vac: vac.published_ts,
+             "Опыт работы": lambda vac: rang_experience_id[vac.experience_id],
+             "Идентификатор валюты оклада": lambda vac: vac.salary.salary_currency}
+
+
+def get_sort_key(param: str):
+    """
+    Возвращает функцию, вычисляющую ключ сортировки вакансии по параметру.
+
+    Args:
+        param (str): Параметр сортировки.
+
+    Returns:
+        Callable[[Vacancy], Any]: Ключ сортировки.
+    """
+    if param in sort_keys:
+        return sort_keys[param]
+    field = reverse_translation[param]
+    return lambda vac: getattr(vac, field)
+
+
+def reverse_order(order: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """
+    Переворачивает устойчивую перестановку сортировки по возрастанию за O(n): группы равных ключей
+    идут в обратном порядке, а внутри группы сохраняется исходный порядок (как при sort(reverse=True)).
+
+    Args:
+        order (np.ndarray): Перестановка сортировки по возрастанию
+        key (np.ndarray): Ключи сортировки
+
+    Returns:
+        np.ndarray: Перестановка сортировки по убыванию.
+
+    >>> reverse_order(np.array([1, 3, 0, 2]), np.array([2, 1, 2, 1])).tolist()
+    [0, 2, 1, 3]
+    """
+    if len(order) == 0:
+        return order
+    sorted_key = key[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_key[1:] != sorted_key[:-1]]))
+    lengths = np.diff(np.append(starts, len(order)))[::-1]
+    shifts = starts[::-1] - np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return order[np.arange(len(order)) + np.repeat(shifts, lengths)]
+
+
+class SortIndex:
+    """
+    Вакансии с заранее вычисленными ключами сортировки. Ключ каждого параметра вычисляется один раз
+    и хранится массивом (строковые поля - номерами в отсортированном словаре значений), сортировка - argsort,
+    полученные перестановки кэшируются: повторная сортировка по тому же полю бесплатна, обратный порядок - O(n).
+
+    Для фильтрации по тем же вакансиям строится колоночное представление (VacancyTable).
+    Предназначен для многих запросов к одним и тем же вакансиям в одном процессе (InputConnect принимает его
+    вместо списка вакансий). Консольный режим 'Вакансии' выполняет один запрос, поэтому обходится без него:
+    построение ключей и столбцов для всего файла дороже одной сортировки отфильтрованных вакансий.
+
+    Attributes:
+        vacancies (List[Vacancy]): Вакансии
+        keys (Dict[str, np.ndarray]): Ключи сортировки по параметрам
+        orders (Dict[Tuple[str, bool], np.ndarray]): Перестановки по (параметр, обратный порядок)
+        table (VacancyTable or None): Столбцы вакансий (строятся при первой фильтрации)
+    """
+
+    def __init__(self, vacancies: Iterable[Any]):
+        """
+        Инициализирует объект SortIndex.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии (собираются в список)
+        """
+        self.vacancies = list(vacancies)
+        self.keys = {}
+        self.orders = {}
+        self.table = None
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Возвращает итератор по вакансиям в исходном порядке.
+
+        Returns:
+            Iterator[Vacancy]: Итератор по вакансиям.
+        """
+        return iter(self.vacancies)
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий.
+
+        Returns:
+            int: Количество вакансий.
+        """
+        return len(self.vacancies)
+
+    def get_key(self, param: str) -> np.ndarray:
+        """
+        Возвращает массив ключей сортировки по параметру (вычисляется при первом обращении).
+
+        Args:
+            param (str): Параметр сортировки.
+
+        Returns:
+            np.ndarray: Ключи сортировки вакансий.
+        """
+        if param not in self.keys:
+            values = list(map(get_sort_key(param), self.vacancies))
+            if all(isinstance(value, (int, float)) for value in values):
+                self.keys[param] = np.array(values)
+            else:
+                ranks = {value: rank for rank, value in enumerate(sorted(set(values)))}
+                self.keys[param] = np.fromiter(map(ranks.__getitem__, values), dtype=np.int64, count=len(values))
+        return self.keys[param]
+
+    def get_order(self, param: str, is_reverse: bool = False) -> np.ndarray:
+        """
+        Возвращает перестановку вакансий, упорядочивающую их по параметру (с кэшированием).
+        Порядок вакансий с равными ключами такой же, как при list.sort.
+
+        Args:
+            param (str): Параметр сортировки.
+            is_reverse (bool): Параметр обратной сортировки.
+
+        Returns:
+            np.ndarray: Номера вакансий в порядке сортировки.
+        """
+        if (param, is_reverse) not in self.orders:
+            key = self.get_key(param)
+            if is_reverse:
+                self.orders[(param, True)] = reverse_order(self.get_order(param), key)
+            else:
+                self.orders[(param, False)] = np.argsort(key, kind='stable')
+        return self.orders[(param, is_reverse)]
+
+    def get_table(self) -> VacancyTable:
+        """
+        Возвращает столбцы вакансий (строятся при первом обращении, строки идут в порядке вакансий).
+
+        Returns:
+            VacancyTable: Колоночное представление вакансий.
+        """
+        if self.table is None:
+            self.table = VacancyTable.from_vacancies(self.vacancies)
+        return self.table
+
+    def select(self, plan: Optional['FilterPlan'] = None, param: Optional[str] = None,
+               is_reverse: bool = False) -> Iterator[Any]:
+        """
+        Лениво возвращает вакансии, прошедшие фильтр, в порядке сортировки. Фильтр вычисляется масками
+        по столбцам, а отсортированный порядок берётся из кэша перестановок и только прореживается.
+
+        Args:
+            plan (FilterPlan or None): Фильтр (None - все вакансии).
+            param (str or None): Параметр сортировки (None - исходный порядок).
+            is_reverse (bool): Параметр обратной сортировки.
+
+        Returns:
+            Iterator[Vacancy]: Итератор по вакансиям.
+        """
+        order = None if param is None else self.get_order(param, is_reverse)
+        if plan is not None:
+            rows = plan.rows(self.get_table())
+            if order is None:
+                order = rows
+            else:
+                keep = np.zeros(len(self.vacancies), dtype=bool)
+                keep[rows] = True
+                order = order[keep[order]]
+        if order is None:
+            return iter(self.vacancies)
+        return map(self.vacancies.__getitem__, order.tolist())
+
+    def iter_sorted(self, param: str, is_reverse: bool = False) -> Iterator[Any]:
+        """
+        Лениво возвращает вакансии в порядке сортировки.
+
+        Args:
+            param (str): Параметр сортировки.
+            is_reverse (bool): Параметр обратной сортировки.
+
+        Returns:
+            Iterator[Vacancy]: Итератор по отсортированным вакансиям.
+        """
+        return map(self.vacancies.__getitem__, self.get_order(param, is_reverse).tolist())
+
+
+filter_separator = '; '
+filter_sample_size = 1024
+filter_costs = {"Оклад": 2, "Навыки": 20, "Дата публикации вакансии": 1}
+filter_fields = {"Опыт работы": "experience_id",
+                 "Премиум-вакансия": "premium",
+                 "Идентификатор валюты оклада": "salary_currency"}
+
+
+def parse_filters(filter_param: str) -> List[List[str]]:
+    """
+    Разбирает строку фильтра: условия вида 'Параметр: значение', разделённые '; ' (все должны выполняться).
+
+    Args:
+        filter_param (str): Строка фильтра.
+
+    Returns:
+        List[List[str]]: Пары (параметр, значение).
+
+    >>> parse_filters('Оклад: 100000; Название региона: Москва')
+    [['Оклад', '100000'], ['Название региона', 'Москва']]
+    """
+    return [] if filter_param == '' else [part.split(': ', 1) for part in filter_param.split(filter_separator)]
+
+
+def column_mask(column: Any, predicate, rows: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет условие для значений столбца в заданных строках. Для CategoricalColumn условие вычисляется
+    один раз для каждого уникального значения.
+
+    Args:
+        column (CategoricalColumn or List[Any]): Столбец
+        predicate (Callable[[Any], bool]): Условие для значения
+        rows (np.ndarray): Номера строк
+
+    Returns:
+        np.ndarray: Булева маска для строк rows.
+    """
+    if isinstance(column, CategoricalColumn):
+        lookup = np.fromiter(map(predicate, column.categories), dtype=bool, count=len(column.categories))
+        return lookup[np.asarray(column.codes)[rows]]
+    return np.fromiter((predicate(column[row]) for row in rows.tolist()), dtype=bool, count=len(rows))
+
+
+class FilterPredicate:
+    """
+    Одно условие фильтра. Значение разбирается один раз при создании, проверка вакансии сводится к сравнению.
+
+    Attributes:
+        parameter (str): Параметр фильтрации
+        field (str or None): Столбец VacancyTable, по которому проверяется условие
+        value (Any): Разобранное значение
+        cost (int): Относительная стоимость проверки одной вакансии
+        mask_cost (int): Относительная стоимость проверки одной строки таблицы
+    """
+
+    def __init__(self, parameter: str, value: str):
+        """
+        Инициализирует объект FilterPredicate.
+
+        Args:
+            parameter (str): Параметр фильтрации
+            value (str): Значение из строки фильтра
+        """
+        self.parameter = parameter
+        self.field = filter_fields.get(parameter, reverse_translation.get(parameter))
+        if parameter == 'Оклад':
+            self.value = int(value)
+        elif parameter == 'Навыки':
+            self.value = value.split(', ')
+        elif parameter in ['Опыт работы', 'Премиум-вакансия', 'Идентификатор валюты оклада']:
+            self.value = {raw for raw, text in translation.items() if text == value}
+        elif parameter == 'Дата публикации вакансии':
+            self.value = parse_date(value)
+        else:
+            self.value = value
+        self.cost = filter_costs.get(parameter, 1 if self.field in VacancyTable.categorical_fields else 10)
+        self.mask_cost = 1 if parameter == 'Навыки' else self.cost
+
+    def check(self, vac: Any) -> bool:
+        """
+        Проверяет условие для вакансии.
+
+        Args:
+            vac (Vacancy): Вакансия.
+
+        Returns:
+            bool: Выполнено ли условие.
+        """
+        if self.parameter == 'Оклад':
+            return vac.salary.salary_from <= self.value <= vac.salary.salary_to
+        if self.parameter == 'Навыки':
+            return all(item in vac.key_skills for item in self.value)
+        if self.parameter == 'Опыт работы':
+            return vac.experience_id in self.value
+        if self.parameter == 'Премиум-вакансия':
+            return vac.premium in self.value
+        if self.parameter == 'Идентификатор валюты оклада':
+            return vac.salary.salary_currency in self.value
+        if self.parameter == 'Дата публикации вакансии':
+            return (vac.year, vac.month, vac.day) == self.value
+        return getattr(vac, self.field) == self.value
+
+    def mask(self, table: VacancyTable, rows: np.ndarray) -> np.ndarray:
+        """
+        Проверяет условие для строк таблицы по её столбцам.
+
+        Args:
+            table (VacancyTable): Столбцы вакансий
+            rows (np.ndarray): Номера проверяемых строк
+
+        Returns:
+            np.ndarray: Булева маска для строк rows.
+        """
+        if self.parameter == 'Оклад':
+            return (table.salary_from[rows] <= self.value) & (table.salary_to[rows] >= self.value)
+        if self.parameter == 'Навыки':
+            return np.isin(rows, table.get_skill_index().rows(self.value), assume_unique=True)
+        if self.parameter == 'Дата публикации вакансии':
+            if self.value is None:
+                return np.zeros(len(rows), dtype=bool)
+            year, month, day = self.value
+            return (table.year[rows] == year) & (table.month[rows] == month) & (table.day[rows] == day)
+        if self.parameter in filter_fields:
+            return column_mask(getattr(table, self.field), self.value.__contains__, rows)
+        return column_mask(getattr(table, self.field), self.value.__eq__, rows)
+
+
+class FilterPlan:
+    """
+    Фильтр из нескольких условий, которые должны выполняться одновременно. Для потока вакансий условия
+    проверяются по возрастанию стоимости до первого невыполненного. Для таблицы условия вычисляются
+    масками по столбцам, начиная с самых избирательных (доля прошедших строк оценивается по выборке),
+    и каждое следующее - только по строкам, прошедшим предыдущие.
+
+    Attributes:
+        predicates (List[FilterPredicate]): Условия фильтра
+    """
+
+    def __init__(self, filters: List[List[str]]):
+        """
+        Инициализирует объект FilterPlan.
+
+        Args:
+            filters (List[List[str]]): Пары (параметр, значение) (см. parse_filters)
+        """
+        self.predicates = sorted((FilterPredicate(parameter, value) for parameter, value in filters),
+                                 key=lambda predicate: predicate.cost)
+
+    def match(self, vac: Any) -> bool:
+        """
+        Проверяет, проходит ли вакансия фильтр.
+
+        Args:
+            vac (Vacancy): Вакансия.
+
+        Returns:
+            bool: Выполнены ли все условия.
+        """
+        return all(predicate.check(vac) for predicate in self.predicates)
+
+    def get_order(self, table: VacancyTable) -> List[FilterPredicate]:
+        """
+        Упорядочивает условия по ожидаемой стоимости отбрасывания строки: стоимость проверки,
+        делённая на долю строк выборки, которые условие отбрасывает.
+
+        Args:
+            table (VacancyTable): Столбцы вакансий
+
+        Returns:
+            List[FilterPredicate]: Условия в порядке вычисления.
+        """
+        sample = np.arange(0, len(table), max(1, len(table) // filter_sample_size))
+        if len(self.predicates) < 2 or len(sample) == 0:
+            return self.predicates
+        ranks = []
+        for predicate in self.predicates:
+            rejected = 1 - predicate.mask(table, sample).mean()
+            ranks.append(np.inf if rejected == 0 else predicate.mask_cost / rejected)
+        return [predicate for _, predicate in sorted(zip(ranks, self.predicates), key=itemgetter(0))]
+
+    def rows(self, table: VacancyTable) -> np.ndarray:
+        """
+        Возвращает номера строк таблицы, прошедших фильтр (по возрастанию).
+
+        Args:
+            table (VacancyTable): Столбцы вакансий
+
+        Returns:
+            np.ndarray: Номера строк.
+        """
+        rows = np.arange(len(table))
+        for predicate in self.get_order(table):
+            rows = rows[predicate.mask(table, rows)]
+            if len(rows) == 0:
+                break
+        return rows
+
+
 class InputConnect:
     """
     Формирование таблицы PrettyTable с удобным отображением информации о вакансии.
 
     Attributes:
-        filter_param (str or List[str]): Параметр фильтрации
+        filter_param (str or List[List[str]]): Параметр фильтрации (после проверки - список условий,
+            заданных через '; ')
         sort_param (str): Параметр сортировки
         reversed_sort (str or bool): Параметр обратной сортировки
         interval (List[int]): Промежуток выводимых колонок
@@ -103,10 +526,10 @@ class InputConnect:
         """
         Проверка параметров на корректность ввода.
         """
-        if ': ' not in self.filter_param and self.filter_param != '':
+        self.filter_param = parse_filters(self.filter_param)
+        if any(len(parameter) != 2 for parameter in self.filter_param):
             exit_from_file('Формат ввода некорректен')
-        self.filter_param = self.filter_param.split(': ')
-        if len(self.filter_param) == 2 and self.filter_param[0] not in list(translation.values()):
+        if any(parameter[0] not in list(translation.values()) for parameter in self.filter_param):
             exit_from_file('Параметр поиска некорректен')
         if self.sort_param != '' and self.sort_param not in list(translation.values()):
             exit_from_file('Параметр сортировки некорректен')
@@ -117,140 +540,168 @@ class InputConnect:
             self.columns = self.columns.split(', ')
             self.columns.insert(0, '№')
 
-    def formatter(self, vacancy: Any) -> List[Any]:
+    def formatter(self, vacancy: Any, columns: Optional[List[str]] = None) -> List[Any]:
         """
-        Осуществляет форматирование необходимых полей.
+        Осуществляет форматирование необходимых полей (форматируются только запрошенные колонки).
 
         Args:
             vacancy (Vacancy): Вакансия.
+            columns (List[str] or None): Колонки (по умолчанию - все колонки таблицы, кроме номера).
 
         Returns:
             List[Any]: Список отформатированных полей.
         """
+        return [field_formatters[column](vacancy) for column in columns or list(field_formatters)]
 
-        def change_salary(salary: Any) -> str:
-            """
-            Форматирует зарплату к нужному формату.
-
-            Args:
-                salary (Salary): Информация о зарплате.
-
-            Returns:
-                str: Отформатированная информация о зарплате.
-            """
-            salary_from = int(float(salary.salary_from))
-            salary_to = int(float(salary.salary_to))
-            if salary_from >= 1000:
-                salary_from = f'{salary_from // 1000} {str(salary_from)[-3:]}'
-            if salary_to >= 1000:
-                salary_to = f'{salary_to // 1000} {str(salary_to)[-3:]}'
-            info_gross = 'Без вычета налогов' if translation[salary.salary_gross] == 'Да' else 'С вычетом налогов'
-            result_salary = f'{salary_from} - {salary_to} ({translation[salary.salary_currency]}) ({info_gross})'
-            return result_salary
+    def get_columns(self) -> List[str]:
+        """
+        Возвращает выводимые колонки (без номера) в порядке колонок таблицы.
 
-        return [vacancy.name, vacancy.description, '\n'.join(vacancy.key_skills), translation[vacancy.experience_id],
-                translation[vacancy.premium], vacancy.employer_name, change_salary(vacancy.salary), vacancy.area_name,
-                change_date(vacancy.published_at)]
+        Returns:
+            List[str]: Колонки.
+        """
+        return [column for column in field_formatters if len(self.columns) < 2 or column in self.columns]
 
-    def data_filter(self, list_vacancies: List[Any], parameter: List[str]) -> List[Any]:
+    def data_filter(self, list_vacancies: Iterable[Any], parameter: List[str]) -> List[Any]:
         """
         Фильтрует список вакансий по введённым параметрам.
 
         Args:
-            list_vacancies (List[Vacancy]): Список вакансий.
+            list_vacancies (Iterable[Vacancy]): Список вакансий.
             parameter (List[str]): Параметры фильтрации.
 
         Returns:
             List[Vacancy]: Список отфильтрованных вакансий.
         """
-        if parameter[0] == 'Навыки':
-            parameter[1] = parameter[1].split(', ')
-        if parameter[0] == 'Оклад':
-            list_vacancies = list(
-                filter(lambda vac: int(vac.salary.salary_from) <= int(parameter[1]) <= int(vac.salary.salary_to),
-                       list_vacancies))
-        elif parameter[0] == 'Навыки':
-            list_vacancies = list(
-                filter(lambda vac: all(item in vac.key_skills for item in parameter[1]), list_vacancies))
-        elif parameter[0] == 'Опыт работы' or parameter[0] == 'Премиум-вакансия':
-            list_vacancies = list(
-                filter(lambda vac: parameter[1] == translation[vac.__getattribute__(reverse_translation[parameter[0]])],
-                       list_vacancies))
-        elif parameter[0] == 'Идентификатор валюты оклада':
-            list_vacancies = list(
-                filter(lambda vac: parameter[1] == translation[vac.salary.salary_currency], list_vacancies))
-        elif parameter[0] == 'Дата публикации вакансии':
-            list_vacancies = list(filter(lambda vac: parameter[1] == change_date(vac.published_at), list_vacancies))
-        else:
-            list_vacancies = list(
-                filter(lambda vac: parameter[1] == vac.__getattribute__(reverse_translation[parameter[0]]),
-                       list_vacancies))
-        return list_vacancies
+        return list(self.iter_filter(list_vacancies, parameter))
+
+    def iter_filter(self, list_vacancies: Iterable[Any], parameter: List[str]) -> Iterator[Any]:
+        """
+        Лениво фильтрует вакансии по введённым параметрам, не создавая промежуточных списков.
+        Значение параметра разбирается один раз (FilterPredicate), а не для каждой вакансии.
+
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список (или поток) вакансий.
+            parameter (List[str]): Параметры фильтрации.
+
+        Returns:
+            Iterator[Vacancy]: Итератор по отфильтрованным вакансиям.
+        """
+        return filter(FilterPlan([parameter]).match, list_vacancies)
 
-    def data_sort(self, list_vacancies: List[Any], param: str, is_reverse: bool) -> List[Any]:
+    def data_sort(self, list_vacancies: Iterable[Any], param: str, is_reverse: bool,
+                  limit: Optional[int] = None) -> List[Any]:
         """
-        Сортирует список вакансий по введённым параметрам.
+        Сортирует список вакансий по введённым параметрам. Если нужны только первые limit вакансий,
+        они выбираются кучей (heapq) за O(n log limit) без сортировки и без сбора всех вакансий в список.
+        Порядок вакансий с равными ключами такой же, как при полной сортировке.
 
         Args:
-            list_vacancies (List[Vacancy]): Список вакансий.
+            list_vacancies (Iterable[Vacancy]): Список (или поток, если задан limit) вакансий.
             param (str): Параметр сортировки.
             is_reverse (bool): Параметр обратной сортировки.
+            limit (int or None): Количество первых вакансий, которые нужно вернуть (None - все).
 
         Returns:
             List[Vacancy]: Список отсортированных вакансий.
         """
-        if param == 'Навыки':
-            list_vacancies.sort(key=lambda vac: len(vac.key_skills), reverse=is_reverse)
-        elif param == 'Оклад':
-            list_vacancies.sort(
-                key=lambda vac: vac.salary.to_RUB(float(vac.salary.salary_from) + float(vac.salary.salary_to)) / 2,
-                reverse=is_reverse)
-        elif param == 'Дата публикации вакансии':
-            # parse(vac.published_at).strftime('%Y-%m-%dT%H:%M:%S%z')
-            list_vacancies.sort(key=lambda vac: (datetime.datetime.strptime(vac.published_at, '%Y-%m-%dT%H:%M:%S%z')),
-                                reverse=is_reverse)
-        elif param == 'Опыт работы':
-            list_vacancies.sort(key=lambda vac: rang_experience_id[vac.experience_id], reverse=is_reverse)
-        else:
-            list_vacancies.sort(key=lambda vac: vac.__getattribute__(reverse_translation[param]), reverse=is_reverse)
+        key = get_sort_key(param)
+        if limit is not None:
+            return (heapq.nlargest if is_reverse else heapq.nsmallest)(limit, list_vacancies, key=key)
+        list_vacancies.sort(key=key, reverse=is_reverse)
         return list_vacancies
 
-    def print_vacancies(self, list_vacancies: List[Any]) -> None:
+    def get_vacancies(self, list_vacancies: Iterable[Any], limit: Optional[int] = None) -> Iterable[Any]:
         """
-        Выводит информацию о вакансии в таблицу PrettyTable
+        Применяет к вакансиям фильтрацию и сортировку. Без сортировки вакансии не собираются в список,
+        а если известно, сколько первых вакансий нужно, при сортировке хранятся только они.
+        Вакансии SortIndex не сортируются: фильтр вычисляется масками по столбцам, а порядок берётся
+        из кэшированной перестановки.
 
         Args:
-            list_vacancies (List[Vacancy]): Список вакансий.
-        """
-        self.interval.append(len(list_vacancies) + 1)
-        list_vacancies = list_vacancies if len(self.filter_param) != 2 else self.data_filter(list_vacancies,
-                                                                                             self.filter_param)
-        list_vacancies = list_vacancies if len(list_vacancies) != 0 else 'Ничего не найдено'
-        if type(list_vacancies) is str:
-            print(list_vacancies)
+            list_vacancies (Iterable[Vacancy] or SortIndex): Список (или поток) вакансий.
+            limit (int or None): Количество нужных первых вакансий (None - все).
+
+        Returns:
+            Iterable[Vacancy]: Отфильтрованные и отсортированные вакансии.
+        """
+        plan = FilterPlan(self.filter_param) if len(self.filter_param) != 0 else None
+        if isinstance(list_vacancies, SortIndex):
+            return list_vacancies.select(plan, self.sort_param or None, self.reversed_sort)
+        list_vacancies = list_vacancies if plan is None else filter(plan.match, list_vacancies)
+        if len(self.sort_param) != 0:
+            list_vacancies = self.data_sort(list_vacancies if limit is not None else list(list_vacancies),
+                                            self.sort_param, self.reversed_sort, limit)
+        return list_vacancies
+
+    def iter_rows(self, list_vacancies: Iterable[Any]) -> Iterator[List[Any]]:
+        """
+        Лениво формирует строки таблицы со всеми отфильтрованными вакансиями (текст полей не обрезается).
+        Если заданы выводимые колонки, остаются только они.
+
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список (или поток) вакансий.
+
+        Returns:
+            Iterator[List[Any]]: Заголовок, затем строки вакансий.
+        """
+        columns = self.get_columns()
+        yield ['№'] + columns
+        for i, vacancy in enumerate(self.get_vacancies(list_vacancies)):
+            yield [i + 1] + self.formatter(vacancy, columns)
+
+    def export_excel(self, list_vacancies: Iterable[Any], file_name: str = 'vacancies.xlsx') -> int:
+        """
+        Записывает все отфильтрованные вакансии в Excel-таблицу в потоковом режиме: без сортировки
+        память не зависит от количества вакансий.
+
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список (или поток) вакансий.
+            file_name (str): Название файла
+
+        Returns:
+            int: Количество записанных вакансий.
+        """
+        wb = create_workbook()
+        count = stream_table(wb, 'Вакансии', self.iter_rows(list_vacancies))
+        wb.save(file_name)
+        return count
+
+    def print_vacancies(self, list_vacancies: Iterable[Any], page_size: int = 0) -> None:
+        """
+        Выводит информацию о вакансии в таблицу PrettyTable. Диапазон вывода и колонки применяются до форматирования:
+        форматируются только выводимые поля выводимых вакансий. Без сортировки вакансии обрабатываются потоково.
+        Если задан размер страницы, таблица выводится по страницам, и в памяти хранится только текущая страница.
+        Границы диапазона работают как в срезе списка; для отрицательных границ вакансии собираются в список.
+
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список (или поток) вакансий.
+            page_size (int): Количество вакансий на странице (0 - одна таблица).
+        """
+        start = self.interval[0] - 1 if len(self.interval) >= 1 else 0
+        end = self.interval[1] - 1 if len(self.interval) >= 2 else None
+        list_vacancies = iter(self.get_vacancies(list_vacancies, end if end is not None and end > 0 else None))
+        first = next(list_vacancies, None)
+        if first is None:
+            print('Ничего не найдено')
             return
-        list_vacancies = list_vacancies if len(self.sort_param) == 0 else self.data_sort(list_vacancies,
-                                                                                         self.sort_param,
-                                                                                         self.reversed_sort)
-        table_header = list(reverse_translation.keys())[:-1]
-        table_header.insert(0, '№')
-        vacans_table = PrettyTable(table_header)
-        vacans_table.hrules = ALL
-        for i in range(len(list_vacancies)):
-            vac = self.formatter(list_vacancies[i])
-            vac = list(map(lambda i: f'{i[:100]}...' if len(i) > 100 else i, vac))
-            vac.insert(0, i + 1)
-            vacans_table.add_row(vac)
-        vacans_table.align = 'l'
-        vacans_table.max_width = 20
-        if len(self.interval) > 1 and len(self.columns) >= 2:
-            vacans_table = vacans_table.get_string(start=self.interval[0] - 1, end=self.interval[1] - 1,
-                                                   fields=self.columns)
-        elif len(self.interval) > 1:
-            vacans_table = vacans_table.get_string(start=self.interval[0] - 1, end=self.interval[1] - 1)
-        elif len(self.columns) >= 2:
-            vacans_table = vacans_table.get_string(fields=self.columns)
-        print(vacans_table)
+        columns = self.get_columns()
+        numbered = enumerate(chain([first], list_vacancies))
+        if start >= 0 and (end is None or end >= 0):
+            numbered = islice(numbered, start, end)
+        else:
+            numbered = list(numbered)[start:end]
+        rows = ([i + 1] + [f'{value[:100]}...' if len(value) > 100 else value
+                           for value in self.formatter(vacancy, columns)]
+                for i, vacancy in numbered)
+        pages = iter(lambda: list(islice(rows, page_size)), []) if page_size > 0 else [list(rows)]
+        for page in pages:
+            vacans_table = PrettyTable(['№'] + columns)
+            vacans_table.hrules = ALL
+            vacans_table.add_rows(page)
+            vacans_table.align = 'l'
+            vacans_table.max_width = 20
+            print(vacans_table)
 
 
 def change_date(date_vac: str) -> str:
@@ -267,6 +718,47 @@ def change_date(date_vac: str) -> str:
     return '.'.join(reversed(date))
 
 
+@lru_cache(maxsize=131072)
+def parse_published_at(date_vac: str) -> Tuple[int, int, int, int]:
+    """
+    Разбирает дату публикации в формате '%Y-%m-%dT%H:%M:%S%z' без strptime.
+    Результаты кэшируются: в выгрузках много одинаковых дат.
+
+    Args:
+        date_vac (str): Дата публикации.
+
+    Returns:
+        Tuple[int, int, int, int]: Время публикации в секундах от начала эпохи (UTC), год, месяц и день.
+
+    >>> parse_published_at('2022-07-06T02:05:26+0300')
+    (1657062326, 2022, 7, 6)
+    """
+    year, month, day = int(date_vac[:4]), int(date_vac[5:7]), int(date_vac[8:10])
+    time_zone = date_vac[19:].replace(':', '')
+    offset = int(time_zone[1:3]) * 3600 + int(time_zone[3:5]) * 60
+    timestamp = timegm((year, month, day, int(date_vac[11:13]), int(date_vac[14:16]), int(date_vac[17:19])))
+    return timestamp + offset if time_zone[0] == '-' else timestamp - offset, year, month, day
+
+
+def parse_date(date: str) -> Tuple[int, int, int]:
+    """
+    Разбирает дату в формате 'дд.мм.гггг', в котором даты публикации выводятся в таблице.
+
+    Args:
+        date (str): Дата.
+
+    Returns:
+        Tuple[int, int, int]: Год, месяц и день (None, если дата задана некорректно).
+
+    >>> parse_date('06.07.2022')
+    (2022, 7, 6)
+    """
+    date = date.split('.')
+    if len(date) != 3 or not all(part.isdigit() for part in date):
+        return None
+    return int(date[2]), int(date[1]), int(date[0])
+
+
 def exit_from_file(message: str):
     """
     Метод для выхода из программы.
@@ -0,0 +1,284 @@
+from array import array
+from typing import List, Dict, Any, Iterable, Iterator, Callable
+import numpy as np
+from name_index import NameIndex
+from skill_index import SkillIndex
+
+
+class CategoricalColumn:
+    """
+    Столбец с повторяющимися значениями: вместо строки по каждой вакансии хранится код значения.
+
+    Attributes:
+        codes (np.ndarray): Коды значений по строкам
+        categories (List[str]): Уникальные значения столбца (индекс значения - его код)
+    """
+
+    def __init__(self, codes: np.ndarray, categories: List[str]) -> None:
+        """
+        Инициализирует объект CategoricalColumn.
+
+        Args:
+            codes (np.ndarray): Коды значений по строкам
+            categories (List[str]): Уникальные значения столбца
+        """
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество строк столбца.
+
+        Returns:
+            int: Количество строк.
+        """
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Возвращает значение столбца в строке.
+
+        Args:
+            index (int): Номер строки
+
+        Returns:
+            str: Значение столбца.
+        """
+        return self.categories[self.codes[index]]
+
+    def mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """
+        Вычисляет условие один раз для каждого уникального значения и распространяет его на все строки.
+
+        Args:
+            predicate (Callable[[str], bool]): Условие для значения столбца
+
+        Returns:
+            np.ndarray: Булева маска строк, для которых условие выполнено.
+        """
+        lookup = np.fromiter((predicate(category) for category in self.categories), dtype=bool,
+                             count=len(self.categories))
+        return lookup[self.codes]
+
+
+class StringColumn:
+    """
+    Строковый столбец, хранящийся в одном буфере байтов (например, отображённом в память файле кэша).
+    Строка декодируется только при обращении к ней.
+
+    Attributes:
+        blob (np.ndarray): Строки в кодировке UTF-8, каждая завершается нулевым байтом
+        offsets (np.ndarray): Смещения начала каждой строки в буфере (последний элемент - длина буфера)
+        split_lines (bool): Возвращать строку в виде списка строк (для ключевых навыков)
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray, split_lines: bool = False) -> None:
+        """
+        Инициализирует объект StringColumn.
+
+        Args:
+            blob (np.ndarray): Строки в кодировке UTF-8, каждая завершается нулевым байтом
+            offsets (np.ndarray): Смещения начала каждой строки в буфере
+            split_lines (bool): Возвращать строку в виде списка строк
+        """
+        self.blob = blob
+        self.offsets = offsets
+        self.split_lines = split_lines
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество строк столбца.
+
+        Returns:
+            int: Количество строк.
+        """
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Декодирует значение столбца в строке.
+
+        Args:
+            index (int): Номер строки
+
+        Returns:
+            str or List[str]: Значение столбца.
+        """
+        value = self.blob[self.offsets[index]:self.offsets[index + 1] - 1].tobytes().decode('utf-8')
+        return value.split('\n') if self.split_lines else value
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Возвращает итератор по значениям столбца.
+
+        Returns:
+            Iterator[str or List[str]]: Итератор по значениям.
+        """
+        return (self[i] for i in range(len(self)))
+
+    def to_list(self) -> List[Any]:
+        """
+        Декодирует весь столбец за один вызов.
+
+        Returns:
+            List[str or List[str]]: Значения столбца.
+        """
+        values = self.blob.tobytes().decode('utf-8').split('\x00')[:-1]
+        return [value.split('\n') for value in values] if self.split_lines else values
+
+
+class VacancyTable:
+    """
+    Колоночное представление списка вакансий: числовые поля хранятся в массивах NumPy,
+    повторяющиеся строковые поля - в виде кодов (CategoricalColumn).
+    У таблицы, загруженной из кэша (dataset_cache), строковые столбцы хранятся в StringColumn.
+
+    Attributes:
+        name (CategoricalColumn): Название вакансии
+        description (List[str]): Описание вакансии
+        key_skills (List[List[str]]): Ключевые навыки для вакансии
+        experience_id (CategoricalColumn): Требуемый опыт для вакансии
+        premium (CategoricalColumn): Атрибут, отвечающий за премиальность вакансии
+        employer_name (CategoricalColumn): Название компании, где есть вакансия
+        salary_from (np.ndarray): Нижняя граница зарплаты
+        salary_to (np.ndarray): Верхняя граница зарплаты
+        salary_gross (CategoricalColumn): Наличие налогов
+        salary_currency (CategoricalColumn): Валюта оклада
+        salary_rub (np.ndarray): Средняя зарплата в рублях
+        area_name (CategoricalColumn): Название города
+        published_at (List[str]): Дата публикации вакансии
+        published_ts (np.ndarray): Время публикации в секундах от начала эпохи
+        year (np.ndarray): Год публикации вакансии
+        month (np.ndarray): Месяц публикации вакансии
+        day (np.ndarray): День публикации вакансии
+    """
+    categorical_fields = ['name', 'experience_id', 'premium', 'employer_name', 'salary_gross', 'salary_currency',
+                          'area_name']
+    list_fields = ['description', 'key_skills', 'published_at']
+    numeric_fields = ['salary_from', 'salary_to', 'salary_rub', 'published_ts', 'year', 'month', 'day']
+
+    def __init__(self, columns: Dict[str, Any]) -> None:
+        """
+        Инициализирует объект VacancyTable.
+
+        Args:
+            columns (Dict[str, Any]): Столбцы таблицы. Ключи - названия полей вакансии.
+        """
+        self.name_index = None
+        self.skill_index = None
+        for field, column in columns.items():
+            setattr(self, field, column)
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в таблице.
+
+        Returns:
+            int: Количество вакансий.
+        """
+        return len(self.salary_rub)
+
+    def get_name_index(self) -> NameIndex:
+        """
+        Возвращает индекс по названиям вакансий (строится при первом обращении и переиспользуется
+        для всех запросов по этой таблице).
+
+        Returns:
+            NameIndex: Индекс по названиям.
+        """
+        if self.name_index is None:
+            self.name_index = NameIndex(self.name.categories, np.asarray(self.name.codes))
+        return self.name_index
+
+    def get_skill_index(self) -> SkillIndex:
+        """
+        Возвращает индекс по ключевым навыкам (строится при первом обращении).
+
+        Returns:
+            SkillIndex: Индекс по навыкам.
+        """
+        if self.skill_index is None:
+            key_skills = self.key_skills
+            self.skill_index = SkillIndex(key_skills.to_list() if isinstance(key_skills, StringColumn) else key_skills)
+        return self.skill_index
+
+    def get_columns(self) -> Dict[str, Any]:
+        """
+        Возвращает все столбцы таблицы.
+
+        Returns:
+            Dict[str, Any]: Столбцы таблицы. Ключи - названия полей вакансии.
+        """
+        return {field: getattr(self, field) for field in self.categorical_fields + self.list_fields + self.numeric_fields}
+
+    @classmethod
+    def from_vacancies(cls, list_vacancies: Iterable[Any]) -> 'VacancyTable':
+        """
+        Формирует таблицу по списку (или потоку) вакансий за один проход.
+
+        Args:
+            list_vacancies (Iterable[Vacancy]): Список вакансий
+
+        Returns:
+            VacancyTable: Колоночное представление вакансий.
+        """
+        categories = {field: {} for field in cls.categorical_fields}
+        codes = {field: array('i') for field in cls.categorical_fields}
+        lists = {field: [] for field in cls.list_fields}
+        salary_from, salary_to, salary_rub = array('d'), array('d'), array('d')
+        published_ts, year, month, day = array('q'), array('h'), array('b'), array('b')
+        for vac in list_vacancies:
+            for field, value in [('name', vac.name), ('experience_id', vac.experience_id), ('premium', vac.premium),
+                                 ('employer_name', vac.employer_name), ('salary_gross', vac.salary.salary_gross),
+                                 ('salary_currency', vac.salary.salary_currency), ('area_name', vac.area_name)]:
+                codes[field].append(categories[field].setdefault(value, len(categories[field])))
+            for field, value in [('description', vac.description), ('key_skills', vac.key_skills),
+                                 ('published_at', vac.published_at)]:
+                lists[field].append(value)
+            salary_from.append(vac.salary.salary_from)
+            salary_to.append(vac.salary.salary_to)
+            salary_rub.append(np.nan if vac.salary.salary_rub is None else vac.salary.salary_rub)
+            published_ts.append(vac.published_ts)
+            year.append(vac.year)
+            month.append(vac.month)
+            day.append(vac.day)
+        columns = {field: CategoricalColumn(np.frombuffer(codes[field], dtype=np.int32), list(categories[field]))
+                   for field in cls.categorical_fields}
+        columns.update(lists)
+        columns.update({'salary_from': np.frombuffer(salary_from, dtype=np.float64),
+                        'salary_to': np.frombuffer(salary_to, dtype=np.float64),
+                        'salary_rub': np.frombuffer(salary_rub, dtype=np.float64),
+                        'published_ts': np.frombuffer(published_ts, dtype=np.int64),
+                        'year': np.frombuffer(year, dtype=np.int16),
+                        'month': np.frombuffer(month, dtype=np.int8),
+                        'day': np.frombuffer(day, dtype=np.int8)})
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables: List['VacancyTable']) -> 'VacancyTable':
+        """
+        Объединяет таблицы в одну, сохраняя порядок строк. Коды категорий пересчитываются так,
+        чтобы значения шли в порядке первого появления, как у таблицы, сформированной за один проход.
+
+        Args:
+            tables (List[VacancyTable]): Таблицы в порядке следования строк
+
+        Returns:
+            VacancyTable: Объединённая таблица.
+        """
+        if len(tables) == 0:
+            return cls.from_vacancies([])
+        columns = {}
+        for field in cls.categorical_fields:
+            categories, codes = {}, []
+            for table in tables:
+                column = getattr(table, field)
+                lookup = np.array([categories.setdefault(category, len(categories))
+                                   for category in column.categories], dtype=np.int32)
+                codes.append(lookup[column.codes] if len(lookup) != 0 else np.asarray(column.codes))
+            columns[field] = CategoricalColumn(np.concatenate(codes).astype(np.int32), list(categories))
+        for field in cls.list_fields:
+            columns[field] = [value for table in tables for value in getattr(table, field)]
+        for field in cls.numeric_fields:
+            columns[field] = np.concatenate([getattr(table, field) for table in tables])
+        return cls(columns)